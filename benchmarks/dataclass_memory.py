@@ -0,0 +1,75 @@
+"""
+Per-instance memory of the domain dataclasses: slotted vs ``__dict__``.
+
+The domain dataclasses are declared ``@dataclass(slots=True)``.  For each
+one this builds an otherwise identical twin without slots, constructs the
+same records with both (through the trusted path, as the stores do) and
+reports the bytes allocated per instance, measured with ``tracemalloc``.
+
+    python -m benchmarks.dataclass_memory --count 100000
+"""
+import argparse
+import gc
+import tracemalloc
+from dataclasses import MISSING, dataclass, field, fields
+from uuid import uuid4
+
+from pii.common.abstracts.base_dataclass import BaseDataclass
+from pii.domain.base.dataclasses import Organization, PartyRole, Person, PersonRole
+from pii.domain.base.history import PersonName
+from pii.domain.enums import PersonNameType
+
+
+def _sample(cls) -> dict:
+    pk = str(uuid4())
+    return {
+        Person: lambda: {"id": pk, "name": "Ada Lovelace", "version": 1},
+        Organization: lambda: {"id": pk, "name": "Acme", "legal_name": "Acme Ltd", "version": 1},
+        PartyRole: lambda: {"id": pk, "type": "party_role", "party_id": str(uuid4())},
+        PersonRole: lambda: {"id": pk, "type": "person_role", "party_id": str(uuid4())},
+        PersonName: lambda: {"name": "Ada", "name_type": PersonNameType.FIRST, "person_id": pk},
+    }[cls]()
+
+
+def unslotted(cls):
+    """A ``__dict__``-backed copy of dataclass ``cls`` with the same fields."""
+    namespace = {"__annotations__": {}, "__module__": cls.__module__, "__qualname__": cls.__qualname__}
+    for f in fields(cls):
+        namespace["__annotations__"][f.name] = f.type
+        if f.default is not MISSING:
+            namespace[f.name] = f.default
+        elif f.default_factory is not MISSING:
+            namespace[f.name] = field(default_factory=f.default_factory)
+    return dataclass(eq=False)(type(cls.__name__, (BaseDataclass,), namespace))
+
+
+def bytes_per_instance(cls, rows: list[dict]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances = [cls.from_trusted(**row) for row in rows]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Exclude the list holding them.
+    return (after - before - instances.__sizeof__()) / len(instances)
+
+
+def run(count: int) -> None:
+    print(f"{count} instances per class; bytes per instance including owned lists")
+    print(f"{'class':<14}{'__dict__':>10}{'slots':>10}{'saved':>9}")
+    for cls in (Person, Organization, PartyRole, PersonRole, PersonName):
+        rows = [_sample(cls) for _ in range(count)]
+        plain = bytes_per_instance(unslotted(cls), rows)
+        slotted = bytes_per_instance(cls, rows)
+        print(f"{cls.__name__:<14}{plain:>10.0f}{slotted:>10.0f}{1 - slotted / plain:>9.0%}")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args(argv)
+    run(args.count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+JSON throughput per backend of ``pii.common.utils.json_codec``, plus the
+previous path (stdlib ``json`` with a Python ``default=`` hook).
+
+Encodes and decodes Person records in the shape ``DataclassTransformer``
+produces: UUID ids, a datetime, an Enum-typed name history.
+
+    python -m benchmarks.json_codec --records 20000
+"""
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime
+
+from pii.common.utils import json_codec
+from pii.domain.enums import PersonNameType
+
+
+def previous_dumps(obj) -> str:
+    def default(o):
+        if isinstance(o, (uuid.UUID, datetime)):
+            return str(o)
+        if isinstance(o, PersonNameType):
+            return o.value
+        raise TypeError(f"{type(o).__name__} is not JSON serializable")
+    return json.dumps(obj, default=default)
+
+
+def _record(n: int) -> dict:
+    pid = uuid.uuid4()
+    return {
+        "id": pid,
+        "type": "person",
+        "name": f"Person {n}",
+        "notes": None,
+        "version": 1,
+        "date_created": datetime.now(),
+        "staff_organizations": [],
+        "_names_history": [
+            {"name": f"n{n}", "name_type": kind, "person_id": pid}
+            for kind in (PersonNameType.FIRST, PersonNameType.LAST)
+        ],
+    }
+
+
+def _rate(fn, items) -> float:
+    started = time.perf_counter()
+    for item in items:
+        fn(item)
+    return len(items) / (time.perf_counter() - started)
+
+
+def run(records: int) -> None:
+    data = [_record(n) for n in range(records)]
+    configured = json_codec.codec_name()
+    print(f"{records} Person records, records/s")
+    print(f"{'backend':<22}{'dumps':>12}{'loads':>12}")
+    texts = [previous_dumps(d) for d in data]
+    print(f"{'json + default hook':<22}{_rate(previous_dumps, data):>12,.0f}{_rate(json.loads, texts):>12,.0f}")
+    for name in json_codec.available_codecs():
+        json_codec.set_codec(name)
+        texts = [json_codec.dumps(d) for d in data]
+        print(f"{name:<22}{_rate(json_codec.dumps, data):>12,.0f}{_rate(json_codec.loads, texts):>12,.0f}")
+    json_codec.set_codec(configured)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=20_000)
+    args = parser.parse_args(argv)
+    run(args.records)
+
+
+if __name__ == "__main__":
+    main()
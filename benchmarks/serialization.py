@@ -0,0 +1,104 @@
+"""
+Dataclass ⇄ dict throughput: generated per-class codecs vs the previous
+introspecting path (``dataclasses.asdict`` out, ``fields``/``get_origin``
+per value in).
+
+Each record is an Organization with staff Persons, and each Person has a
+name history.  Records are round-tripped through ``to_dict``/``from_dict``
+and through the reference implementation.  Both sides build the same
+objects and validate them the same way.
+
+    python -m benchmarks.serialization --records 2000 --staff 5
+"""
+import argparse
+import dataclasses
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Union, get_args, get_origin
+
+from pii.common.abstracts.relationship_list import RelationshipList
+from pii.domain.base.dataclasses import Organization, Person
+from pii.domain.base.history import PersonName
+from pii.domain.enums import PersonNameType
+
+_COERCIONS = {
+    (uuid.UUID, str): uuid.UUID,
+    (datetime, str): datetime.fromisoformat,
+    (float, (int, str)): float,
+    (int, str): int,
+}
+
+
+def previous_build(cls, data: dict):
+    kwargs = {}
+    for f in dataclasses.fields(cls):
+        if f.name in data:
+            kwargs[f.name] = previous_coerce(f.type, data[f.name])
+    return cls(**kwargs)
+
+
+def previous_coerce(ftype, value: Any) -> Any:
+    origin, args = get_origin(ftype), get_args(ftype)
+    if origin is RelationshipList:
+        return [previous_coerce(args[0], v) for v in value]
+    if origin is Union and type(None) in args:
+        non_none = next(a for a in args if a is not type(None))
+        return None if value is None else previous_coerce(non_none, value)
+    if origin is list and args:
+        return [previous_coerce(args[0], v) for v in value]
+    if origin is dict and len(args) == 2:
+        return {previous_coerce(args[0], k): previous_coerce(args[1], v) for k, v in value.items()}
+    if dataclasses.is_dataclass(ftype):
+        if isinstance(value, ftype):
+            return value
+        if isinstance(value, dict):
+            return previous_build(ftype, value)
+    for (target, src_types), fn in _COERCIONS.items():
+        if ftype is target and isinstance(value, src_types):
+            return fn(value)
+    return value
+
+
+def _record(staff: int) -> Organization:
+    org = Organization(id=str(uuid.uuid4()), name="Acme", legal_name="Acme Ltd", version=1)
+    for n in range(staff):
+        person = Person(id=str(uuid.uuid4()), name=f"Person {n}", version=1)
+        for name_type in (PersonNameType.FIRST, PersonNameType.LAST):
+            person._names_history.append(PersonName(name=f"n{n}", name_type=name_type, person_id=person.id))
+        org.staff_members.append(person)
+    return org
+
+
+def _rate(fn, items: list) -> float:
+    started = time.perf_counter()
+    for item in items:
+        fn(item)
+    return len(items) / (time.perf_counter() - started)
+
+
+def run(records: int, staff: int) -> None:
+    orgs = [_record(staff) for _ in range(records)]
+    dicts = [org.to_dict() for org in orgs]
+    assert dicts == [dataclasses.asdict(org) for org in orgs]
+
+    print(f"{records} organizations x {staff} staff, records/s")
+    print(f"{'direction':<12}{'previous':>12}{'generated':>12}{'speedup':>9}")
+    for label, before, after, items in (
+        ("encode", dataclasses.asdict, Organization.to_dict, orgs),
+        ("decode", lambda d: previous_build(Organization, d), Organization.from_dict, dicts),
+    ):
+        old, new = _rate(before, items), _rate(after, items)
+        print(f"{label:<12}{old:>12,.0f}{new:>12,.0f}{new / old:>8.1f}x")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=2_000)
+    parser.add_argument("--staff", type=int, default=5)
+    args = parser.parse_args(argv)
+    run(args.records, args.staff)
+
+
+if __name__ == "__main__":
+    main()
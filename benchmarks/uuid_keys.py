@@ -0,0 +1,101 @@
+"""
+Insert throughput and primary-key index size: UUIDv4 vs UUIDv7 keys.
+
+Creates two scratch tables shaped like the history tables (uuid primary key,
+uuid person_id with its own index, a short payload), fills each with the same
+number of rows in small committed batches and reports rows/s plus the size
+of the primary-key index.  Random v4 keys insert all over the B-tree and
+leave half-empty pages behind; v7 keys append at the right edge.
+
+    python -m benchmarks.uuid_keys --rows 200000 --batch 500
+    python -m benchmarks.uuid_keys --client     # ids generated in Python
+
+Runs against SQLALCHEMY_DATABASE_URL unless ``--url`` is given; the scratch
+tables are dropped afterwards.
+"""
+import argparse
+import time
+import uuid
+
+from sqlalchemy import create_engine, text
+
+from pii.common.utils.id_generator import uuid7
+from pii.database.db_config import SQLALCHEMY_DATABASE_URL
+from pii.database.models.core.service_object import UUID_GENERATE_V7_SQL
+
+VARIANTS = {
+    "v4": ("uuid_generate_v4()", uuid.uuid4),
+    "v7": ("uuid_generate_v7()", uuid7),
+}
+
+
+def _create(conn, table: str, default: str) -> None:
+    conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+    conn.execute(text(f"""
+        CREATE TABLE {table} (
+            id uuid PRIMARY KEY DEFAULT {default},
+            person_id uuid NOT NULL,
+            payload text NOT NULL
+        )
+    """))
+    conn.execute(text(f"CREATE INDEX ix_{table}_person_id ON {table} (person_id)"))
+
+
+def _insert_server(conn, table: str, batch: int) -> None:
+    conn.execute(text(
+        f"INSERT INTO {table} (person_id, payload) "
+        f"SELECT gen_random_uuid(), md5(g::text) FROM generate_series(1, :n) g"
+    ), {"n": batch})
+
+
+def _insert_client(conn, table: str, batch: int, make_id) -> None:
+    conn.execute(
+        text(f"INSERT INTO {table} (id, person_id, payload) VALUES (:id, :person_id, :payload)"),
+        [{"id": make_id(), "person_id": uuid.uuid4(), "payload": str(i)} for i in range(batch)],
+    )
+
+
+def run(url: str, rows: int, batch: int, client: bool) -> None:
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"'))
+        conn.execute(text(UUID_GENERATE_V7_SQL))
+
+    print(f"{rows} rows in batches of {batch}, ids generated {'client' if client else 'server'}-side")
+    print(f"{'keys':<6}{'rows/s':>12}{'pk index':>12}{'person_id index':>18}")
+    for name, (default, make_id) in VARIANTS.items():
+        table = f"bench_ids_{name}"
+        with engine.begin() as conn:
+            _create(conn, table, default)
+
+        started = time.perf_counter()
+        for _ in range(rows // batch):
+            with engine.begin() as conn:
+                if client:
+                    _insert_client(conn, table, batch, make_id)
+                else:
+                    _insert_server(conn, table, batch)
+        elapsed = time.perf_counter() - started
+
+        with engine.begin() as conn:
+            pk_size, fk_size = conn.execute(text(
+                f"SELECT pg_size_pretty(pg_relation_size('{table}_pkey')), "
+                f"pg_size_pretty(pg_relation_size('ix_{table}_person_id'))"
+            )).one()
+            conn.execute(text(f"DROP TABLE {table}"))
+        print(f"{name:<6}{rows / elapsed:>12,.0f}{pk_size:>12}{fk_size:>18}")
+    engine.dispose()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default=SQLALCHEMY_DATABASE_URL)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--client", action="store_true", help="generate ids in Python instead of the column default")
+    args = parser.parse_args(argv)
+    run(args.url, args.rows, args.batch, args.client)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+UUID normalisation: current ``uuid_str``/``UUIDStr`` vs the previous
+implementation, which parsed every input through ``uuid.UUID``.
+
+Times a million calls per input shape – canonical strings (the common case:
+ids read back from stores), uppercase strings and ``uuid.UUID`` objects –
+with the intern cache off and on.  Inputs cycle through ``--distinct`` ids so
+the cached run sees realistic repeats.
+
+    python -m benchmarks.uuid_normalize --calls 1000000 --distinct 1000
+"""
+import argparse
+import timeit
+import uuid
+
+from pii.common.utils.uuid_str import UUIDStr, set_uuid_cache_size, uuid_cache_size, uuid_str
+
+
+def previous_uuid_str(value, allow_None=True, allow_empty_str=True, raise_exc=True):
+    if value is None and allow_None or value == "" and allow_empty_str:
+        return value
+    if isinstance(value, str):
+        try:
+            value = uuid.UUID(value)
+        except ValueError:
+            if raise_exc:
+                raise ValueError(f"Invalid UUID string: {value}")
+            return None
+    if isinstance(value, uuid.UUID):
+        value = str(value)
+    if isinstance(value, str):
+        return value
+    if raise_exc:
+        raise TypeError(f"id must be a UUID or a valid UUID string, got {value} ({type(value)})")
+    return None
+
+
+def previous_UUIDStr(value):
+    try:
+        uuidval = uuid.UUID(str(value))
+    except Exception:
+        raise ValueError(f"{value} is not a valid UUID string")
+    return str(uuidval)
+
+
+def _time(fn, inputs: list, calls: int) -> float:
+    """Nanoseconds per call."""
+    rounds = max(1, calls // len(inputs))
+
+    def loop():
+        for value in inputs:
+            fn(value)
+
+    return timeit.timeit(loop, number=rounds) / (rounds * len(inputs)) * 1e9
+
+
+def run(calls: int, distinct: int, cache_size: int) -> None:
+    ids = [uuid.uuid4() for _ in range(distinct)]
+    shapes = {
+        "canonical str": [str(u) for u in ids],
+        "uppercase str": [str(u).upper() for u in ids],
+        "uuid.UUID": ids,
+    }
+    configured = uuid_cache_size()
+    print(f"ns per call, {calls} calls over {distinct} distinct ids (cache size {cache_size})")
+    print(f"{'function':<10}{'input':<16}{'previous':>10}{'no cache':>10}{'cached':>10}")
+    for label, new, old in (("uuid_str", uuid_str, previous_uuid_str), ("UUIDStr", UUIDStr, previous_UUIDStr)):
+        for shape, inputs in shapes.items():
+            before = _time(old, inputs, calls)
+            set_uuid_cache_size(0)
+            plain = _time(new, inputs, calls)
+            set_uuid_cache_size(cache_size)
+            cached = _time(new, inputs, calls)
+            print(f"{label:<10}{shape:<16}{before:>10.0f}{plain:>10.0f}{cached:>10.0f}")
+    set_uuid_cache_size(configured)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=1_000)
+    parser.add_argument("--cache-size", type=int, default=4_096)
+    args = parser.parse_args(argv)
+    run(args.calls, args.distinct, args.cache_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,15 @@
-from dataclasses import fields, Field
+from contextlib import contextmanager
+from contextvars import ContextVar
 from types import UnionType
 from typing import (
     Any, TypeVar, ClassVar, get_args, get_origin, Union,
-    get_type_hints, ForwardRef, Optional
+    ForwardRef, Optional
 )
 from datetime import date
 
-from pii.common.utils.uuid_str import uuid_str, UUIDStr
+from pii.common.utils.uuid_str import uuid_str, is_uuid, UUIDStr
 from pii.common.abstracts.serializable import SerializableMixin
+from pii.common.abstracts.dataclass_meta import dataclass_meta
 from pii.common.abstracts.relationship_list import RelationshipList
 from pii.common.utils.dateparser import DateParser
 
@@ -23,6 +25,13 @@ Features
 * **Automatic runtime type‑checking** on construction (``__post_init__``)
   and via :py:meth:`validate_types`. Static flag
   :pyattr:`__skip_type_validation__` allows per‑class opt‑out.
+* **Trusted construction** – :py:meth:`from_trusted` and the
+  :pyfunc:`trusted_construction` context skip both of the above for data a
+  store has already produced in canonical form (UUID strings, real dates).
+* **Dirty-field tracking** – classes with :pyattr:`__track_changes__` record
+  which fields change after a store loads or saves them (see
+  :py:meth:`dirty_fields`), so stores can write just those columns.
+* **Slots-friendly** – subclasses may be ``@dataclass(slots=True)``.
 * **Relationship introspection** – :py:meth:`relationship_fields` mirrors the
   ORM‑side helper and returns a mapping of ``field_name → target dataclass``
   for all :pyclass:`~prenuvo_pii.common.typing.relationship.RelationshipList`
@@ -32,10 +41,106 @@ Python 3.12 compliant – subclasses the plain ``list`` class rather than the
 ``list[T]`` generic alias.
 """
 
-__all__ = ["BaseDataclass"]
+__all__ = ["BaseDataclass", "trusted_construction"]
 
 T = TypeVar("T")
 
+_trusted: ContextVar[bool] = ContextVar("trusted_construction", default=False)
+
+
+def _shallow_state(value: Any) -> Any:
+    """Comparable copy of a mutable field value, one level deep.
+
+    Containers are copied element by element and dataclasses (including
+    container elements) are reduced to a tuple of their field values, so a
+    later ``append``/``remove`` or an element's field assignment compares
+    unequal.  Values held deeper than that are compared as they are.
+    """
+    if _is_dataclass_value(value):
+        return type(value), tuple(getattr(value, f.name) for f in dataclass_meta(type(value)).fields)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return type(value), tuple(_shallow_state(v) for v in value)
+    if isinstance(value, dict):
+        return dict, tuple((k, _shallow_state(v)) for k, v in value.items())
+    return value
+
+
+def _is_dataclass_value(value: Any) -> bool:
+    return hasattr(type(value), "__dataclass_fields__")
+
+
+def _is_mutable(value: Any) -> bool:
+    return isinstance(value, (list, set, dict)) or _is_dataclass_value(value)
+
+
+@contextmanager
+def trusted_construction():
+    """Build dataclasses inside this block without validation or id normalisation.
+
+    Only for data the caller guarantees already matches the annotations –
+    rows read back by a store, or copies of validated instances.  Anything
+    constructed here (including nested dataclasses built by
+    ``DataclassTransformer``) is taken as-is.
+    """
+    token = _trusted.set(True)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
+
+def _compile_matcher(expected: Any):
+    """Compile *expected* into a ``value -> bool`` predicate.
+
+    Handles the pragmatic subset of typing used in domain models:
+
+    * ``Optional`` / ``Union`` – any member matches;
+    * ``RelationshipList[T]`` / ``list[T]`` – a list whose elements all match
+      ``T``;
+    * ``UUIDStr`` – anything :class:`UUIDStr` accepts (see :pyfunc:`is_uuid`);
+    * a plain class – ``isinstance``.
+
+    Anything else accepts every value, and is compiled to ``None`` so callers
+    can skip the call.
+    """
+    origin = get_origin(expected)
+
+    if origin in {Union, UnionType}:
+        members = [_compile_matcher(arg) for arg in get_args(expected)]
+        if any(m is None for m in members):
+            return None
+        if all(isinstance(m, _IsInstance) for m in members):
+            return _IsInstance(tuple(t for m in members for t in m.types))
+        return lambda value: any(m(value) for m in members)
+
+    if origin is RelationshipList or origin is list:
+        (elem_type,) = get_args(expected) or (Any,)
+        elem = _compile_matcher(elem_type)
+        if elem is None:
+            return _IsInstance((list,))
+        return lambda value: isinstance(value, list) and all(elem(v) for v in value)
+
+    if expected is UUIDStr:
+        return is_uuid
+
+    if isinstance(expected, type):
+        return _IsInstance((expected,))
+
+    return None
+
+
+class _IsInstance:
+    """``isinstance`` predicate; kept as an object so unions can merge them."""
+
+    __slots__ = ("types",)
+
+    def __init__(self, types: tuple):
+        self.types = types
+
+    def __call__(self, value: Any) -> bool:
+        return isinstance(value, self.types)
+
+
 class BaseDataclass(SerializableMixin):
     """Mixin meant to be inherited *before* applying :pyfunc:`dataclasses.dataclass`.
 
@@ -47,22 +152,35 @@ class BaseDataclass(SerializableMixin):
         id: str | None = None
         name: str | None = None
     ```
+
+    Subclasses may use ``@dataclass(slots=True)``: the mixin's only instance
+    storage is the ``_dirty`` slot, and configuration (``_pk``, ``_store``,
+    cached plans) lives on the class, never on instances.
     """
 
+    # The dirty-field set and the loaded state of mutable fields; both
+    # unassigned (not tracking) until a store loads the instance or
+    # mark_clean() is called.
+    __slots__ = ("_dirty", "_loaded")
+
     # ------------------------------------------------------------------
     #  Configuration hooks
     # ------------------------------------------------------------------
     _pk: ClassVar[str] = "id"  # name of the primary‑key attribute
     __skip_type_validation__: ClassVar[bool] = False  # opt‑out flag for heavy imports
+    __track_changes__: ClassVar[bool] = False  # opt‑in dirty-field tracking
+    __read_only__: ClassVar[bool] = False  # stores refuse to write these
     _store: ClassVar = None
 
     # ------------------------------------------------------------------
     #  Primary‑key normalisation
     # ------------------------------------------------------------------
     def __setattr__(self, name: str, value: Any):
-        if name == self._pk:
+        if name == self._pk and not _trusted.get():
             value = uuid_str(value)
         super().__setattr__(name, value)
+        if self.__track_changes__ and (dirty := getattr(self, "_dirty", None)) is not None:
+            dirty.add(name)
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, self.__class__):
@@ -75,23 +193,58 @@ class BaseDataclass(SerializableMixin):
     #  Automatic post‑init validation
     # ------------------------------------------------------------------
     def __post_init__(self):
-        if not getattr(self, "__skip_type_validation__", False):
+        if not _trusted.get() and not getattr(self, "__skip_type_validation__", False):
             self.validate_types()
 
-    def _validate_date(self, field: Field):
-        ftype = field.type
-        is_date_field = (
-            ftype is date or
-            (get_origin(ftype) is Optional and get_args(ftype)[0] is date)
-        )
-
-        if is_date_field:
-            if val := getattr(self, field.name, None):
-                if isinstance(val, str):
-                    parsed = DateParser(val)
-                    object.__setattr__(self, field.name, parsed)
-                    return True
-        return False
+    # ------------------------------------------------------------------
+    #  Dirty-field tracking
+    # ------------------------------------------------------------------
+    def mark_clean(self) -> None:
+        """Start (or restart) recording field assignments, if the class tracks them.
+
+        Stores call this on the instances they load or save; nothing else
+        (trusted construction included) starts tracking implicitly.
+        """
+        if self.__track_changes__:
+            object.__setattr__(self, "_dirty", set())
+            # Lists, dicts and nested dataclasses can change without an
+            # assignment; keep their loaded state to compare against.
+            loaded = {}
+            for f in dataclass_meta(type(self)).fields:
+                value = getattr(self, f.name)
+                if _is_mutable(value):
+                    loaded[f.name] = _shallow_state(value)
+            object.__setattr__(self, "_loaded", loaded)
+
+    def dirty_fields(self) -> Optional[frozenset[str]]:
+        """Fields changed since the instance was loaded / last marked clean.
+
+        ``None`` means "unknown" – the class does not track changes, or the
+        instance was built by hand rather than loaded – and callers should
+        treat every field as changed.  Assigned fields are recorded as they
+        happen; lists, dicts and nested dataclasses edited in place
+        (``append``, an element's field) are found by comparing against
+        their loaded state.
+        """
+        dirty = getattr(self, "_dirty", None)
+        if dirty is None:
+            return None
+        edited = {
+            name for name, state in getattr(self, "_loaded", {}).items()
+            if name not in dirty and _shallow_state(getattr(self, name)) != state
+        }
+        return frozenset((dirty | edited) & dataclass_meta(type(self)).field_names)
+
+    @classmethod
+    def from_trusted(cls: type[T], **kwargs: Any) -> T:
+        """Construct from already-canonical values, skipping all checks.
+
+        The public constructor stays strict; stores use this for records
+        they produced themselves.  See :pyfunc:`trusted_construction`.
+        """
+        with trusted_construction():
+            return cls(**kwargs)
+
     # ------------------------------------------------------------------
     #  Public helpers
     # ------------------------------------------------------------------
@@ -103,25 +256,57 @@ class BaseDataclass(SerializableMixin):
           recursively checked.
         * Unrecognised / overly complex annotations fall back to *pass* in
           order to keep the implementation minimal.
+
+        The annotations are analysed once per class (see
+        :py:meth:`_type_plan`); this loop only runs the resulting checkers.
         """
-        for f in fields(self):
-            expected = f.type
-            value = getattr(self, f.name)
-            origin = get_origin(expected)
+        for name, is_date, misuse, matches, declared in self._type_plan():
+            value = getattr(self, name)
 
             # Allow None regardless of annotation – covers Optional/Union
             if value is None:
                 continue
 
-            if self._validate_date(f):
+            if is_date and value and isinstance(value, str):
+                object.__setattr__(self, name, DateParser(value))
                 continue
 
+            if misuse is not None:
+                raise TypeError(f"{self.__class__.__name__}.{name}: {misuse}")
+
+            if matches is not None and not matches(value):
+                raise TypeError(
+                    f"{self.__class__.__name__}.{name} = {value!r} does not match "
+                    f"declared type {declared}"
+                )
+
+    @classmethod
+    def _type_plan(cls) -> list[tuple]:
+        """Per-field ``(name, is_date, misuse, matcher, declared)`` for this class.
+
+        Built on first use and kept in the dataclass metadata registry.
+        ``misuse`` is the message for an annotation that can never validate;
+        ``matcher`` is ``None`` when every non-``None`` value passes.
+        """
+        return dataclass_meta(cls).memo("type_plan", cls._build_type_plan)
+
+    @classmethod
+    def _build_type_plan(cls) -> list[tuple]:
+        plan = []
+        for f in dataclass_meta(cls).fields:
+            expected = f.type
+            origin = get_origin(expected)
+            is_date = (
+                expected is date or
+                (origin is Optional and get_args(expected)[0] is date)
+            )
+
+            misuse = None
             # 1️⃣ If someone annotated `list[SomeDC]` instead of `RelationshipList[SomeDC]`
             if origin is list:
                 (elem_type,) = get_args(expected) or (Any,)
                 if isinstance(elem_type, type) and issubclass(elem_type, BaseDataclass):
-                    raise TypeError(
-                        f"{self.__class__.__name__}.{f.name}: "
+                    misuse = (
                         f"Annotated as `list[{elem_type.__name__}]` but must use "
                         f"`RelationshipList[{elem_type.__name__}]` for dataclass relationships."
                     )
@@ -131,18 +316,14 @@ class BaseDataclass(SerializableMixin):
             if origin is RelationshipList:
                 (elem_type,) = get_args(expected) or (Any,)
                 if isinstance(elem_type, type) and not issubclass(elem_type, BaseDataclass):
-                    raise TypeError(
-                        f"{self.__class__.__name__}.{f.name}: "
+                    misuse = (
                         f"Annotated as `RelationshipList[{elem_type.__name__}]` "
                         f"but `{elem_type.__name__}` is not a BaseDataclass—"
                         f"use plain `list[{elem_type.__name__}]` instead."
                     )
 
-            if not self._matches_type(value, expected):
-                raise TypeError(
-                    f"{self.__class__.__name__}.{f.name} = {value!r} does not match "
-                    f"declared type {f.type}"
-                )
+            plan.append((f.name, is_date, misuse, _compile_matcher(expected), f.type))
+        return plan
 
     # ------------------------------------------------------------------
     #  Class‑level relationship introspection (mirrors ORM helper)
@@ -151,58 +332,10 @@ class BaseDataclass(SerializableMixin):
     def relationship_fields(cls) -> dict[str, type | ForwardRef]:
         """
         Return a mapping of RelationshipList fields to their element type.
-        Supports forward-referenced annotation strings by using get_type_hints.
-        """
-        rels: dict[str, type | ForwardRef] = {}
-        # Resolve forward-refs in this class’s annotations
-        hints = get_type_hints(cls, include_extras=True)
-        for name, hint in hints.items():
-            if get_origin(hint) is RelationshipList:
-                (elem_type,) = get_args(hint) or (Any,)
-                rels[name] = elem_type
-        return rels
-    # ------------------------------------------------------------------
-    #  Internal recursive type matcher
-    # ------------------------------------------------------------------
-    @classmethod
-    def _matches_type(cls, value: Any, expected: Any) -> bool:
-        """Return *True* if *value* conforms to *expected* annotation.
-
-        Handles a pragmatic subset of typing constructs used in domain models.
+        Forward-referenced annotation strings are resolved (once) by the
+        dataclass metadata registry.
         """
-        origin = get_origin(expected)
-
-        # -------------------------------------------------- Optional / Union
-        if origin in {Union, UnionType}:
-            return any(cls._matches_type(value, arg) for arg in get_args(expected))
-
-        # -------------------------------------------------- RelationshipList[T]
-        if origin is RelationshipList:
-            if not isinstance(value, list):
-                return False
-            (elem_type,) = get_args(expected) or (Any,)
-            return all(cls._matches_type(v, elem_type) for v in value)
-
-        # -------------------------------------------------- list[T]
-        if origin is list:
-            if not isinstance(value, list):
-                return False
-            (elem_type,) = get_args(expected) or (Any,)
-            return all(cls._matches_type(v, elem_type) for v in value)
-
-        # -------------------------------------------------- plain class or builtin
-        if expected is UUIDStr:
-            try:
-                UUIDStr(value)
-                return True
-            except Exception:
-                return False
-
-        if isinstance(expected, type):
-            return isinstance(value, expected)
-
-        # -------------------------------------------------- fallback – assume OK
-        return True
+        return dict(dataclass_meta(cls).relationships)
 
     @classmethod
     def _register_store(cls, store):
@@ -4,6 +4,7 @@ from dataclasses import is_dataclass, fields
 from pii.common.utils.dataclass_transformer import DataclassTransformer
 from pii.common.abstracts.base_dataclass import BaseDataclass
 from pii.common.utils.classproperty import classproperty
+from pii.common.exceptions import ReadOnlyRecordError
 
 T = TypeVar("T")
 
@@ -70,6 +71,21 @@ class BaseStore(ABC):
         """
         return cls._dc_model.get_pk()
 
+    @staticmethod
+    def _changed_fields(obj: Any) -> Optional[frozenset]:
+        """
+        Fields assigned on ``obj`` since it was loaded, for dataclasses that
+        track changes; ``None`` when unknown (write every field).
+        """
+        dirty_fields = getattr(obj, "dirty_fields", None)
+        return dirty_fields() if dirty_fields is not None else None
+
+    @staticmethod
+    def _reject_read_only(obj: Any) -> None:
+        """Refuse writes of read-only views (``__read_only__`` dataclasses)."""
+        if getattr(obj, "__read_only__", False):
+            raise ReadOnlyRecordError(type(obj).__name__, getattr(obj, obj.get_pk(), None))
+
     @classmethod
     def get_related(cls, parent_obj, fk_field: str = None):
         """
@@ -143,6 +159,8 @@ class BaseStore(ABC):
         :param obj: The object to persist (dataclass instance or dict)
         :return: The persisted object
         """
+        self._reject_read_only(obj)
+
         # Determine if the primary key exists in the object
         pk = getattr(obj, "id", None) if is_dataclass(obj) else obj.get("id") if isinstance(obj, dict) else None
 
@@ -191,6 +209,12 @@ class BaseStore(ABC):
         """Delete an object from the store by its primary key."""
         pass
 
+    def delete_where(self, **filters) -> int:
+        """Delete every object matching ``filters``; returns how many were deleted."""
+        raise NotImplementedError(
+            BaseStore.Error.UNIMPLEMENTED_ERROR.format(self.__class__.__name__, "delete_where")
+        )
+
     def from_dict(self, data: dict) -> Any:
         """
         Create a model instance from a dictionary using the transformer.
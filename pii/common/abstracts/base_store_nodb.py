@@ -1,9 +1,11 @@
 from typing import Union, List, Optional, Any, Dict, TypeVar
 from pii.common.utils.filter import parse_filter_key, RecordFilter
-from uuid import uuid4
-from dataclasses import is_dataclass, asdict, fields
+from dataclasses import is_dataclass
 from pii.common.utils.dataclass_transformer import DataclassTransformer
 from pii.common.abstracts.base_store import BaseStore
+from pii.common.abstracts.dataclass_meta import dataclass_meta
+from pii.common.exceptions import VersionConflictError
+from pii.common.utils.id_generator import generate_uuid
 
 T = TypeVar("T")
 class BaseStore_NoDB(BaseStore):
@@ -40,13 +42,34 @@ class BaseStore_NoDB(BaseStore):
     def get(self, pk: str, default: Any = None) -> Any:
         return self._store[self._cls_name].get(pk, default)
 
+    # Dataclasses with this field get the same optimistic-concurrency
+    # semantics as versioned ORM models.
+    _version_field = "version"
+
+    def _is_versioned(self) -> bool:
+        return self._version_field in dataclass_meta(self.dc_model).field_names
+
+    def _next_version(self, existing: Any, expected: Optional[int]) -> Optional[int]:
+        """Check ``expected`` against ``existing`` and return the version to store."""
+        if not self._is_versioned():
+            return None
+        actual = getattr(existing, self._version_field, None)
+        if expected is not None and expected != actual:
+            raise VersionConflictError(
+                self.dc_model.__name__, getattr(existing, self.pk_field), expected, actual
+            )
+        return (actual or 0) + 1
+
     def _insert(self, obj: Any) -> Any:
         obj = self._validate_object(obj)
         pk_value = getattr(obj, self.dc_model.get_pk(), None)
         if not pk_value:
-            pk_value = str(uuid4())
+            pk_value = str(generate_uuid())
             setattr(obj, self.dc_model.get_pk(), pk_value)
+        if self._is_versioned():
+            setattr(obj, self._version_field, 1)
         self._store[self._cls_name][pk_value] = obj
+        obj.mark_clean()
         return obj
 
     def _patch(self, obj):
@@ -67,14 +90,22 @@ class BaseStore_NoDB(BaseStore):
         if existing is None:
             raise ValueError(f"Object with primary key {obj_id} not found")
 
-        # Create a dictionary from the existing object
-        existing_dict = asdict(existing) if is_dataclass(existing) else existing.copy()
+        changed = self._changed_fields(obj)
+        if changed is not None and obj is existing:
+            return self._write_changed(existing, changed)
+
+        # Create a dictionary from the existing object (shallow, so nested
+        # dataclasses stay dataclasses)
+        if is_dataclass(existing):
+            existing_dict = {f.name: getattr(existing, f.name) for f in dataclass_meta(existing).fields}
+        else:
+            existing_dict = existing.copy()
 
         # Create a dictionary from the patch object, excluding None values
         patch_dict = {}
         if is_dataclass(obj):
             # For dataclass objects, extract non-None fields
-            for field in fields(obj):
+            for field in dataclass_meta(obj).fields:
                 value = getattr(obj, field.name)
                 if value is not None:
                     patch_dict[field.name] = value
@@ -83,28 +114,59 @@ class BaseStore_NoDB(BaseStore):
             patch_dict = {k: v for k, v in obj.items() if v is not None}
 
         # Update the existing dictionary with the patch data
+        version = self._next_version(existing, patch_dict.pop(self._version_field, None))
         existing_dict.update(patch_dict)
+        if version is not None:
+            existing_dict[self._version_field] = version
 
-        # Convert back to a dataclass if needed
+        # Convert back to a dataclass if needed; the merged values came from
+        # the caller, so they are validated like any other construction.
         if is_dataclass(existing):
             patched = type(existing)(**existing_dict)
         else:
             patched = existing_dict
 
         # Update the store
-        self._store[obj_id] = patched
+        self._store[self._cls_name][obj_id] = patched
+        if is_dataclass(patched):
+            patched.mark_clean()
         return patched
 
+    def _write_changed(self, existing: Any, changed: frozenset) -> Any:
+        """
+        Re-put of the stored instance itself, edited since it was loaded:
+        its fields already hold the new values, so only the version moves,
+        and only if a field actually changed.
+        """
+        if changed - {self.pk_field, self._version_field}:
+            version = self._next_version(existing, None)
+            if version is not None:
+                setattr(existing, self._version_field, version)
+        existing.mark_clean()
+        return existing
+
     def _update(self, obj: Any) -> Any:
         obj = self._validate_object(obj)
         pk = getattr(obj, self.pk_field, None)
         if not pk:
             raise ValueError(self.Error.VALUEERROR_PRIMARYKEY.format(self.pk_field))
 
+        existing = self.get(pk)
+        changed = self._changed_fields(obj)
+        if changed is not None and existing is obj:
+            return self._write_changed(existing, changed)
+        if existing is not None:
+            # Re-putting the stored instance itself has nothing to compare against.
+            expected = None if existing is obj else getattr(obj, self._version_field, None)
+            version = self._next_version(existing, expected)
+            if version is not None:
+                setattr(obj, self._version_field, version)
         self._store[self._cls_name][pk] = obj
+        obj.mark_clean()
         return obj
 
     def patch(self, obj: Any) -> Any:
+        self._reject_read_only(obj)
         return self._patch(obj)
 
     def all(self) -> List[Any]:
@@ -121,3 +183,11 @@ class BaseStore_NoDB(BaseStore):
             return True
         return False
 
+    def delete_where(self, **filters) -> int:
+        if not filters:
+            raise ValueError("delete_where() requires at least one filter")
+        matched = self.filter(**filters)
+        for record in matched:
+            self.delete(getattr(record, self.pk_field))
+        return len(matched)
+
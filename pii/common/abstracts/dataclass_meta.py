@@ -0,0 +1,94 @@
+from dataclasses import Field, fields
+from typing import Any, Callable, ForwardRef, Hashable, get_args, get_origin, get_type_hints
+
+from pii.common.abstracts.relationship_list import RelationshipList
+
+"""Per-class metadata registry for domain dataclasses.
+
+Everything that can be derived from a dataclass *definition* – its fields,
+resolved type hints, relationship fields, primary-key name and the plans
+that validators and serializers compile from those – is worked out once per
+class, on first use, and kept here.  Callers read it with
+:pyfunc:`dataclass_meta`:
+
+```python
+meta = dataclass_meta(Person)
+meta.field_names          # frozenset of field names
+meta.relationships        # {"staff_organizations": ForwardRef/Organization, ...}
+meta.memo("type_plan", Person._build_type_plan)
+```
+
+Entries are never rebuilt behind the caller's back.  Call
+:pyfunc:`invalidate` after redefining or patching a class (tests, reloads),
+or when a forward reference that failed to resolve becomes resolvable.
+"""
+
+__all__ = ["DataclassMeta", "dataclass_meta", "invalidate"]
+
+
+class DataclassMeta:
+    """Lazily computed, cached facts about one dataclass."""
+
+    __slots__ = ("cls", "fields", "field_names", "_hints", "_relationships", "_memo")
+
+    def __init__(self, cls: type):
+        self.cls = cls
+        self.fields: tuple[Field, ...] = fields(cls)
+        self.field_names: frozenset[str] = frozenset(f.name for f in self.fields)
+        self._hints: dict[str, Any] | None = None
+        self._relationships: dict[str, type | ForwardRef] | None = None
+        self._memo: dict[Hashable, Any] = {}
+
+    @property
+    def pk(self) -> str:
+        return getattr(self.cls, "_pk", "id")
+
+    @property
+    def hints(self) -> dict[str, Any]:
+        """``get_type_hints(cls, include_extras=True)``, resolved once."""
+        if self._hints is None:
+            self._hints = get_type_hints(self.cls, include_extras=True)
+        return self._hints
+
+    @property
+    def relationships(self) -> dict[str, type | ForwardRef]:
+        """RelationshipList fields mapped to their element type."""
+        if self._relationships is None:
+            rels = {}
+            for name, hint in self.hints.items():
+                if get_origin(hint) is RelationshipList:
+                    (elem_type,) = get_args(hint) or (Any,)
+                    rels[name] = elem_type
+            self._relationships = rels
+        return self._relationships
+
+    def memo(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, calling ``build()`` the first time."""
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = build()
+            return value
+
+
+_registry: dict[type, DataclassMeta] = {}
+
+
+def dataclass_meta(cls: type) -> DataclassMeta:
+    """The registry entry for dataclass ``cls`` (or the class of an instance)."""
+    if not isinstance(cls, type):
+        cls = type(cls)
+    try:
+        return _registry[cls]
+    except KeyError:
+        meta = _registry[cls] = DataclassMeta(cls)
+        return meta
+
+
+def invalidate(cls: type | None = None) -> None:
+    """Drop cached metadata for ``cls`` and its subclasses, or for every class."""
+    if cls is None:
+        _registry.clear()
+        return
+    for registered in [c for c in _registry if issubclass(c, cls)]:
+        del _registry[registered]
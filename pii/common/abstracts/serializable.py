@@ -6,6 +6,8 @@ T = TypeVar("T")
 class SerializableMixin:
     """Add to_dict()/from_dict() to any dataclass via DataclassTransformer."""
 
+    __slots__ = ()
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize this dataclass (and nested ones) to plain primitives."""
 
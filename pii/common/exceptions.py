@@ -0,0 +1,30 @@
+from typing import Any, Optional
+
+
+class VersionConflictError(Exception):
+    """
+    Raised when a write is based on a stale ``version`` of a record: another
+    writer updated it first.  Re-read the record, re-apply the change and
+    retry.
+    """
+
+    def __init__(self, model: str, pk: Any, expected: Optional[int] = None, actual: Optional[int] = None):
+        self.model = model
+        self.pk = pk
+        self.expected = expected
+        self.actual = actual
+        detail = f" (expected version {expected}, found {actual})" if expected is not None else ""
+        super().__init__(f"{model} {pk} was modified concurrently{detail}")
+
+
+class ReadOnlyRecordError(Exception):
+    """
+    Raised when a read-only view of a record (e.g. a Person built from its
+    denormalized snapshot) is passed to a store write.  Load the record
+    through the store's normal read path and write that instead.
+    """
+
+    def __init__(self, model: str, pk: Any):
+        self.model = model
+        self.pk = pk
+        super().__init__(f"{model} {pk} is a read-only view and cannot be written back")
@@ -1,5 +1,8 @@
 import pytest
 from dataclasses import asdict
+from pii.common.abstracts import dataclass_meta as meta_module
+from pii.common.abstracts.base_dataclass import trusted_construction
+from pii.common.abstracts.dataclass_meta import dataclass_meta, invalidate
 from pii.common.tests.conftest import Inner, Outer
 from datetime import datetime
 
@@ -134,3 +137,59 @@ def test_inner_serialization_roundtrip(sample_uuid):
     clone = Inner.from_dict(data)
     assert isinstance(clone, Inner)
     assert clone == orig
+
+
+def test_type_plan_cached_per_class(sample_uuid):
+    """Annotations are analysed once per class; subclasses get their own plan."""
+    Inner(id=sample_uuid, name="first")
+    plan = Inner._type_plan()
+    assert Inner._type_plan() is plan
+    assert [entry[0] for entry in plan] == ["id", "name"]
+    assert Outer._type_plan() is not plan
+
+
+def test_validate_types_error_message(sample_uuid):
+    """The compiled checkers report mismatches in the established format."""
+    obj = Inner(id=sample_uuid, name="ok")
+    object.__setattr__(obj, "id", "not-a-uuid")
+    with pytest.raises(TypeError, match=r"^Inner\.id = 'not-a-uuid' does not match declared type"):
+        obj.validate_types()
+
+
+def test_from_trusted_skips_validation_only_for_that_call():
+    """from_trusted takes values as given; the public constructor stays strict."""
+    obj = Inner.from_trusted(id="not-a-uuid", name=123)
+    assert (obj.id, obj.name) == ("not-a-uuid", 123)
+
+    with pytest.raises(ValueError):
+        Inner(id="not-a-uuid", name="strict")
+    with trusted_construction():
+        Inner(id="also-not-a-uuid", name="inside")
+    with pytest.raises(ValueError):
+        obj.id = "still-strict"
+
+
+def test_metadata_registry_resolves_hints_once(monkeypatch):
+    """relationship_fields() reads resolved hints from the registry, not per call."""
+    invalidate(Outer)
+    calls = []
+    real = meta_module.get_type_hints
+    monkeypatch.setattr(meta_module, "get_type_hints", lambda *a, **kw: calls.append(a) or real(*a, **kw))
+
+    for _ in range(3):
+        assert set(Outer.relationship_fields()) == {"nested_list"}
+    assert len(calls) == 1
+    assert dataclass_meta(Outer).pk == "id"
+    assert dataclass_meta(Outer) is dataclass_meta(Outer.__new__(Outer))
+
+
+def test_metadata_registry_invalidate(sample_uuid):
+    """invalidate() drops the cached entry so the next use rebuilds it."""
+    Inner(id=sample_uuid, name="cached")
+    meta = dataclass_meta(Inner)
+    plan = Inner._type_plan()
+
+    invalidate(Inner)
+    assert dataclass_meta(Inner) is not meta
+    assert Inner._type_plan() is not plan
+    assert Inner.from_dict({"id": str(sample_uuid), "name": "rebuilt"}).name == "rebuilt"
@@ -1,7 +1,7 @@
 import pytest
 from datetime import datetime
 
-from dataclasses import asdict, is_dataclass
+from dataclasses import asdict, is_dataclass, replace
 from uuid import uuid4
 
 from pii.common.abstracts.base_store_nodb import BaseStore_NoDB
@@ -35,6 +35,29 @@ def test_patch_existing_record(store, outer_instance):
     assert updated.value == 999.0
 
 
+def test_patch_is_visible_to_get(store, outer_instance):
+    """A patched record (dict or dataclass patch) is what later reads return."""
+    store.put(outer_instance)
+
+    store.patch({"id": outer_instance.id, "value": 1.5})
+    assert store.get(outer_instance.id).value == 1.5
+
+    store.patch(replace(outer_instance, value=2.5))
+    assert store.get(outer_instance.id).value == 2.5
+    assert store.all() == [store.get(outer_instance.id)]
+
+
+def test_dataclass_patch_is_validated(store, outer_instance):
+    """Patch values come from the caller and are checked before they are stored."""
+    store.put(outer_instance)
+    bad = replace(outer_instance)
+    bad.value = "not a float"
+
+    with pytest.raises(TypeError):
+        store.patch(bad)
+    assert store.get(outer_instance.id).value == outer_instance.value
+
+
 def test_update_existing_record(store, outer_instance):
     """Test full update of a record using 'put()' with an existing ID."""
     outer_instance.value = 3.14
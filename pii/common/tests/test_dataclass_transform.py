@@ -1,9 +1,15 @@
+import gc
+import io
 import pytest
 import json
 from datetime import datetime
 from uuid import uuid4, UUID
 
-from pii.common.utils.dataclass_transformer import DataclassTransformer
+from dataclasses import asdict
+
+from pii.common.abstracts.dataclass_meta import dataclass_meta, invalidate
+from pii.common.utils.dataclass_transformer import DataclassTransformer, encoder_for
+from pii.domain.base.dataclasses import Organization, Person
 from pii.common.tests.conftest import Inner, Outer
 
 
@@ -231,3 +237,100 @@ def test_deep_nested_patch(sample_uuid):
     DataclassTransformer(base).import_(patch)
     assert base.nested_list[0].name == "X"
     assert base.nested_list[1].name == "Y"
+
+
+def test_generated_codecs_match_asdict_and_are_cached(sample_uuid):
+    """The generated encoder mirrors dataclasses.asdict; both codecs are built once per class."""
+    person = Person(id=sample_uuid, name="Codec", version=3)
+    org = Organization(name="Org", legal_name="Org Ltd")
+    org.staff_members.append(person)
+
+    out = DataclassTransformer(org).as_dict
+    assert out == asdict(org)
+    assert out["type"] == "organization"
+    assert out["staff_members"][0]["id"] == str(sample_uuid)
+    assert encoder_for(Organization) is encoder_for(Organization)
+
+    clone = Organization.from_dict(out)
+    assert isinstance(clone.staff_members[0], Person)
+    assert clone.staff_members[0].version == 3
+    decoder = DataclassTransformer(Organization)._decoder(Organization)
+    assert dataclass_meta(Organization).memo(("decoder", DataclassTransformer), None) is decoder
+
+
+def test_ndjson_round_trip_and_batch_import():
+    """dump_ndjson streams one line per record; the importers rebuild them lazily."""
+    people = (Person(name=f"P{i}", version=1) for i in range(3))
+    buffer = io.StringIO()
+    assert DataclassTransformer(Person).dump_ndjson(people, buffer) == 3
+    assert buffer.getvalue().count("\n") == 3
+
+    buffer.seek(0)
+    loaded = DataclassTransformer(Person).iter_import_ndjson(buffer)
+    assert next(loaded).name == "P0"
+    assert [p.name for p in loaded] == ["P1", "P2"]
+
+    def sources():
+        yield {"name": "dict"}
+        yield '{"name": "json"}'
+        raise AssertionError("consumed past the records requested")
+
+    batch = DataclassTransformer(Person).import_many(sources())
+    assert [next(batch).name, next(batch).name] == ["dict", "json"]
+
+
+def test_cached_codecs_do_not_retain_transformers():
+    """Compiled decoders live for the process; they must not pin a transformer or its record."""
+    # Recompile under this transformer.
+    invalidate(Person)
+    invalidate(Organization)
+    marker = f"Secret {uuid4()}"
+    transformer = DataclassTransformer(Organization).import_({"name": "x", "staff_members": [{"name": marker}]})
+    transformer_id = id(transformer)
+    del transformer
+    gc.collect()
+
+    alive = gc.get_objects()
+    assert not any(id(o) == transformer_id and isinstance(o, DataclassTransformer) for o in alive)
+    assert not any(isinstance(o, Person) and o.name == marker for o in alive)
+
+
+def test_ndjson_reports_bad_line():
+    """Malformed NDJSON names the offending line."""
+    stream = io.StringIO('{"name": "ok"}\n\n{not json}\n')
+    with pytest.raises(ValueError, match="line 3"):
+        list(DataclassTransformer(Person).iter_import_ndjson(stream))
+
+
+def _outer_with(children):
+    return Outer(id=uuid4(), timestamp=datetime.now(), value=0.0, flag=True,
+                 inner=children[0], tags=[], metadata={}, nested_list=list(children))
+
+
+def test_relationship_patch_merges_by_key():
+    """Elements are matched by pk: reorders are no-ops, edits touch only that element."""
+    a, b, c = (Inner(id=uuid4(), name=n) for n in "abc")
+    base = _outer_with([a, b, c])
+    t = DataclassTransformer(base)
+
+    t.import_({"nested_list": [{"id": c.id, "name": "c"}, {"id": a.id.upper(), "name": "a"}, {"id": b.id, "name": "b"}]})
+    assert [x is y for x, y in zip(base.nested_list, [c, a, b])] == [True, True, True]
+    assert not t.changes
+
+    t.import_({"value": 0.0, "nested_list": [{"id": a.id, "name": "A"}, {"id": str(uuid4()), "name": "new"}]})
+    rel = t.changes.relationships["nested_list"]
+    assert rel.updated == [a] and a.name == "A"
+    assert [x.name for x in rel.added] == ["new"]
+    assert set(map(id, rel.removed)) == {id(b), id(c)}
+    assert t.changes.fields == set()
+    assert base.nested_list[0] is a
+
+
+def test_patch_without_differences_reports_no_changes(sample_uuid):
+    """Re-sending the current values leaves the change set empty."""
+    inner = Inner(id=sample_uuid, name="same")
+    base = _outer_with([inner])
+    t = DataclassTransformer(base).import_({"value": 0.0, "inner": {"name": "same"},
+                                            "nested_list": [{"id": str(sample_uuid), "name": "same"}]})
+    assert not t.changes
+    assert t.import_({"value": 1.5}).changes.fields == {"value"}
@@ -1,7 +1,9 @@
 import pytest
-from uuid import UUID
-from pii.common.utils.uuid_str import uuid_str, UUIDStr
+from uuid import UUID, uuid4
+from pii.common.utils.uuid_str import uuid_str, is_uuid, set_uuid_cache_size, UUIDStr
+from pii.common.utils import uuid_str as uuid_str_module
 from pii.common.utils.classproperty import classproperty
+from pii.common.utils import json_codec
 
 
 def test_uuid_str_valid_uuid_string():
@@ -52,6 +54,40 @@ def test_UUIDStr_rejects_invalid():
         UUIDStr("invalid-uuid")
 
 
+def test_is_uuid_agrees_with_UUIDStr():
+    """is_uuid accepts exactly what UUIDStr accepts."""
+    value = "550e8400-e29b-41d4-a716-446655440000"
+    for candidate in (value, value.upper(), "{%s}" % value, value.replace("-", ""), UUID(value)):
+        assert is_uuid(candidate) and UUIDStr(candidate) == value
+    for candidate in ("", "not-a-uuid", 123, value[:-1]):
+        assert not is_uuid(candidate)
+
+
+def test_uuid_str_canonical_fast_path_returns_input():
+    """Canonical strings come back as the same object; others are normalised."""
+    value = "550e8400-e29b-41d4-a716-446655440000"
+    assert uuid_str(value) is value
+    assert uuid_str(value.upper()) == value
+
+
+def test_uuid_str_intern_cache_is_bounded():
+    """With the cache on, repeats share one string and the cache never outgrows its size."""
+    set_uuid_cache_size(2)
+    try:
+        value = "550E8400-E29B-41D4-A716-446655440000"
+        first = uuid_str(value)
+        assert uuid_str(value) is first and UUIDStr(value) is first
+        assert uuid_str(UUID(first)) == first
+        for _ in range(3):
+            uuid_str(str(uuid4()))
+        assert len(uuid_str_module._cache) <= 2
+        with pytest.raises(ValueError):
+            uuid_str("not-a-uuid")
+        assert uuid_str("not-a-uuid", raise_exc=False) is None
+    finally:
+        set_uuid_cache_size(0)
+
+
 def test_classproperty_decorator():
     """@classproperty should expose a read-only property on both class and instance."""
     class Dummy:
@@ -68,3 +104,62 @@ def test_classproperty_decorator():
     assert inst.x == 124
 
 
+
+
+def test_uuid7_layout_and_order():
+    """uuid7 should embed the timestamp, set version/variant and sort by creation."""
+    from pii.common.utils.id_generator import uuid7, uuid7_timestamp_ms
+
+    ids = [uuid7(now_ms=1_700_000_000_000) for _ in range(5000)] + [uuid7(now_ms=1_600_000_000_000)]
+    assert all(u.version == 7 and u.variant == "specified in RFC 4122" for u in ids)
+    assert uuid7_timestamp_ms(ids[0]) == 1_700_000_000_000
+    # Same millisecond, counter overflow and a clock step back all keep order.
+    assert ids == sorted(ids) and len(set(ids)) == len(ids)
+
+
+def test_generate_uuid_version_is_opt_in():
+    """generate_uuid returns v4 unless v7 is selected."""
+    from pii.common.utils import id_generator
+
+    previous = id_generator.id_version()
+    try:
+        id_generator.set_id_version(4)
+        assert id_generator.generate_uuid().version == 4
+        id_generator.set_id_version(7)
+        assert id_generator.generate_uuid().version == 7
+        with pytest.raises(ValueError):
+            id_generator.set_id_version(1)
+    finally:
+        id_generator.set_id_version(previous)
+
+
+@pytest.mark.parametrize("backend", json_codec.available_codecs())
+def test_json_codec_backends_agree(backend):
+    """Every backend writes the same compact text for UUID/datetime/date/Enum and non-ASCII values."""
+    from datetime import date, datetime
+    from pii.domain.enums import PersonNameType
+
+    uid = UUID("550e8400-e29b-41d4-a716-446655440000")
+    payload = {"id": uid, "at": datetime(2024, 1, 2, 3, 4, 5), "on": date(2024, 1, 2),
+               "kind": PersonNameType.FIRST, "tags": ["a"], "n": None, "name": "José Ñúñez"}
+    previous = json_codec.codec_name()
+    json_codec.set_codec(backend)
+    try:
+        text = json_codec.dumps(payload)
+        assert text == (
+            '{"id":"550e8400-e29b-41d4-a716-446655440000","at":"2024-01-02T03:04:05",'
+            f'"on":"2024-01-02","kind":{json_codec.dumps(PersonNameType.FIRST.value)},"tags":["a"],"n":null,'
+            '"name":"José Ñúñez"}'
+        )
+        assert json_codec.dumpb(payload) == text.encode()
+        assert json_codec.loads(text)["tags"] == ["a"]
+        assert json_codec.loads(json_codec.dumpb(payload))["name"] == "José Ñúñez"
+        with pytest.raises(json_codec.JSONDecodeError):
+            json_codec.loads("{not json")
+    finally:
+        json_codec.set_codec(previous)
+
+
+def test_json_codec_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        json_codec.set_codec("no-such-codec")
@@ -1,14 +1,18 @@
-import json
-import dataclasses
-from dataclasses import is_dataclass, fields
+import copy
+from dataclasses import dataclass, field, is_dataclass
+from decimal import Decimal
+from enum import Enum
 from typing import (
-    Any, Type, TypeVar, get_origin,
-    get_args, Union, Optional, Dict
+    Any, Callable, Type, TypeVar, get_origin,
+    get_args, Union, Optional, Dict, IO, Iterable, Iterator
 )
 from uuid import UUID
-from datetime import datetime
+from datetime import date, datetime, time
 
 from pii.common.abstracts.relationship_list import RelationshipList
+from pii.common.utils import json_codec
+from pii.common.utils.uuid_str import uuid_str
+from pii.common.abstracts.dataclass_meta import dataclass_meta
 
 T = TypeVar("T")
 
@@ -24,6 +28,12 @@ class DataclassTransformer:
         instance = transformer.as_dataclass # get dataclass
         as_dict  = transformer.as_dict      # dataclass → dict
         as_json  = transformer.as_json      # dataclass → JSON
+
+    Batches and NDJSON streams (one JSON object per line) reuse the same
+    compiled plan for every record and never hold more than one record:
+        for dc in transformer.import_many(dicts): ...
+        for dc in transformer.iter_import_ndjson(fileobj): ...
+        transformer.dump_ndjson(instances, fileobj)
     """
 
     _COERCIONS = {
@@ -43,6 +53,8 @@ class DataclassTransformer:
                 self._data = dc_or_instance
         else:
             raise TypeError("Expected a dataclass class or instance.")
+        # What the most recent import_ changed on an existing instance.
+        self.changes = ChangeSet()
 
     @staticmethod
     def get_dataclass(obj: Any) -> Union[T, None]:
@@ -77,64 +89,116 @@ class DataclassTransformer:
                 result[k] = v
         return result
 
-    def import_(self, src: Union[Dict[str, Any], str, T]) -> "DataclassTransformer":
+    @staticmethod
+    def _source_dict(src: Union[Dict[str, Any], str, T]) -> Dict[str, Any]:
+        """Normalise an import source (dict, JSON string or dataclass) to a dict."""
         # JSON → dict
         if isinstance(src, str):
             try:
-                src = json.loads(src)
-            except json.JSONDecodeError as e:
+                src = json_codec.loads(src)
+            except json_codec.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSON: {e}")
         # dataclass instance → dict
         if is_dataclass(src) and not isinstance(src, dict):
-            src = dataclasses.asdict(src)
+            src = encoder_for(type(src))(src)
 
         if not isinstance(src, dict):
             raise TypeError(f"Cannot import from type {type(src).__name__}")
+        return src
+
+    def import_(self, src: Union[Dict[str, Any], str, T]) -> "DataclassTransformer":
+        src = self._source_dict(src)
 
         # build or patch
         if self._data is None:
-            self._data = self._build(self._dataclass, src)
+            self._data = self._decoder(self._dataclass)(src)
+            self.changes = ChangeSet()
         else:
-            self._patch(self._data, src)
+            self.changes = self._patch(self._data, src)
 
         return self
 
+    def import_many(self, sources: Iterable[Union[Dict[str, Any], str, T]]) -> Iterator[T]:
+        """Build one dataclass per source, lazily.  Does not touch ``as_dataclass``."""
+        decode = self._decoder(self._dataclass)
+        for src in sources:
+            yield decode(src if type(src) is dict else self._source_dict(src))
+
+    def iter_import_ndjson(self, fileobj: IO[str]) -> Iterator[T]:
+        """Build one dataclass per non-blank line of an NDJSON text stream."""
+        decode = self._decoder(self._dataclass)
+        for lineno, line in enumerate(fileobj, 1):
+            if not line.strip():
+                continue
+            try:
+                src = json_codec.loads(line)
+            except json_codec.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {lineno}: {e}")
+            if not isinstance(src, dict):
+                raise TypeError(f"Cannot import from type {type(src).__name__} on line {lineno}")
+            yield decode(src)
+
+    def dump_ndjson(self, records: Iterable[Union[T, Dict[str, Any]]], fileobj: IO[str]) -> int:
+        """Write each dataclass (or dict) as one JSON line; returns the count written."""
+        count = 0
+        for record in records:
+            data = record if isinstance(record, dict) else encoder_for(type(record))(record)
+            fileobj.write(json_codec.dumps(data))
+            fileobj.write("\n")
+            count += 1
+        return count
+
     @property
     def as_dataclass(self) -> T:
         return self._data  # type: ignore
 
     @property
     def as_dict(self) -> Dict[str, Any]:
-        return dataclasses.asdict(self._data) if self._data is not None else {}
+        return encoder_for(type(self._data))(self._data) if self._data is not None else {}
 
     @property
     def as_json(self) -> str:
-        def default(o: Any) -> str:
-            if isinstance(o, (UUID, datetime)):
-                return str(o)
-            raise TypeError(f"{type(o).__name__} is not JSON serializable")
-        return json.dumps(self.as_dict, default=default)
+        return json_codec.dumps(self.as_dict)
 
     def _build(self, cls: Type[T], data: Dict[str, Any]) -> T:
-        kwargs: Dict[str, Any] = {}
-        for f in fields(cls):
-            if f.name in data:
-                val = data[f.name]
-                kwargs[f.name] = self._coerce_field(f.type, val)
-        return cls(**kwargs)  # type: ignore
-
-    def _patch(self, instance: T, patch: Dict[str, Any]) -> None:
+        return self._decoder(cls)(data)
+
+    # The decoder, plan and coercers are class-level: they are cached in the
+    # dataclass registry for the life of the process, so they must never
+    # close over a transformer instance (or the record it holds).
+    @classmethod
+    def _decoder(cls, dc_cls: Type[T]) -> Callable[[Dict[str, Any]], T]:
+        """
+        The generated ``dict → dc_cls`` function, cached per dataclass.  Each
+        field present in the input is run through its compiled coercer and
+        the result passed to the constructor.
+        """
+        return dataclass_meta(dc_cls).memo(
+            ("decoder", cls), lambda: _compile_decoder(dc_cls, cls._coercion_plan(dc_cls))
+        )
+
+    @classmethod
+    def _coercion_plan(cls, dc_cls: Type[T]) -> Dict[str, Optional[Callable[[Any], Any]]]:
+        """Field name → compiled coercer (``None`` = pass through), cached per class."""
+        return dataclass_meta(dc_cls).memo(
+            ("coercion_plan", cls),
+            lambda: {f.name: cls._compile_coercer(f.type) for f in dataclass_meta(dc_cls).fields},
+        )
+
+    def _patch(self, instance: T, patch: Dict[str, Any]) -> "ChangeSet":
         """
-        Patch an existing dataclass instance with new values.
+        Patch an existing dataclass instance with new values and report
+        what actually changed.
 
-        - For primitive or simple container fields, we coerce & setattr.
+        - For primitive or simple container fields, we coerce & setattr
+          (only when the value differs).
         - For nested dataclass fields, we delegate to a sub-transformer.
-        - For RelationshipList[T], we iterate incoming list; if element T
-          already exists at same index, patch it, else build a new T.
+        - For RelationshipList[T], see :py:meth:`_merge_relationship`.
         """
-        from pii.common.abstracts.base_dataclass import RelationshipList
-
-        for f in fields(instance):
+        changes = ChangeSet()
+        plan = self._coercion_plan(type(instance))
+        pk = getattr(instance, "_pk", None)
+        for f in dataclass_meta(instance).fields:
             if f.name not in patch:
                 continue
 
@@ -146,75 +210,241 @@ class DataclassTransformer:
             if is_dataclass(field_type) and isinstance(new_val, dict):
                 current = getattr(instance, f.name)
                 # Patch in place
-                patched = DataclassTransformer(current).import_(new_val).as_dataclass
-                setattr(instance, f.name, patched)
+                sub = DataclassTransformer(current).import_(new_val)
+                if sub.changes:
+                    changes.fields.add(f.name)
+                setattr(instance, f.name, sub.as_dataclass)
                 continue
 
             # 2) RelationshipList[T]: list of nested dataclasses
             if origin is RelationshipList and isinstance(new_val, list):
-                elem_type = get_args(field_type)[0]
-                current_list = getattr(instance, f.name) or RelationshipList()
-                updated_list = RelationshipList()
-                for idx, elem_data in enumerate(new_val):
-                    # If existing dataclass at same index, patch it
-                    if idx < len(current_list) and is_dataclass(elem_type):
-                        transformer = DataclassTransformer(current_list[idx])
-                        transformer.import_(elem_data)
-                        updated_list.append(transformer.as_dataclass)
-                    else:
-                        # Build a fresh one
-                        built = DataclassTransformer(elem_type).import_(elem_data).as_dataclass
-                        updated_list.append(built)
-                setattr(instance, f.name, updated_list)
+                rel_changes = self._merge_relationship(instance, f.name, new_val)
+                if rel_changes:
+                    changes.relationships[f.name] = rel_changes
                 continue
 
             # 3) Fallback for everything else
-            coerced = self._coerce_field(field_type, new_val)
+            coerce = plan[f.name]
+            coerced = new_val if coerce is None else coerce(new_val)
+            if f.name == pk:
+                # Compare as the instance will store it.
+                coerced = _pk_key(coerced) or coerced
+            current = getattr(instance, f.name)
+            if current is coerced or (type(current) is type(coerced) and current == coerced):
+                continue
             setattr(instance, f.name, coerced)
+            changes.fields.add(f.name)
+        return changes
+
+    def _merge_relationship(self, instance: T, name: str, incoming: list) -> "RelationshipChanges":
+        """
+        Merge ``incoming`` into ``instance.<name>`` by primary key.
+
+        An incoming element carrying the pk of an existing element patches
+        that element in place; one without a pk falls back to the existing
+        element at the same position (unless another element claimed it by
+        key).  Anything unmatched is built fresh.  The field ends up holding
+        exactly the incoming elements, in incoming order, and untouched
+        elements keep their identity.
+        """
+        elem_type = dataclass_meta(type(instance)).relationships.get(name, Any)
+        if not is_dataclass(elem_type):
+            # Unresolvable element type: same error as building one directly.
+            DataclassTransformer(elem_type)
+
+        current = list(getattr(instance, name) or ())
+        pk = getattr(elem_type, "_pk", "id")
+        if pk not in dataclass_meta(elem_type).field_names:
+            pk = None
+
+        sources = [self._source_dict(e) for e in incoming]
+        keys = [_pk_key(src.get(pk)) if pk else None for src in sources]
+        by_key = {_pk_key(getattr(e, pk)): e for e in current if pk and getattr(e, pk, None)}
+        claimed = {id(by_key[k]) for k in keys if k is not None and k in by_key}
+
+        changes = RelationshipChanges()
+        merged = RelationshipList()
+        used: set[int] = set()
+        decode = self._decoder(elem_type)
+        for idx, (key, src) in enumerate(zip(keys, sources)):
+            if key is not None:
+                existing = by_key.get(key)
+            elif idx < len(current) and id(current[idx]) not in claimed:
+                existing = current[idx]
+            else:
+                existing = None
+
+            if existing is not None and id(existing) not in used:
+                used.add(id(existing))
+                if DataclassTransformer(existing).import_(src).changes:
+                    changes.updated.append(existing)
+                merged.append(existing)
+            else:
+                built = decode(src)
+                changes.added.append(built)
+                merged.append(built)
+
+        changes.removed.extend(e for e in current if id(e) not in used)
+        if changes.added or changes.removed or any(a is not b for a, b in zip(merged, current)):
+            setattr(instance, name, merged)
+        return changes
 
     def _coerce_field(self, ftype: Type, value: Any) -> Any:
+        coerce = self._compile_coercer(ftype)
+        return value if coerce is None else coerce(value)
+
+    @classmethod
+    def _compile_coercer(cls, ftype: Type) -> Optional[Callable[[Any], Any]]:
+        """
+        Turn the coercion rules for ``ftype`` into a single callable, so the
+        annotation is inspected once per class rather than once per value.
+        Returns ``None`` when values of this type pass through unchanged.
+        """
         origin = get_origin(ftype)
         args = get_args(ftype)
 
-        # Handle RelationshipList[T] first
-        if origin is RelationshipList:
-            elem_type = args[0]
-            # Build nested dataclasses or simple coercion for each element
-            return [
-                self._coerce_field(elem_type, v)
-                for v in value
-            ]
+        # Handle RelationshipList[T] first; List[T] likewise.  Both always
+        # produce a fresh list.
+        if origin is RelationshipList or (origin is list and args):
+            elem = cls._compile_coercer(args[0])
+            if elem is None:
+                return list
+            return lambda value: [elem(v) for v in value]
 
         # Optional[T]
         if origin is Union and type(None) in args:
             non_none = next(a for a in args if a is not type(None))
-            return None if value is None else self._coerce_field(non_none, value)
-
-        # List[T]
-        if origin is list and args:
-            return [
-                self._coerce_field(args[0], v)
-                for v in value
-            ]
+            inner = cls._compile_coercer(non_none)
+            if inner is None:
+                return None
+            return lambda value: None if value is None else inner(value)
 
         # Dict[K, V]
         if origin is dict and len(args) == 2:
-            return {
-                self._coerce_field(args[0], k): self._coerce_field(args[1], v)
-                for k, v in value.items()
-            }
+            key = cls._compile_coercer(args[0]) or _identity
+            val = cls._compile_coercer(args[1]) or _identity
+            return lambda value: {key(k): val(v) for k, v in value.items()}
 
         # Nested dataclass
         if is_dataclass(ftype):
-            if isinstance(value, ftype):
+            def nested(value: Any) -> Any:
+                if isinstance(value, dict) and not isinstance(value, ftype):
+                    return cls._decoder(ftype)(value)
                 return value
-            if isinstance(value, dict):
-                return DataclassTransformer(ftype).import_(value).as_dataclass
+            return nested
 
         # Simple coercions
-        for (target, src_types), fn in self._COERCIONS.items():
-            if ftype is target and isinstance(value, src_types):
-                return fn(value)
+        rules = [
+            (src_types, fn)
+            for (target, src_types), fn in cls._COERCIONS.items()
+            if ftype is target
+        ]
+        if not rules:
+            return None
+
+        def simple(value: Any) -> Any:
+            for src_types, fn in rules:
+                if isinstance(value, src_types):
+                    return fn(value)
+            return value
+        return simple
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _pk_key(value: Any) -> Any:
+    """Compare pks in canonical form; non-UUID keys compare as given."""
+    if not value:
+        return None
+    return uuid_str(value, raise_exc=False) or value
+
+
+@dataclass
+class RelationshipChanges:
+    """Elements a relationship merge added, patched in place, or dropped."""
+    added: list = field(default_factory=list)
+    updated: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
 
-        # Fallback
+
+@dataclass
+class ChangeSet:
+    """
+    Result of patching an instance: scalar / nested fields whose value
+    changed, and per-relationship element changes.  Falsy when the patch
+    was a no-op, so stores can skip the write entirely.
+    """
+    fields: set = field(default_factory=set)
+    relationships: Dict[str, RelationshipChanges] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.fields or self.relationships)
+
+
+# ----------------------------------------------------------------------
+#  Generated per-dataclass codecs
+# ----------------------------------------------------------------------
+# Values of these types are immutable, so encoding returns them untouched
+# (``dataclasses.asdict`` would deep-copy them to the same effect).
+_ATOMIC = frozenset({str, int, float, bool, type(None), UUID, datetime, date, time, Decimal})
+
+
+def _encode(value: Any) -> Any:
+    """``dataclasses.asdict`` semantics for a single value of any type."""
+    if type(value) in _ATOMIC or isinstance(value, Enum):
         return value
+    if is_dataclass(value) and not isinstance(value, type):
+        return encoder_for(type(value))(value)
+    if isinstance(value, list):
+        items = [_encode(v) for v in value]
+        return items if type(value) is list else type(value)(items)
+    if isinstance(value, tuple):
+        if hasattr(value, "_fields"):
+            return type(value)(*[_encode(v) for v in value])
+        return type(value)(_encode(v) for v in value)
+    if isinstance(value, dict):
+        return type(value)((_encode(k), _encode(v)) for k, v in value.items())
+    return copy.deepcopy(value)
+
+
+def _generate(name: str, lines: list[str], namespace: Dict[str, Any]) -> Callable:
+    source = "\n".join(lines)
+    exec(compile(source, f"<{name}>", "exec"), namespace)
+    return namespace[name]
+
+
+def _compile_encoder(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """Generate ``encode(obj) -> dict`` for dataclass ``cls``."""
+    names = [f.name for f in dataclass_meta(cls).fields]
+    lines = ["def encode(obj):"]
+    for i, name in enumerate(names):
+        lines.append(f"    v = obj.{name}")
+        lines.append(f"    f{i} = v if type(v) in _ATOMIC else _encode(v)")
+    entries = ", ".join(f"{name!r}: f{i}" for i, name in enumerate(names))
+    lines.append(f"    return {{{entries}}}")
+    return _generate("encode", lines, {"_ATOMIC": _ATOMIC, "_encode": _encode})
+
+
+def _compile_decoder(cls: type, plan: Dict[str, Optional[Callable[[Any], Any]]]) -> Callable:
+    """Generate ``decode(data) -> cls`` from a field → coercer plan."""
+    namespace: Dict[str, Any] = {"cls": cls}
+    lines = ["def decode(data):", "    kwargs = {}"]
+    for i, (name, coerce) in enumerate(plan.items()):
+        lines.append(f"    if {name!r} in data:")
+        if coerce is None:
+            lines.append(f"        kwargs[{name!r}] = data[{name!r}]")
+        else:
+            namespace[f"c{i}"] = coerce
+            lines.append(f"        kwargs[{name!r}] = c{i}(data[{name!r}])")
+    lines.append("    return cls(**kwargs)")
+    return _generate("decode", lines, namespace)
+
+
+def encoder_for(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """The cached generated encoder for dataclass ``cls``."""
+    return dataclass_meta(cls).memo("encoder", lambda: _compile_encoder(cls))
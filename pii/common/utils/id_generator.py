@@ -1,5 +1,79 @@
+"""
+Primary-key generation.
+
+``generate_uuid`` returns random version-4 UUIDs by default.  Setting
+``PII_ID_VERSION=7`` (or calling :func:`set_id_version`) switches it to
+time-ordered version-7 UUIDs (RFC 9562): a 48-bit millisecond timestamp
+followed by random bits, so new keys land at the right-hand edge of B-tree
+indexes instead of on random pages.  Note that a v7 id reveals when it was
+created.
+
+``uuid_generate_v7()`` is the matching server-side default; see
+``pii.database.models.core.service_object``.
+"""
+import os
+import secrets
+import threading
+import time
 import uuid
+from typing import Optional
+
+SUPPORTED_VERSIONS = (4, 7)
+
+_id_version: int = int(os.getenv("PII_ID_VERSION", "4"))
+
+_lock = threading.Lock()
+_last_ms: int = 0
+_counter: int = 0
+
+
+def set_id_version(version: int) -> None:
+    """Choose the UUID version :func:`generate_uuid` produces (4 or 7)."""
+    global _id_version
+    if version not in SUPPORTED_VERSIONS:
+        raise ValueError(f"Unsupported UUID version {version!r}; expected one of {SUPPORTED_VERSIONS}")
+    _id_version = version
+
+
+def id_version() -> int:
+    return _id_version
+
+
+def uuid7(now_ms: Optional[int] = None) -> uuid.UUID:
+    """
+    A version-7 UUID.  The 12-bit ``rand_a`` field doubles as a counter, so
+    ids generated in the same millisecond (or while the clock steps back)
+    still sort in creation order within this process.
+    """
+    global _last_ms, _counter
+    ms = time.time_ns() // 1_000_000 if now_ms is None else now_ms
+    with _lock:
+        if ms > _last_ms:
+            _last_ms = ms
+            # Start low in the counter range to leave room for increments.
+            _counter = secrets.randbits(11)
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_ms += 1
+                _counter = 0
+        ms, counter = _last_ms, _counter
+
+    value = (
+        (ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | secrets.randbits(62)
+    )
+    return uuid.UUID(int=value)
+
+
+def uuid7_timestamp_ms(value: uuid.UUID) -> int:
+    """The Unix millisecond timestamp embedded in a version-7 UUID."""
+    return uuid.UUID(str(value)).int >> 80
+
 
 def generate_uuid() -> uuid.UUID:
-    """Return a new random UUID."""
-    return uuid.uuid4()
+    """Return a new UUID of the configured version."""
+    return uuid7() if _id_version == 7 else uuid.uuid4()
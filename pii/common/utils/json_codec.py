@@ -0,0 +1,126 @@
+"""
+JSON encoding/decoding behind one interface.
+
+Every JSON touchpoint in ``common`` and ``services`` goes through
+:func:`dumps` / :func:`dumpb` / :func:`loads`; call them through the
+module (``json_codec.dumps(...)``) since :func:`set_codec` rebinds them.
+The backend is chosen once at import: ``orjson`` when it is installed,
+otherwise the standard library.  ``PII_JSON_CODEC=stdlib|orjson|auto`` (or
+:func:`set_codec`) overrides the choice.
+
+Both backends produce the same compact UTF-8 text (non-ASCII characters
+are written as-is rather than escaped) and serialise ``UUID``,
+``datetime``/``date``/``time`` (ISO 8601) and ``Enum`` (its value) without
+a caller-supplied hook; orjson does it natively, the stdlib backend through
+one shared ``default``.  ``Decimal`` becomes a string.  Neither emits the
+non-standard ``NaN``/``Infinity`` tokens: orjson writes ``null``, the
+stdlib backend raises ``ValueError``.  Decode errors are
+:class:`json.JSONDecodeError` (orjson's error subclasses it).
+"""
+import json
+import os
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Union
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+__all__ = [
+    "JSONCodec", "JSONDecodeError", "available_codecs", "codec_name",
+    "dumpb", "dumps", "loads", "set_codec",
+]
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(o: Any) -> Any:
+    if isinstance(o, UUID):
+        return str(o)
+    if isinstance(o, (datetime, date, time)):
+        return o.isoformat()
+    if isinstance(o, Enum):
+        return o.value
+    if isinstance(o, Decimal):
+        return str(o)
+    raise TypeError(f"{type(o).__name__} is not JSON serializable")
+
+
+class JSONCodec:
+    """A named ``dumps``/``dumpb``/``loads`` triple."""
+
+    __slots__ = ("name", "dumps", "dumpb", "loads")
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], str],
+        dumpb: Callable[[Any], bytes],
+        loads: Callable[[Union[str, bytes]], Any],
+    ):
+        self.name = name
+        self.dumps = dumps
+        self.dumpb = dumpb
+        self.loads = loads
+
+
+def _stdlib_codec() -> JSONCodec:
+    encoder = json.JSONEncoder(
+        separators=(",", ":"), ensure_ascii=False, allow_nan=False, default=_default
+    )
+    return JSONCodec(
+        "stdlib",
+        dumps=encoder.encode,
+        dumpb=lambda obj: encoder.encode(obj).encode("utf-8"),
+        loads=json.loads,
+    )
+
+
+def _orjson_codec() -> JSONCodec:
+    options = orjson.OPT_NON_STR_KEYS
+
+    def dumpb(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=options)
+
+    return JSONCodec(
+        "orjson",
+        dumps=lambda obj: dumpb(obj).decode("utf-8"),
+        dumpb=dumpb,
+        loads=orjson.loads,
+    )
+
+
+_FACTORIES: Dict[str, Callable[[], JSONCodec]] = {"stdlib": _stdlib_codec}
+if orjson is not None:
+    _FACTORIES["orjson"] = _orjson_codec
+
+
+def available_codecs() -> list[str]:
+    return list(_FACTORIES)
+
+
+def set_codec(name: str = "auto") -> None:
+    """Select the backend: ``"orjson"``, ``"stdlib"`` or ``"auto"`` (fastest installed)."""
+    global _codec, dumps, dumpb, loads
+    if name == "auto":
+        name = "orjson" if "orjson" in _FACTORIES else "stdlib"
+    if name not in _FACTORIES:
+        raise ValueError(f"JSON codec {name!r} is not available; installed: {available_codecs()}")
+    _codec = _FACTORIES[name]()
+    # Rebind the module-level functions so callers pay no dispatch per call.
+    dumps, dumpb, loads = _codec.dumps, _codec.dumpb, _codec.loads
+
+
+def codec_name() -> str:
+    return _codec.name
+
+
+_codec: JSONCodec
+dumps: Callable[[Any], str]
+dumpb: Callable[[Any], bytes]
+loads: Callable[[Union[str, bytes]], Any]
+set_codec(os.getenv("PII_JSON_CODEC", "auto"))
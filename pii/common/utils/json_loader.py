@@ -1,4 +1,4 @@
-import json
+from pii.common.utils import json_codec
 from pathlib import Path
 from typing import Iterator, Any
 
@@ -15,4 +15,4 @@ def load_json_stream(path: Path) -> Iterator[Any]:
             line = line.rstrip().rstrip(",")  # trim trailing commas & whitespace
             if line in ("]", ""):
                 break
-            yield json.loads(line)
+            yield json_codec.loads(line)
@@ -1,35 +1,109 @@
+"""
+UUID string normalisation.
+
+Ids are kept as canonical strings (lowercase, hyphenated, 36 chars – what
+``str(uuid.UUID(...))`` produces).  Strings already in that form are
+recognised with a precompiled pattern and returned as-is; anything else goes
+through :class:`uuid.UUID`.
+
+Bulk loads see the same ids over and over (``person_id`` on every history
+row).  :func:`set_uuid_cache_size` – or ``PII_UUID_CACHE_SIZE`` – enables a
+bounded cache from input value to canonical string, which skips the work and
+makes repeats share one string object.  The bound is kept cheaply: once the
+cache is full it is cleared wholesale and refills from the next inputs (no
+recency tracking).  It is off by default.
+"""
+import os
+import re
 import uuid
 
+# Canonical form as produced by str(uuid.UUID(...)).
+_CANONICAL_UUID = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+_is_canonical = _CANONICAL_UUID.fullmatch
 
-def uuid_str(value, allow_None=True, allow_empty_str=True, raise_exc=True):
-    if value is None and allow_None or value == "" and allow_empty_str:
-        return value
+_cache: dict = {}
+_cache_size: int = int(os.getenv("PII_UUID_CACHE_SIZE", "0"))
 
-    if isinstance(value, str):
-        try:
-            value = uuid.UUID(value)  # ensures it's a valid UUID string
-        except ValueError:
-            if raise_exc:
-                raise ValueError(f"Invalid UUID string: {value}")
-            return None
 
+def set_uuid_cache_size(size: int) -> None:
+    """Cache up to ``size`` ids (cleared when full); ``0`` disables the cache."""
+    global _cache_size
+    if size < 0:
+        raise ValueError(f"Cache size must be >= 0, got {size}")
+    _cache_size = size
+    _cache.clear()
+
+
+def uuid_cache_size() -> int:
+    return _cache_size
+
+
+def _parse(value):
+    """Canonical string for a str/UUID input, or ``None`` if it is not a UUID."""
+    if type(value) is str and _is_canonical(value):
+        return value
     if isinstance(value, uuid.UUID):
-        value = str(value)
+        return str(value)
+    try:
+        return str(uuid.UUID(value))
+    except ValueError:
+        return None
 
-    if isinstance(value, str):
+
+def _canonical(value):
+    """:func:`_parse`, through the intern cache when it is enabled."""
+    if not _cache_size:
+        return _parse(value)
+    if (cached := _cache.get(value)) is not None:
+        return cached
+    canonical = _parse(value)
+    if canonical is not None:
+        if len(_cache) >= _cache_size:
+            # Cheap bound: start over rather than track recency on every hit.
+            _cache.clear()
+        _cache[value] = canonical
+    return canonical
+
+
+def uuid_str(value, allow_None=True, allow_empty_str=True, raise_exc=True):
+    if value is None and allow_None or value == "" and allow_empty_str:
         return value
 
+    if isinstance(value, (str, uuid.UUID)):
+        canonical = _canonical(value)
+        if canonical is not None:
+            return canonical
+        if raise_exc:
+            raise ValueError(f"Invalid UUID string: {value}")
+        return None
+
     if raise_exc:
         raise TypeError(f"id must be a UUID or a valid UUID string, got {value} ({type(value)})")
     return None
 
+
+def is_uuid(value) -> bool:
+    """True if ``UUIDStr(value)`` would succeed, without building the string."""
+    if isinstance(value, str) and _is_canonical(value):
+        return True
+    if isinstance(value, uuid.UUID):
+        return True
+    try:
+        uuid.UUID(str(value))
+    except Exception:
+        return False
+    return True
+
+
 class UUIDStr(str):
     """A string type that must conform to UUID format."""
 
     def __new__(cls, value):
-        try:
-            # validate UUID format (even if it's already a UUID object)
-            uuidval = uuid.UUID(str(value))
-        except Exception:
+        # validate UUID format (even if it's already a UUID object)
+        canonical = uuid_str(
+            value if isinstance(value, uuid.UUID) else str(value),
+            allow_None=False, allow_empty_str=False, raise_exc=False,
+        )
+        if canonical is None:
             raise ValueError(f"{value} is not a valid UUID string")
-        return str(uuidval)
\ No newline at end of file
+        return canonical
\ No newline at end of file
@@ -8,10 +8,51 @@ DB_PORT = os.getenv("POSTGRES_PORT", "5432")
 DB_NAME = os.getenv("POSTGRES_DB", "prenuvo_pii_db")
 DB_CONNECT_TIMEOUT = 5
 
+# Connection pool / engine tuning
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+
 SQLALCHEMY_DATABASE_URL = (
     f"postgresql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 )
 
+# Optional read replica. Reads issued through the store layer go here unless
+# the session has written or a write committed within the read-your-writes
+# window (seconds). Unset -> every query goes to the primary.
+DB_READ_HOST = os.getenv("POSTGRES_READ_HOST")
+DB_READ_PORT = os.getenv("POSTGRES_READ_PORT", DB_PORT)
+SQLALCHEMY_READ_DATABASE_URL = os.getenv("POSTGRES_READ_URL") or (
+    f"postgresql://{DB_USER}:{DB_PASS}@{DB_READ_HOST}:{DB_READ_PORT}/{DB_NAME}"
+    if DB_READ_HOST else None
+)
+DB_READ_YOUR_WRITES_WINDOW = float(os.getenv("DB_READ_YOUR_WRITES_WINDOW", "2.0"))
+
+# Store-call instrumentation (statement counts, latency, N+1 detection).
+# Always active inside `capture_store_stats()`; this flag enables it globally.
+DB_STORE_INSTRUMENTATION = os.getenv("DB_STORE_INSTRUMENTATION", "false").lower() in ("1", "true", "yes")
+DB_N_PLUS_ONE_THRESHOLD = int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", "3"))
+
+# Slow-statement log. Statements slower than the threshold are logged with
+# their parameters redacted and kept in a bounded ring buffer; optionally the
+# offending SELECT is re-run under EXPLAIN (ANALYZE, BUFFERS).
+# Set the threshold to "off" to disable.
+_slow_ms = os.getenv("DB_SLOW_QUERY_THRESHOLD_MS", "500").strip().lower()
+DB_SLOW_QUERY_THRESHOLD_MS = None if _slow_ms in ("", "off", "none") else float(_slow_ms)
+DB_SLOW_QUERY_EXPLAIN = os.getenv("DB_SLOW_QUERY_EXPLAIN", "false").lower() in ("1", "true", "yes")
+DB_SLOW_QUERY_BUFFER_SIZE = int(os.getenv("DB_SLOW_QUERY_BUFFER_SIZE", "100"))
+
+# Denormalized person.current_snapshot, rebuilt on every ORM write to a
+# Person, its history or staff links, and read by PersonStore.get_snapshot.
+DB_PERSON_SNAPSHOT = os.getenv("DB_PERSON_SNAPSHOT", "false").lower() in ("1", "true", "yes")
+
+# organization_closure / party_role_closure, maintained on every ORM write to
+# the hierarchy link tables and used for ancestry checks and traversals.
+DB_CLOSURE_TABLES = os.getenv("DB_CLOSURE_TABLES", "false").lower() in ("1", "true", "yes")
+
 # Path to the USDA JSON file
 SEED_JSON_PATH = os.getenv(
     "SEED_JSON_PATH",
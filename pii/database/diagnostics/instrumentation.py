@@ -0,0 +1,268 @@
+"""
+Store-level query instrumentation.
+
+Every public store call (``get``, ``filter``, ``put``, ...) decorated with
+:func:`instrumented` opens a :class:`StoreCallStats` scope.  While the scope
+is open, SQLAlchemy ``before/after_cursor_execute`` events attribute each SQL
+statement to it, and :func:`conversion` accumulates time spent turning ORM
+rows into dataclasses.  Nested store calls are folded into the outermost one,
+so ``PersonStore().get(pk)`` reports everything it caused, including lazy
+loads fired from ``to_dataclass``.
+
+Instrumentation is off by default and costs one ``ContextVar`` lookup per
+call.  It is switched on inside :func:`capture_store_stats` (tests,
+benchmarks) or globally with ``DB_STORE_INSTRUMENTATION`` /
+:func:`enable_instrumentation`, in which case finished calls are logged at
+DEBUG level.  Calls whose statements look like an N+1 pattern are always
+logged as warnings.
+
+    with capture_store_stats() as capture:
+        PersonStore().get(pk)
+    assert capture.statement_count <= 3
+    assert not capture.n_plus_one_calls
+"""
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from pii.database import db_config
+
+logger = logging.getLogger(__name__)
+
+_enabled: bool = db_config.DB_STORE_INSTRUMENTATION
+_current_call: ContextVar[Optional["StoreCallStats"]] = ContextVar("current_store_call", default=None)
+_captures: ContextVar[Tuple["StoreStatsCapture", ...]] = ContextVar("store_stats_captures", default=())
+_suppressed: ContextVar[bool] = ContextVar("instrumentation_suppressed", default=False)
+
+_IN_LIST = re.compile(r"\bIN\s*\((?:[^()]|\([^()]*\))*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """Collapse whitespace and expanded ``IN (...)`` lists so repeats compare equal."""
+    return _WHITESPACE.sub(" ", _IN_LIST.sub("IN (...)", statement)).strip()
+
+
+@dataclass
+class StatementRecord:
+    statement: str
+    duration: float
+    rowcount: int
+    executemany: bool = False
+
+
+@dataclass
+class StoreCallStats:
+    """What a single store call cost."""
+    store: str
+    method: str
+    latency: float = 0.0
+    conversion_time: float = 0.0
+    statements: List[StatementRecord] = field(default_factory=list)
+    n_plus_one_threshold: int = db_config.DB_N_PLUS_ONE_THRESHOLD
+
+    @property
+    def statement_count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def rows(self) -> int:
+        """Rows reported by the DB-API cursors (drivers that report -1 count as 0)."""
+        return sum(s.rowcount for s in self.statements if s.rowcount > 0)
+
+    @property
+    def sql_time(self) -> float:
+        return sum(s.duration for s in self.statements)
+
+    @property
+    def n_plus_one(self) -> Dict[str, int]:
+        """Normalized statements executed at least ``n_plus_one_threshold`` times."""
+        counts = Counter(normalize_statement(s.statement) for s in self.statements)
+        return {sql: n for sql, n in counts.items() if n >= self.n_plus_one_threshold}
+
+    def __str__(self) -> str:
+        return (
+            f"{self.store}.{self.method}: {self.latency * 1000:.2f}ms, "
+            f"{self.statement_count} statements ({self.sql_time * 1000:.2f}ms), "
+            f"{self.rows} rows, conversion {self.conversion_time * 1000:.2f}ms"
+        )
+
+
+class StoreStatsCapture:
+    """Collects every :class:`StoreCallStats` finished inside :func:`capture_store_stats`."""
+
+    def __init__(self):
+        self.calls: List[StoreCallStats] = []
+
+    @property
+    def statement_count(self) -> int:
+        return sum(c.statement_count for c in self.calls)
+
+    @property
+    def rows(self) -> int:
+        return sum(c.rows for c in self.calls)
+
+    @property
+    def n_plus_one_calls(self) -> List[StoreCallStats]:
+        return [c for c in self.calls if c.n_plus_one]
+
+    def for_method(self, method: str) -> List[StoreCallStats]:
+        return [c for c in self.calls if c.method == method]
+
+
+def enable_instrumentation(enabled: bool = True) -> None:
+    """Turn global instrumentation on or off at runtime."""
+    global _enabled
+    _enabled = enabled
+
+
+def instrumentation_active() -> bool:
+    return _enabled or bool(_captures.get())
+
+
+@contextmanager
+def capture_store_stats():
+    """Record the stats of every store call made inside the block."""
+    capture = StoreStatsCapture()
+    token = _captures.set(_captures.get() + (capture,))
+    try:
+        yield capture
+    finally:
+        _captures.reset(token)
+
+
+@contextmanager
+def suppress_instrumentation():
+    """Do not attribute statements issued inside the block (diagnostic queries)."""
+    token = _suppressed.set(True)
+    try:
+        yield
+    finally:
+        _suppressed.reset(token)
+
+
+def current_store_call() -> Optional[StoreCallStats]:
+    return _current_call.get()
+
+
+@contextmanager
+def store_call(store: str, method: str):
+    """Open a stats scope unless one is already open or instrumentation is off."""
+    if _current_call.get() is not None or not instrumentation_active():
+        yield _current_call.get()
+        return
+
+    stats = StoreCallStats(store=store, method=method)
+    token = _current_call.set(stats)
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats.latency = time.perf_counter() - start
+        _current_call.reset(token)
+        _finish(stats)
+
+
+def _finish(stats: StoreCallStats) -> None:
+    for capture in _captures.get():
+        capture.calls.append(stats)
+    if repeated := stats.n_plus_one:
+        for sql, count in repeated.items():
+            logger.warning(
+                "Possible N+1 in %s.%s: statement executed %d times: %s",
+                stats.store, stats.method, count, sql,
+            )
+    logger.debug("%s", stats)
+
+
+def instrumented(fn: Callable) -> Callable:
+    """Decorate a store method so each call gets its own :class:`StoreCallStats`."""
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        if _current_call.get() is not None or not instrumentation_active():
+            return fn(self, *args, **kwargs)
+        with store_call(type(self).__name__, fn.__name__):
+            return fn(self, *args, **kwargs)
+    return wrapper
+
+
+def conversion(fn: Callable) -> Callable:
+    """Decorate an ORM → dataclass conversion so its time is recorded."""
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        if not instrumentation_active():
+            return fn(self, *args, **kwargs)
+        with store_call(type(self).__name__, fn.__name__) as stats:
+            start = time.perf_counter()
+            try:
+                return fn(self, *args, **kwargs)
+            finally:
+                stats.conversion_time += time.perf_counter() - start
+    return wrapper
+
+
+# ----------------------------------------------------------------------
+#  Engine events
+# ----------------------------------------------------------------------
+# Callables invoked as ``observer(conn, statement, parameters, executemany,
+# duration)`` after every (non-suppressed) statement, inside or outside a
+# store call. Used by the slow-query log.
+_statement_observers: List[Callable] = []
+
+
+def add_statement_observer(observer: Callable) -> None:
+    if observer not in _statement_observers:
+        _statement_observers.append(observer)
+
+
+def remove_statement_observer(observer: Callable) -> None:
+    if observer in _statement_observers:
+        _statement_observers.remove(observer)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("_pii_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("_pii_query_start")
+    if not starts:
+        return
+    duration = time.perf_counter() - starts.pop()
+    if _suppressed.get():
+        return
+    for observer in _statement_observers:
+        observer(conn, statement, parameters, executemany, duration)
+    stats = _current_call.get()
+    if stats is None:
+        return
+    rowcount = getattr(cursor, "rowcount", -1)
+    stats.statements.append(StatementRecord(
+        statement=statement,
+        duration=duration,
+        rowcount=rowcount if isinstance(rowcount, int) else -1,
+        executemany=executemany,
+    ))
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("_pii_query_start"):
+        conn.info["_pii_query_start"].pop()
+
+
+def install(target: Any = Engine) -> None:
+    """Attach the cursor listeners (idempotent). Defaults to every Engine."""
+    if not event.contains(target, "before_cursor_execute", _before_cursor_execute):
+        event.listen(target, "before_cursor_execute", _before_cursor_execute)
+        event.listen(target, "after_cursor_execute", _after_cursor_execute)
+        event.listen(target, "handle_error", _handle_error)
@@ -0,0 +1,119 @@
+"""
+Helpers for asserting on PostgreSQL query plans.
+
+:func:`capture_statements` records the ``SELECT`` statements a block of code
+issues (e.g. a store call, including its eager and ``selectin`` loads), and
+:func:`explain` turns any of them into a :class:`QueryPlan` parsed from
+``EXPLAIN (FORMAT JSON)``.  The plan regression tests use these to check that
+store queries keep using indexes as relationships and loading strategies
+change.
+
+    with capture_statements() as captured:
+        PersonStore().get(pk)
+    for stmt in captured:
+        plan = explain(conn, stmt.statement, stmt.parameters)
+        assert not plan.seq_scans(large_tables(conn))
+"""
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from pii.database.diagnostics import instrumentation
+
+
+@dataclass
+class CapturedStatement:
+    statement: str
+    parameters: Any
+
+
+class QueryPlan:
+    """Thin wrapper around the JSON produced by ``EXPLAIN (FORMAT JSON)``."""
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.raw = raw
+        self.root: Dict[str, Any] = raw["Plan"]
+
+    def nodes(self) -> Iterator[Dict[str, Any]]:
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.get("Plans", ())))
+
+    def node_types(self) -> List[str]:
+        return [n["Node Type"] for n in self.nodes()]
+
+    def relations(self) -> Set[str]:
+        return {n["Relation Name"] for n in self.nodes() if "Relation Name" in n}
+
+    def seq_scans(self, relations: Optional[Set[str]] = None) -> List[str]:
+        """Relations read with a sequential scan, optionally limited to ``relations``."""
+        return [
+            n["Relation Name"] for n in self.nodes()
+            if n["Node Type"] == "Seq Scan"
+            and (relations is None or n["Relation Name"] in relations)
+        ]
+
+    def index_scans(self) -> List[str]:
+        """Index names used by index, index-only and bitmap index scans."""
+        return [n["Index Name"] for n in self.nodes() if "Index Name" in n]
+
+    @property
+    def estimated_rows(self) -> float:
+        return self.root["Plan Rows"]
+
+    @property
+    def total_cost(self) -> float:
+        return self.root["Total Cost"]
+
+    def __str__(self) -> str:
+        return json.dumps(self.raw, indent=2)
+
+
+@contextmanager
+def capture_statements():
+    """Collect every ``SELECT`` / ``WITH`` statement executed inside the block."""
+    captured: List[CapturedStatement] = []
+
+    def observer(conn, statement, parameters, executemany, duration):
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            captured.append(CapturedStatement(statement, parameters))
+
+    instrumentation.install()
+    instrumentation.add_statement_observer(observer)
+    try:
+        yield captured
+    finally:
+        instrumentation.remove_statement_observer(observer)
+
+
+def explain(conn, statement: str, parameters: Any = None, analyze: bool = False) -> QueryPlan:
+    """``EXPLAIN`` a raw DB-API statement on ``conn`` (a Connection or Session)."""
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+    if isinstance(conn, Session):
+        conn = conn.connection()
+    with instrumentation.suppress_instrumentation():
+        result = conn.exec_driver_sql(f"EXPLAIN ({options}) {statement}", parameters or {})
+        raw = result.scalar_one()
+    if isinstance(raw, str):
+        raw = json.loads(raw)
+    return QueryPlan(raw[0])
+
+
+def large_tables(conn, min_rows: int = 1000) -> Set[str]:
+    """Tables whose planner row estimate (``pg_class.reltuples``) is at least ``min_rows``."""
+    if isinstance(conn, Session):
+        conn = conn.connection()
+    with instrumentation.suppress_instrumentation():
+        rows = conn.execute(text(
+            "SELECT c.relname FROM pg_class c "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE c.relkind = 'r' AND n.nspname = current_schema() "
+            "AND c.reltuples >= :min_rows"
+        ), {"min_rows": min_rows})
+        return {r[0] for r in rows}
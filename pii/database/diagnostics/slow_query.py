@@ -0,0 +1,198 @@
+"""
+Slow-statement log with optional ``EXPLAIN`` capture.
+
+Any statement slower than ``threshold_ms`` is logged at WARNING level and
+kept in a bounded ring buffer.  Because this is a PII service nothing that
+could carry a value leaves this module: bound parameters are replaced by
+their type names and string and numeric literals inside the SQL text
+are masked.
+
+With ``explain=True`` the offending statement is re-run as
+``EXPLAIN (ANALYZE, BUFFERS)`` on the connection that just ran it – no
+second pool checkout, so it cannot block when the pool is saturated – inside
+a savepoint that is always rolled back, leaving the caller's transaction as
+it was.  Only plain, non-locking ``SELECT`` / ``WITH`` statements on
+PostgreSQL are explained; DML is never re-executed.
+
+    from pii.database.diagnostics.slow_query import slow_query_log
+
+    slow_query_log.configure(threshold_ms=200, explain=True)
+    ...
+    print(slow_query_log.dump())
+"""
+import logging
+import re
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Deque, List, Optional
+
+from pii.database import db_config
+from pii.database.diagnostics import instrumentation
+
+logger = logging.getLogger(__name__)
+
+# One pass, so a mask is never re-scanned: dollar-quoted bodies ($$…$$,
+# $tag$…$tag$), E'…' escape strings, plain '…' strings, then bare numeric
+# literals (not digits inside identifiers or $1-style placeholders).
+_LITERAL = re.compile(
+    r"""(?P<dollar>\$(?P<tag>(?:[A-Za-z_]\w*)?)\$.*?\$(?P=tag)\$)"""
+    r"""|(?P<escape>\b[Ee]'(?:[^'\\]|\\.|'')*')"""
+    r"""|(?P<string>'(?:[^']|'')*')"""
+    r"""|(?P<number>(?<![\w$.])(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?(?![\w.]))""",
+    re.DOTALL,
+)
+_MASKS = {"dollar": "$$<redacted>$$", "escape": "'<redacted>'", "string": "'<redacted>'", "number": "<redacted>"}
+_WRITE_OR_LOCK = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|MERGE|TRUNCATE|FOR\s+(NO\s+KEY\s+)?UPDATE|FOR\s+(KEY\s+)?SHARE)\b",
+    re.IGNORECASE,
+)
+
+
+def redact_statement(statement: str) -> str:
+    """Mask string (plain, ``E''``, dollar-quoted) and numeric literals in the SQL text."""
+    return _LITERAL.sub(lambda m: _MASKS[m.lastgroup], statement)
+
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> Any:
+    """Replace every bound value with ``<type>`` while keeping the shape."""
+    if executemany and isinstance(parameters, (list, tuple)):
+        first = redact_parameters(parameters[0]) if parameters else None
+        return {"rows": len(parameters), "first": first}
+    if isinstance(parameters, dict):
+        return {k: f"<{type(v).__name__}>" for k, v in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [f"<{type(v).__name__}>" for v in parameters]
+    return None if parameters is None else f"<{type(parameters).__name__}>"
+
+
+def is_explainable(statement: str) -> bool:
+    head = statement.lstrip().upper()
+    return head.startswith(("SELECT", "WITH")) and not _WRITE_OR_LOCK.search(statement)
+
+
+@dataclass
+class SlowQueryRecord:
+    timestamp: datetime
+    duration_ms: float
+    statement: str
+    parameters: Any
+    store_call: Optional[str] = None
+    plan: Optional[str] = None
+    explain_error: Optional[str] = None
+
+    def format(self) -> str:
+        lines = [
+            f"[{self.timestamp.isoformat()}] {self.duration_ms:.1f}ms"
+            + (f" in {self.store_call}" if self.store_call else ""),
+            self.statement,
+            f"parameters: {self.parameters}",
+        ]
+        if self.plan:
+            lines.append(self.plan)
+        if self.explain_error:
+            lines.append(f"EXPLAIN failed: {self.explain_error}")
+        return "\n".join(lines)
+
+
+class SlowQueryLog:
+    """Statement observer that records slow statements in a ring buffer."""
+
+    def __init__(
+        self,
+        threshold_ms: Optional[float] = None,
+        explain: bool = False,
+        buffer_size: int = 100,
+    ):
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        self._records: Deque[SlowQueryRecord] = deque(maxlen=buffer_size)
+
+    def configure(
+        self,
+        threshold_ms: Optional[float] = ...,
+        explain: Optional[bool] = None,
+        buffer_size: Optional[int] = None,
+    ) -> None:
+        """Change settings at runtime. ``threshold_ms=None`` disables the log."""
+        if threshold_ms is not ...:
+            self.threshold_ms = threshold_ms
+        if explain is not None:
+            self.explain = explain
+        if buffer_size is not None and buffer_size != self._records.maxlen:
+            self._records = deque(self._records, maxlen=buffer_size)
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_ms is not None
+
+    def __call__(self, conn, statement, parameters, executemany, duration) -> None:
+        duration_ms = duration * 1000
+        if self.threshold_ms is None or duration_ms < self.threshold_ms:
+            return
+
+        call = instrumentation.current_store_call()
+        record = SlowQueryRecord(
+            timestamp=datetime.now(timezone.utc),
+            duration_ms=duration_ms,
+            statement=redact_statement(statement),
+            parameters=redact_parameters(parameters, executemany),
+            store_call=f"{call.store}.{call.method}" if call else None,
+        )
+        if self.explain and not executemany and conn.dialect.name == "postgresql" \
+                and is_explainable(statement):
+            record.plan, record.explain_error = self._explain(conn, statement, parameters)
+
+        self._records.append(record)
+        logger.warning(
+            "Slow query (%.1fms)%s: %s parameters=%s",
+            record.duration_ms,
+            f" in {record.store_call}" if record.store_call else "",
+            record.statement,
+            record.parameters,
+        )
+
+    @staticmethod
+    def _explain(conn, statement, parameters):
+        # A raw DBAPI cursor: nothing here passes through the engine events.
+        try:
+            dbapi_conn = conn.connection.dbapi_connection
+            savepoint = not getattr(dbapi_conn, "autocommit", False)
+            cursor = dbapi_conn.cursor()
+            try:
+                if savepoint:
+                    cursor.execute("SAVEPOINT slow_query_explain")
+                try:
+                    cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+                    rows = cursor.fetchall()
+                finally:
+                    if savepoint:
+                        cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                        cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            finally:
+                cursor.close()
+            return "\n".join(r[0] for r in rows), None
+        except Exception as exc:  # diagnostics must never break the caller
+            return None, f"{type(exc).__name__}: {redact_statement(str(exc).splitlines()[0])}"
+
+    def records(self) -> List[SlowQueryRecord]:
+        return list(self._records)
+
+    def dump(self) -> str:
+        return "\n\n".join(r.format() for r in self._records)
+
+    def clear(self) -> None:
+        self._records.clear()
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=db_config.DB_SLOW_QUERY_THRESHOLD_MS,
+    explain=db_config.DB_SLOW_QUERY_EXPLAIN,
+    buffer_size=db_config.DB_SLOW_QUERY_BUFFER_SIZE,
+)
+
+
+def install() -> None:
+    """Hook :data:`slow_query_log` into the engine cursor events."""
+    instrumentation.install()
+    instrumentation.add_statement_observer(slow_query_log)
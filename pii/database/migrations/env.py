@@ -18,7 +18,9 @@ from pii.database.models.core.service_object import ServiceObject
 config = context.config
 
 # Interpret the config file for Python logging.
-fileConfig(config.config_file_name)
+# (skipped when driven programmatically without an .ini, e.g. from tests)
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
 
 # set the SQLAlchemy URL for Alembic
 config.set_main_option('sqlalchemy.url', SQLALCHEMY_DATABASE_URL)
@@ -0,0 +1,58 @@
+"""uuid v7 id defaults (opt-in)
+
+Revision ID: 5d2f8b7e1a36
+Revises: d9a3f6b0c251
+Create Date: 2025-08-18 09:12:30.418205
+
+Switches every server-generated id to uuid_generate_v7() only when asked:
+
+    alembic -x id_version=7 upgrade head
+
+Without the switch this revision changes nothing and ids stay v4.  A
+database already past it switches with ``alembic downgrade -1`` followed
+by the command above.  Set PII_ID_VERSION=7 for the application as well so
+client-side ids match.  Downgrading always restores uuid_generate_v4().
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2f8b7e1a36'
+down_revision = 'd9a3f6b0c251'
+branch_labels = None
+depends_on = None
+
+# Tables whose `id` is generated by the server.
+ID_TABLES = [
+    'party',
+    'party_role',
+    'person_name',
+    'person_gender',
+    'marital_status',
+    'organization_staff_assoc',
+    'organization_to_parent_org',
+    'organization_managed_person_association',
+    'organization_owner_association',
+]
+
+
+def _id_version():
+    version = context.get_x_argument(as_dictionary=True).get('id_version', '4')
+    if version not in ('4', '7'):
+        raise ValueError(f"id_version must be 4 or 7, got {version!r}")
+    return int(version)
+
+
+def _set_id_default(default):
+    for table in ID_TABLES:
+        op.alter_column(table, 'id', server_default=sa.text(default))
+
+
+def upgrade():
+    if _id_version() == 7:
+        _set_id_default('uuid_generate_v7()')
+
+
+def downgrade():
+    _set_id_default('uuid_generate_v4()')
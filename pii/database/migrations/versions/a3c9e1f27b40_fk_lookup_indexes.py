@@ -0,0 +1,34 @@
+"""fk lookup indexes
+
+Revision ID: a3c9e1f27b40
+Revises: 11014eda5437
+Create Date: 2025-08-04 09:12:41.518203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c9e1f27b40'
+down_revision = '11014eda5437'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f('ix_person_name_person_id'), 'person_name', ['person_id'], unique=False)
+    op.create_index(op.f('ix_person_gender_person_id'), 'person_gender', ['person_id'], unique=False)
+    op.create_index(op.f('ix_marital_status_person_id'), 'marital_status', ['person_id'], unique=False)
+    op.create_index(op.f('ix_organization_to_parent_org_parent_org_id'), 'organization_to_parent_org', ['parent_org_id'], unique=False)
+    op.create_index(op.f('ix_organization_staff_assoc_staff_person_id'), 'organization_staff_assoc', ['staff_person_id'], unique=False)
+    op.create_index(op.f('ix_person_role_to_organization_role_organization_role_id'), 'person_role_to_organization_role', ['organization_role_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_person_role_to_organization_role_organization_role_id'), table_name='person_role_to_organization_role')
+    op.drop_index(op.f('ix_organization_staff_assoc_staff_person_id'), table_name='organization_staff_assoc')
+    op.drop_index(op.f('ix_organization_to_parent_org_parent_org_id'), table_name='organization_to_parent_org')
+    op.drop_index(op.f('ix_marital_status_person_id'), table_name='marital_status')
+    op.drop_index(op.f('ix_person_gender_person_id'), table_name='person_gender')
+    op.drop_index(op.f('ix_person_name_person_id'), table_name='person_name')
@@ -0,0 +1,54 @@
+"""cascade deletes
+
+Revision ID: b8d1e6f3a920
+Revises: f2b9c4d7e815
+Create Date: 2025-08-12 14:22:05.871346
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8d1e6f3a920'
+down_revision = 'f2b9c4d7e815'
+branch_labels = None
+depends_on = None
+
+# (table, column, referred table) for every FK that now cascades.  They were
+# created by op.create_table under the metadata naming convention, so they
+# are named fk_<table>_<column>_<referred> (truncated with a hash suffix past
+# 63 characters; op.f() renders the same truncation).  Each one is dropped and
+# recreated under the same name with ON DELETE CASCADE.
+CASCADES = [
+    ('person', 'id', 'party'),
+    ('organization', 'id', 'party'),
+    ('person_name', 'person_id', 'person'),
+    ('person_gender', 'person_id', 'person'),
+    ('marital_status', 'person_id', 'person'),
+    ('organization_to_parent_org', 'child_org_id', 'organization'),
+    ('organization_to_parent_org', 'parent_org_id', 'organization'),
+    ('organization_staff_assoc', 'organization_id', 'organization'),
+    ('organization_staff_assoc', 'staff_person_id', 'person'),
+    ('organization_managed_person_association', 'organization_role_id', 'party_role'),
+    ('organization_managed_person_association', 'person_role_id', 'party_role'),
+    ('organization_owner_association', 'organization_role_id', 'party_role'),
+    ('organization_owner_association', 'person_role_id', 'party_role'),
+]
+
+
+def _fk_name(table, column, referred):
+    return op.f(f'fk_{table}_{column}_{referred}')
+
+
+def upgrade():
+    for table, column, referred in CASCADES:
+        name = _fk_name(table, column, referred)
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, referred, [column], ['id'], ondelete='CASCADE')
+
+
+def downgrade():
+    for table, column, referred in reversed(CASCADES):
+        name = _fk_name(table, column, referred)
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, referred, [column], ['id'])
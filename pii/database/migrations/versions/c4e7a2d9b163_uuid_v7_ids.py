@@ -0,0 +1,42 @@
+"""uuid v7 ids
+
+Revision ID: c4e7a2d9b163
+Revises: b8d1e6f3a920
+Create Date: 2025-08-13 10:05:44.190372
+
+Installs uuid_generate_v7(); id defaults are left at uuid_generate_v4().
+The function body is a frozen copy of the one in
+pii.database.models.core.service_object, so this revision produces the same
+schema regardless of the environment or later application changes.
+
+Switching server-generated ids to v7 is a deliberate, separate step: see
+revision 5d2f8b7e1a36 (``alembic -x id_version=7 upgrade head``).
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e7a2d9b163'
+down_revision = 'b8d1e6f3a920'
+branch_labels = None
+depends_on = None
+
+UUID_GENERATE_V7_SQL = """
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+    SELECT encode(
+        set_bit(set_bit(
+            overlay(uuid_send(gen_random_uuid())
+                    PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                    FROM 1 FOR 6),
+            52, 1), 53, 1),
+        'hex')::uuid
+$$ LANGUAGE sql VOLATILE
+"""
+
+
+def upgrade():
+    op.execute(UUID_GENERATE_V7_SQL)
+
+
+def downgrade():
+    op.execute('DROP FUNCTION IF EXISTS uuid_generate_v7()')
@@ -0,0 +1,36 @@
+"""history current-value indexes
+
+Revision ID: c71d24b8e5a9
+Revises: a3c9e1f27b40
+Create Date: 2025-08-06 14:27:03.904117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c71d24b8e5a9'
+down_revision = 'a3c9e1f27b40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The composite indexes lead with person_id, so they replace the
+    # single-column FK indexes.
+    op.create_index('ix_person_name_person_id_name_type_start_date', 'person_name', ['person_id', 'name_type', 'start_date'], unique=False)
+    op.create_index('ix_person_gender_person_id_start_date', 'person_gender', ['person_id', 'start_date'], unique=False)
+    op.create_index('ix_marital_status_person_id_start_date', 'marital_status', ['person_id', 'start_date'], unique=False)
+    op.drop_index(op.f('ix_person_name_person_id'), table_name='person_name')
+    op.drop_index(op.f('ix_person_gender_person_id'), table_name='person_gender')
+    op.drop_index(op.f('ix_marital_status_person_id'), table_name='marital_status')
+
+
+def downgrade():
+    op.create_index(op.f('ix_marital_status_person_id'), 'marital_status', ['person_id'], unique=False)
+    op.create_index(op.f('ix_person_gender_person_id'), 'person_gender', ['person_id'], unique=False)
+    op.create_index(op.f('ix_person_name_person_id'), 'person_name', ['person_id'], unique=False)
+    op.drop_index('ix_marital_status_person_id_start_date', table_name='marital_status')
+    op.drop_index('ix_person_gender_person_id_start_date', table_name='person_gender')
+    op.drop_index('ix_person_name_person_id_name_type_start_date', table_name='person_name')
@@ -0,0 +1,25 @@
+"""party version column
+
+Revision ID: d9a3f6b0c251
+Revises: c4e7a2d9b163
+Create Date: 2025-08-14 16:47:12.534021
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd9a3f6b0c251'
+down_revision = 'c4e7a2d9b163'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Optimistic-concurrency token for Party (and so Person / Organization).
+    op.add_column('party', sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+
+
+def downgrade():
+    op.drop_column('party', 'version')
@@ -0,0 +1,26 @@
+"""person current snapshot
+
+Revision ID: e4f8a0c3d612
+Revises: c71d24b8e5a9
+Create Date: 2025-08-08 11:03:52.662180
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4f8a0c3d612'
+down_revision = 'c71d24b8e5a9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Populated by the application on the next write (or person_snapshot.refresh_snapshots).
+    op.add_column('person', sa.Column('current_snapshot', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade():
+    op.drop_column('person', 'current_snapshot')
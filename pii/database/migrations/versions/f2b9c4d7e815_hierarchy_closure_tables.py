@@ -0,0 +1,46 @@
+"""hierarchy closure tables
+
+Revision ID: f2b9c4d7e815
+Revises: e4f8a0c3d612
+Create Date: 2025-08-11 09:41:27.305518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2b9c4d7e815'
+down_revision = 'e4f8a0c3d612'
+branch_labels = None
+depends_on = None
+
+
+def _create_closure(name, node_table):
+    op.create_table(
+        name,
+        sa.Column('ancestor_id', postgresql.UUID(), nullable=False),
+        sa.Column('descendant_id', postgresql.UUID(), nullable=False),
+        sa.Column('depth', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['ancestor_id'], [f'{node_table}.id'],
+                                name=op.f(f'fk_{name}_ancestor_id_{node_table}'), ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['descendant_id'], [f'{node_table}.id'],
+                                name=op.f(f'fk_{name}_descendant_id_{node_table}'), ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('ancestor_id', 'descendant_id', name=op.f(f'pk_{name}')),
+    )
+    op.create_index(op.f(f'ix_{name}_descendant_id'), name, ['descendant_id'], unique=False)
+
+
+def upgrade():
+    # Empty until DB_CLOSURE_TABLES is enabled and
+    # `python -m pii.database.models.closure` has been run once.
+    _create_closure('organization_closure', 'organization')
+    _create_closure('party_role_closure', 'party_role')
+
+
+def downgrade():
+    op.drop_index(op.f('ix_party_role_closure_descendant_id'), table_name='party_role_closure')
+    op.drop_table('party_role_closure')
+    op.drop_index(op.f('ix_organization_closure_descendant_id'), table_name='organization_closure')
+    op.drop_table('organization_closure')
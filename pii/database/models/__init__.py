@@ -20,6 +20,11 @@ from pii.database.models.roles import (
     OrganizationManagedPersonAssociation
 )
 
+# Registers the snapshot flush listener when DB_PERSON_SNAPSHOT is on
+from pii.database.models import person_snapshot  # noqa: E402,F401
+# Registers the closure-table flush listeners when DB_CLOSURE_TABLES is on
+from pii.database.models import closure  # noqa: E402,F401
+
 
 __all__ = [
     "PersonName",
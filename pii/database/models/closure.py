@@ -0,0 +1,346 @@
+"""
+Closure tables for the organization and role hierarchies.
+
+Each hierarchy keeps a ``(ancestor_id, descendant_id, depth)`` row for every
+pair of nodes connected by a path of links, at the length of the shortest
+such path.  Nodes are not their own ancestors, so there are no depth-0 rows.
+"Is X above Y" is then a primary-key lookup and "everything above/below X"
+a single index range scan, instead of a recursive walk over the link tables.
+
+* ``organization_closure`` follows ``organization_to_parent_org``
+  (parent org → child org).
+* ``party_role_closure`` follows both ``person_role_to_organization_role``
+  and ``organization_managed_person_association`` (organization role →
+  person role).
+
+Maintenance happens in the flush that changes the links:
+
+* an added link ``parent → child`` inserts ``ancestors(parent) ×
+  descendants(child)`` in one ``INSERT … SELECT``, keeping the smaller depth
+  on conflict;
+* a removed link, or a deleted node, invalidates the ancestry of the child
+  and everything below it; those rows are deleted and recomputed from the
+  link tables with one recursive query.
+
+Rows written outside the ORM (bulk loads, raw SQL) are not tracked; run
+:func:`rebuild` afterwards, or ``python -m pii.database.models.closure``.
+
+Off by default; enable with ``DB_CLOSURE_TABLES`` or :func:`enable_closure`
+(and rebuild once when turning it on for an existing database).  While
+disabled, the tables are neither maintained nor read.
+"""
+import argparse
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import Column, ForeignKey, Integer, Table, event, inspect, select, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+
+from pii.database import db_config
+from pii.database.models.core.service_object import ServiceObject
+from pii.database.models.party import Organization, OrganizationToParentOrganization
+from pii.database.models.roles import (
+    OrganizationManagedPersonAssociation,
+    OrganizationRole,
+    PartyRole,
+    PersonRole,
+)
+
+_enabled: bool = db_config.DB_CLOSURE_TABLES
+
+
+def _closure_table(name: str, node_table: str) -> Table:
+    return Table(
+        name,
+        ServiceObject.metadata,
+        Column(
+            "ancestor_id", UUID,
+            ForeignKey(f"{node_table}.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        Column(
+            "descendant_id", UUID,
+            ForeignKey(f"{node_table}.id", ondelete="CASCADE"),
+            primary_key=True,
+            index=True,
+        ),
+        Column("depth", Integer, nullable=False),
+    )
+
+
+organization_closure = _closure_table("organization_closure", "organization")
+party_role_closure = _closure_table("party_role_closure", "party_role")
+
+
+@dataclass(frozen=True)
+class ClosureGraph:
+    """A closure table and the ``(table, parent column, child column)`` links it follows."""
+    name: str
+    table: Table
+    node_model: type
+    edges: Tuple[Tuple[str, str, str], ...]
+
+    @property
+    def edges_sql(self) -> str:
+        return " UNION ALL ".join(
+            f"SELECT {parent} AS parent_id, {child} AS child_id FROM {table}"
+            for table, parent, child in self.edges
+        )
+
+    def _format(self, sql: str, **extra: str) -> str:
+        return sql.format(closure=self.table.name, edges=self.edges_sql, **extra)
+
+
+ORGANIZATION_GRAPH = ClosureGraph(
+    name="organization",
+    table=organization_closure,
+    node_model=Organization,
+    edges=(("organization_to_parent_org", "parent_org_id", "child_org_id"),),
+)
+ROLE_GRAPH = ClosureGraph(
+    name="role",
+    table=party_role_closure,
+    node_model=PartyRole,
+    edges=(
+        ("person_role_to_organization_role", "organization_role_id", "person_role_id"),
+        ("organization_managed_person_association", "organization_role_id", "person_role_id"),
+    ),
+)
+GRAPHS: Dict[str, ClosureGraph] = {g.name: g for g in (ORGANIZATION_GRAPH, ROLE_GRAPH)}
+
+_ADD_SQL = """
+INSERT INTO {closure} (ancestor_id, descendant_id, depth)
+SELECT a.id, d.id, min(a.depth + d.depth + 1)
+FROM (
+    SELECT ancestor_id AS id, depth FROM {closure} WHERE descendant_id = CAST(:parent AS uuid)
+    UNION ALL SELECT CAST(:parent AS uuid), 0
+) a CROSS JOIN (
+    SELECT descendant_id AS id, depth FROM {closure} WHERE ancestor_id = CAST(:child AS uuid)
+    UNION ALL SELECT CAST(:child AS uuid), 0
+) d
+WHERE a.id <> d.id
+GROUP BY a.id, d.id
+ON CONFLICT (ancestor_id, descendant_id)
+DO UPDATE SET depth = LEAST({closure}.depth, EXCLUDED.depth)
+"""
+
+# Every (ancestor, node) path for the seeded nodes, walking links upwards.
+# The visited path stops cycles in the link tables from recursing forever.
+_RECOMPUTE_SQL = """
+WITH RECURSIVE links AS ({edges}),
+up(node, ancestor, depth, path) AS (
+    SELECT child_id, parent_id, 1, ARRAY[child_id, parent_id]
+    FROM links WHERE {seed}
+    UNION ALL
+    SELECT up.node, l.parent_id, up.depth + 1, up.path || l.parent_id
+    FROM up JOIN links l ON l.child_id = up.ancestor
+    WHERE l.parent_id <> ALL(up.path)
+)
+INSERT INTO {closure} (ancestor_id, descendant_id, depth)
+SELECT ancestor, node, min(depth) FROM up GROUP BY ancestor, node
+"""
+
+_DESCENDANTS_SQL = "SELECT descendant_id FROM {closure} WHERE ancestor_id = ANY(CAST(:ids AS uuid[]))"
+_DELETE_ROWS_SQL = "DELETE FROM {closure} WHERE descendant_id = ANY(CAST(:ids AS uuid[]))"
+_IS_ANCESTOR_SQL = """
+SELECT EXISTS (
+    SELECT 1 FROM {closure}
+    WHERE ancestor_id = CAST(:ancestor AS uuid) AND descendant_id = CAST(:descendant AS uuid)
+)
+"""
+_IS_ANCESTOR_WALK_SQL = """
+WITH RECURSIVE links AS ({edges}),
+up(id, path) AS (
+    SELECT parent_id, ARRAY[child_id, parent_id] FROM links WHERE child_id = CAST(:descendant AS uuid)
+    UNION ALL
+    SELECT l.parent_id, up.path || l.parent_id
+    FROM up JOIN links l ON l.child_id = up.id
+    WHERE l.parent_id <> ALL(up.path)
+)
+SELECT EXISTS (SELECT 1 FROM up WHERE id = CAST(:ancestor AS uuid))
+"""
+
+
+def enable_closure(enabled: bool = True) -> None:
+    """Turn closure maintenance and the closure read path on or off."""
+    global _enabled
+    _enabled = enabled
+    install()
+
+
+def closure_enabled() -> bool:
+    return _enabled
+
+
+def _ids(values: Iterable[Any]) -> List[str]:
+    return sorted({str(v) for v in values if v is not None})
+
+
+def add_links(conn, graph: ClosureGraph, links: Iterable[Tuple[Any, Any]]) -> None:
+    """Extend the closure of ``graph`` with already-written ``(parent, child)`` links."""
+    sql = text(graph._format(_ADD_SQL))
+    for parent, child in sorted({(str(p), str(c)) for p, c in links if p is not None and c is not None}):
+        if parent != child:
+            conn.execute(sql, {"parent": parent, "child": child})
+
+
+def recompute(conn, graph: ClosureGraph, node_ids: Iterable[Any]) -> None:
+    """
+    Re-derive the ancestry of ``node_ids`` and every node below them from the
+    link tables, after links into that part of the graph were removed.
+    """
+    ids = _ids(node_ids)
+    if not ids:
+        return
+    below = conn.execute(text(graph._format(_DESCENDANTS_SQL)), {"ids": ids}).scalars()
+    ids = _ids([*ids, *below])
+    conn.execute(text(graph._format(_DELETE_ROWS_SQL)), {"ids": ids})
+    conn.execute(
+        text(graph._format(_RECOMPUTE_SQL, seed="child_id = ANY(CAST(:ids AS uuid[]))")),
+        {"ids": ids},
+    )
+
+
+def rebuild(conn, graph: ClosureGraph) -> None:
+    """Rebuild the whole closure of ``graph`` from its link tables."""
+    conn.execute(text(f"DELETE FROM {graph.table.name}"))
+    conn.execute(text(graph._format(_RECOMPUTE_SQL, seed="TRUE")))
+
+
+def is_ancestor(conn, graph: ClosureGraph, ancestor_id: Any, descendant_id: Any) -> bool:
+    """
+    Whether ``ancestor_id`` sits above ``descendant_id`` in ``graph``: one
+    primary-key lookup when closure tables are enabled, a recursive walk
+    over the link tables otherwise.
+    """
+    sql = _IS_ANCESTOR_SQL if _enabled else _IS_ANCESTOR_WALK_SQL
+    params = {"ancestor": str(ancestor_id), "descendant": str(descendant_id)}
+    return bool(conn.execute(text(graph._format(sql)), params).scalar())
+
+
+def before_bulk_delete(session: Session, model: type, targets) -> Optional[Callable[[], None]]:
+    """
+    Delete hook for ``BaseStoreSQLAlchemy.delete``/``delete_where``, which
+    bypass the flush.  Collects what sits below the ``targets`` (a SELECT of
+    ids about to be deleted) and returns the recompute to run afterwards.
+    """
+    if not _enabled:
+        return None
+    below: Dict[str, List[str]] = {}
+    for graph in GRAPHS.values():
+        if issubclass(model, graph.node_model) or issubclass(graph.node_model, model):
+            c = graph.table.c
+            below[graph.name] = _ids(session.scalars(select(c.descendant_id).where(c.ancestor_id.in_(targets))))
+    if not any(below.values()):
+        return None
+    return lambda: [recompute(session, GRAPHS[name], ids) for name, ids in below.items()]
+
+
+# ---------------------------------------------------------------------------
+#  Flush listeners
+# ---------------------------------------------------------------------------
+_PENDING_KEY = "closure_recompute"
+
+# Mapped link classes: (graph, parent attribute, child attribute)
+_LINK_MODELS = {
+    OrganizationToParentOrganization: (ORGANIZATION_GRAPH, "parent_org_id", "child_org_id"),
+    OrganizationManagedPersonAssociation: (ROLE_GRAPH, "organization_role_id", "person_role_id"),
+}
+
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+    """
+    Remember what sits below nodes about to be deleted: by the time
+    ``after_flush`` runs, the closure rows through them are already gone
+    (``ON DELETE CASCADE``) while paths around them are left behind.
+    """
+    if not _enabled or not session.deleted:
+        return
+    pending: Dict[str, Set[str]] = session.info.setdefault(_PENDING_KEY, {})
+    for graph in GRAPHS.values():
+        doomed = _ids(obj.id for obj in session.deleted if isinstance(obj, graph.node_model))
+        if doomed:
+            below = session.connection().execute(
+                text(graph._format(_DESCENDANTS_SQL)), {"ids": doomed}
+            ).scalars()
+            pending.setdefault(graph.name, set()).update(str(pk) for pk in below)
+
+
+def _link_changes(session: Session):
+    """``(graph, added links, children that lost a link)`` for this flush."""
+    added: Dict[str, Set[Tuple[Any, Any]]] = {name: set() for name in GRAPHS}
+    removed: Dict[str, Set[Any]] = {name: set() for name in GRAPHS}
+
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if type(obj) in _LINK_MODELS:
+            graph, parent_attr, child_attr = _LINK_MODELS[type(obj)]
+            if obj in session.deleted:
+                removed[graph.name].add(getattr(obj, child_attr))
+                continue
+            state = inspect(obj)
+            parent_history = state.attrs[parent_attr].history
+            child_history = state.attrs[child_attr].history
+            if obj in session.new or parent_history.deleted or child_history.deleted:
+                added[graph.name].add((getattr(obj, parent_attr), getattr(obj, child_attr)))
+            if parent_history.deleted or child_history.deleted:
+                # Re-pointed link: whatever used to be the child lost a parent.
+                removed[graph.name].add(
+                    child_history.deleted[0] if child_history.deleted else getattr(obj, child_attr)
+                )
+        elif isinstance(obj, OrganizationRole) and obj not in session.deleted:
+            history = inspect(obj).attrs.person_roles.history
+            added[ROLE_GRAPH.name].update((obj.id, pr.id) for pr in history.added)
+            removed[ROLE_GRAPH.name].update(pr.id for pr in history.deleted)
+        elif isinstance(obj, PersonRole) and obj not in session.deleted:
+            history = inspect(obj).attrs.organization_roles.history
+            added[ROLE_GRAPH.name].update((org_role.id, obj.id) for org_role in history.added)
+            if history.deleted:
+                removed[ROLE_GRAPH.name].add(obj.id)
+    return added, removed
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    if not _enabled:
+        session.info.pop(_PENDING_KEY, None)
+        return
+    pending = session.info.pop(_PENDING_KEY, {})
+    added, removed = _link_changes(session)
+    conn = session.connection()
+    for name, graph in GRAPHS.items():
+        # Removals first: recompute reads the final link tables, so links
+        # added in the same flush are already part of the result.
+        recompute(conn, graph, removed[name] | pending.get(name, set()))
+        add_links(conn, graph, added[name])
+
+
+def install() -> None:
+    """Attach the flush listeners (idempotent)."""
+    if not event.contains(Session, "before_flush", _before_flush):
+        event.listen(Session, "before_flush", _before_flush)
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+
+
+if _enabled:
+    install()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Rebuild hierarchy closure tables from their link tables.")
+    parser.add_argument(
+        "--graph", dest="graphs", action="append", choices=sorted(GRAPHS),
+        help="graph to rebuild; repeatable (default: all)",
+    )
+    args = parser.parse_args(argv)
+
+    from pii.database.models.core.main import db
+    with db.engine.begin() as conn:
+        for name in args.graphs or sorted(GRAPHS):
+            rebuild(conn, GRAPHS[name])
+            count = conn.execute(text(f"SELECT count(*) FROM {GRAPHS[name].table.name}")).scalar()
+            print(f"{name}: {count} closure rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Engine factory and connection-pool introspection.
+
+Every engine in the service is built through :func:`create_db_engine` (or,
+for the ``sqla_wrapper`` instance in ``main.py``, through the options returned
+by :func:`engine_options`) so pool sizing, pre-ping, recycling and the
+Postgres ``statement_timeout`` all come from ``db_config`` in one place.
+
+The pool class is :class:`MeteredQueuePool`, a ``QueuePool`` that records
+checkout / overflow / wait statistics.  Use :func:`pool_status` to read them:
+
+    from pii.database.models.core.main import engine
+    from pii.database.models.core.engine import pool_status
+
+    pool_status(engine)
+    # {'pool_size': 10, 'checked_out': 3, 'overflow': 0, 'timeouts': 0, ...}
+"""
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from pii.database import db_config
+
+
+class PoolMetrics:
+    """Thread-safe counters describing how a pool has been used."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.overflow_checkouts = 0
+            self.timeouts = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+            self.peak_checked_out = 0
+            self.peak_overflow = 0
+
+    def record_checkout(self, wait: float, checked_out: int, overflow: int) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+            if overflow > 0:
+                self.overflow_checkouts += 1
+                self.peak_overflow = max(self.peak_overflow, overflow)
+
+    def record_timeout(self, wait: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "timeouts": self.timeouts,
+                "total_wait_ms": self.total_wait * 1000,
+                "avg_wait_ms": (self.total_wait / attempts * 1000) if attempts else 0.0,
+                "max_wait_ms": self.max_wait * 1000,
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": self.peak_overflow,
+            }
+
+
+class MeteredQueuePool(QueuePool):
+    """
+    ``QueuePool`` that times every checkout.
+
+    The wait covers the whole ``_do_get`` call, i.e. time spent blocked on a
+    saturated pool as well as the time needed to open a new connection.
+    Checkouts that exceed ``pool_timeout`` are counted as ``timeouts`` before
+    the ``TimeoutError`` is re-raised.
+    """
+
+    def __init__(self, creator, **kw):
+        super().__init__(creator, **kw)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_timeout(time.perf_counter() - start)
+            raise
+        self.metrics.record_checkout(
+            time.perf_counter() - start, self.checkedout(), max(self.overflow(), 0)
+        )
+        return conn
+
+    def recreate(self) -> "MeteredQueuePool":
+        # engine.dispose() swaps in a fresh pool; keep the counters with it.
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def engine_options(url: str, **overrides) -> Dict[str, Any]:
+    """
+    Build ``create_engine`` keyword arguments for *url* from ``db_config``.
+
+    Any keyword in *overrides* replaces the configured value.  Postgres-only
+    ``connect_args`` (``connect_timeout`` and ``statement_timeout``) are left
+    out for other backends so the same factory can build SQLite engines in
+    tests.
+    """
+    options: Dict[str, Any] = {
+        "poolclass": MeteredQueuePool,
+        "pool_size": db_config.DB_POOL_SIZE,
+        "max_overflow": db_config.DB_MAX_OVERFLOW,
+        "pool_timeout": db_config.DB_POOL_TIMEOUT,
+        "pool_recycle": db_config.DB_POOL_RECYCLE,
+        "pool_pre_ping": db_config.DB_POOL_PRE_PING,
+    }
+    if make_url(url).get_backend_name() == "postgresql":
+        connect_args = {"connect_timeout": db_config.DB_CONNECT_TIMEOUT}
+        if db_config.DB_STATEMENT_TIMEOUT_MS:
+            connect_args["options"] = f"-c statement_timeout={db_config.DB_STATEMENT_TIMEOUT_MS}"
+        options["connect_args"] = connect_args
+    options.update(overrides)
+    return options
+
+
+def create_db_engine(url: str, **overrides) -> Engine:
+    """Create an engine for *url* using :func:`engine_options`."""
+    return create_engine(url, **engine_options(url, **overrides))
+
+
+def pool_status(engine: Engine) -> Dict[str, Any]:
+    """
+    Return live pool state plus the accumulated :class:`PoolMetrics`.
+
+    Engines that were not built with :class:`MeteredQueuePool` (e.g. a test
+    engine using ``NullPool``) only report the fields their pool supports.
+    """
+    pool = engine.pool
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update({
+            "pool_size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "timeout": pool.timeout(),
+        })
+    metrics: Optional[PoolMetrics] = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
+
+
+def reset_pool_metrics(engine: Engine) -> None:
+    """Zero the counters of a :class:`MeteredQueuePool` (no-op otherwise)."""
+    metrics: Optional[PoolMetrics] = getattr(engine.pool, "metrics", None)
+    if metrics is not None:
+        metrics.reset()
@@ -1,7 +1,10 @@
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import MetaData
 from sqla_wrapper import SQLAlchemy
 from pii.database import db_config
+from pii.database.models.core.engine import engine_options, create_db_engine
+from pii.database.models.core.routing import ReplicaRouter, RoutingSession
+from pii.database.diagnostics import instrumentation, slow_query
 Base = declarative_base()
 
 convention = {
@@ -12,12 +15,24 @@ convention = {
     "pk": "pk_%(table_name)s",
 }
 if pg_uri := getattr(db_config, 'SQLALCHEMY_DATABASE_URL', None):
-    db = SQLAlchemy(pg_uri)
-    db.Model.metadata = MetaData(naming_convention=convention)
-    engine = create_engine(
+    # One engine for the whole service: sqla_wrapper builds it from the
+    # db_config-driven options and `engine` is simply an alias for it.
+    db = SQLAlchemy(
         pg_uri,
-        connect_args={"connect_timeout": db_config.DB_CONNECT_TIMEOUT},
+        engine_options=engine_options(pg_uri),
+        session_options={"class_": RoutingSession},
     )
+    db.Model.metadata = MetaData(naming_convention=convention)
+    engine = db.engine
+
+    read_uri = getattr(db_config, 'SQLALCHEMY_READ_DATABASE_URL', None)
+    read_engine = create_db_engine(read_uri) if read_uri else None
+    db.Session.configure(router=ReplicaRouter(
+        engine, read_engine, db_config.DB_READ_YOUR_WRITES_WINDOW
+    ))
 else:
     raise ValueError("DATABASE_URL is not set")
 
+instrumentation.install()
+slow_query.install()
+
@@ -0,0 +1,109 @@
+"""
+Primary / read-replica routing for ORM sessions.
+
+:class:`RoutingSession` picks an engine per statement through
+``Session.get_bind``:
+
+* flushes, DML (``INSERT`` / ``UPDATE`` / ``DELETE``),
+  ``SELECT ... FOR UPDATE`` and any ``text()`` that is not a plain
+  ``SELECT`` / ``WITH`` always go to the primary;
+* once a session has written, the rest of its transaction reads from the
+  primary as well;
+* after a committed write, reads stay on the primary for the router's
+  read-your-writes window (tracked per thread / asyncio task);
+* inside ``with primary_reads():`` every read goes to the primary;
+* everything else goes to the replica.
+
+Sessions that are explicitly bound to a ``Connection`` (e.g. the test
+fixtures joining an outer transaction), and routers without a read engine,
+fall through to the normal ``Session.get_bind`` behaviour.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.elements import TextClause
+from sqla_wrapper import Session
+
+_primary_pins: ContextVar[int] = ContextVar("primary_pins", default=0)
+
+
+@contextmanager
+def primary_reads():
+    """Route every read issued inside the block to the primary."""
+    token = _primary_pins.set(_primary_pins.get() + 1)
+    try:
+        yield
+    finally:
+        _primary_pins.reset(token)
+
+
+class ReplicaRouter:
+    """Holds the write/read engines and the read-your-writes bookkeeping."""
+
+    def __init__(
+        self,
+        write_engine: Engine,
+        read_engine: Optional[Engine] = None,
+        read_your_writes_window: float = 0.0,
+    ):
+        self.write_engine = write_engine
+        self.read_engine = read_engine
+        self.read_your_writes_window = read_your_writes_window
+        self._last_write: ContextVar[Optional[float]] = ContextVar(
+            f"replica_router_last_write_{id(self)}", default=None
+        )
+
+    def note_write(self) -> None:
+        """Start the read-your-writes window for the current context."""
+        self._last_write.set(time.monotonic())
+
+    def reads_use_primary(self) -> bool:
+        if self.read_engine is None or _primary_pins.get():
+            return True
+        last = self._last_write.get()
+        return last is not None and time.monotonic() - last < self.read_your_writes_window
+
+
+class RoutingSession(Session):
+    """``sqla_wrapper`` session that routes statements through a :class:`ReplicaRouter`."""
+
+    def __init__(self, *args, router: Optional[ReplicaRouter] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.router = router
+        self._has_written = False
+
+    @staticmethod
+    def _is_write(clause) -> bool:
+        if isinstance(clause, UpdateBase):
+            return True
+        if isinstance(clause, TextClause):
+            return not clause.text.lstrip().lower().startswith(("select", "with"))
+        return getattr(clause, "_for_update_arg", None) is not None
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        router = self.router
+        if router is None or router.read_engine is None or isinstance(self.bind, Connection):
+            return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+        if self._flushing or self._is_write(clause):
+            self._has_written = True
+            return router.write_engine
+
+        if self._has_written or router.reads_use_primary():
+            return router.write_engine
+        return router.read_engine
+
+    def commit(self) -> None:
+        wrote = self._has_written
+        super().commit()
+        self._has_written = False
+        if wrote and self.router is not None:
+            self.router.note_write()
+
+    def rollback(self) -> None:
+        super().rollback()
+        self._has_written = False
@@ -1,9 +1,12 @@
 from sqlalchemy.orm import declared_attr, RelationshipProperty
-from sqlalchemy import Column, DateTime, func, text, Text, JSON, inspect
+from sqlalchemy import DDL, Column, DateTime, Integer, event, func, text, Text, JSON, inspect
 from sqlalchemy.dialects.postgresql import UUID
+import uuid
 from dataclasses import is_dataclass, fields, asdict
-from typing import Any, Type, ClassVar, Dict, TypeVar
+from typing import Any, Type, ClassVar, Dict, Optional, TypeVar
+from pii.common.abstracts.dataclass_meta import dataclass_meta
 from pii.common.utils.classproperty import classproperty
+from pii.common.utils.id_generator import id_version
 from pii.common.utils.uuid_str import uuid_str
 from pii.database.models.core.main import Base
 from sqlalchemy.inspection import inspect
@@ -13,6 +16,33 @@ from sqlalchemy.ext.associationproxy import AssociationProxy
 T = TypeVar("T")
 Session = db.Session
 
+# Server-side counterpart of id_generator.uuid7: the first 48 bits of a
+# random UUID are overwritten with the Unix time in milliseconds and the
+# version nibble set to 7 (bits 52/53 turn v4's 0100 into 0111).
+# Migration c4e7a2d9b163 carries a frozen copy; a change here needs a new
+# revision to reach migrated databases.
+UUID_GENERATE_V7_SQL = """
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+    SELECT encode(
+        set_bit(set_bit(
+            overlay(uuid_send(gen_random_uuid())
+                    PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                    FROM 1 FOR 6),
+            52, 1), 53, 1),
+        'hex')::uuid
+$$ LANGUAGE sql VOLATILE
+"""
+event.listen(db.Model.metadata, "before_create", DDL(UUID_GENERATE_V7_SQL))
+
+
+def id_server_default() -> str:
+    """
+    ``uuid_generate_v7()`` when PII_ID_VERSION=7, else ``uuid_generate_v4()``.
+    Only tables built with ``create_all`` follow this; migrated databases
+    keep v4 unless migrated with ``-x id_version=7`` (see 5d2f8b7e1a36).
+    """
+    return "uuid_generate_v7()" if id_version() == 7 else "uuid_generate_v4()"
+
 class ServiceObject(object):
     """
     Base mixin for *all* ORM models.  Provides id, timestamp, and metadata columns.
@@ -22,6 +52,18 @@ class ServiceObject(object):
     __abstract__ = True
     __allow_unmapped__ = True
     metadata = db.Model.metadata
+    # Opt-in optimistic concurrency: a model declaring ``__versioned__ = True``
+    # gets an integer ``version`` column used as the mapper's version_id_col,
+    # so every UPDATE checks and bumps it.  Set it on the base of an
+    # inheritance hierarchy; subclasses share the base table's column.
+    __versioned__: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs):
+        # Before super(): the mapper is configured from the class namespace.
+        if cls.__dict__.get("__versioned__"):
+            cls.version = Column(Integer, nullable=False, server_default=text("1"))
+            cls.__mapper_args__ = {**cls.__dict__.get("__mapper_args__", {}), "version_id_col": cls.version}
+        super().__init_subclass__(**kwargs)
 
     def __setattr__(self, name, value):
         if name == "id":
@@ -30,7 +72,7 @@ class ServiceObject(object):
 
     @declared_attr
     def id(cls):
-        return Column(UUID, primary_key=True, server_default=text("uuid_generate_v4()"))
+        return Column(UUID, primary_key=True, server_default=text(id_server_default()))
 
     @declared_attr
     def date_created(cls):
@@ -135,27 +177,30 @@ class ServiceObjectDC(ServiceObject):
         ServiceObjectDC._dc_to_orm_registry[dc] = cls
         ServiceObjectDC._orm_to_dc_registry[cls] = dc
 
-    def to_dataclass(self) -> Any:
+    def to_dataclass(self, depth: Optional[int] = None) -> Any:
         """
         Convert this ORM instance (including eagerly-loaded relationships)
-        into its corresponding dataclass.
+        into its corresponding dataclass.  ``depth`` limits how many levels
+        of related rows are converted: ``None`` follows everything loaded,
+        ``0`` converts columns only.
         """
         dc_cls: Type[Any] = type(self).__dataclass__
-        dc_field_names = {f.name for f in fields(dc_cls)}
+        dc_field_names = dataclass_meta(dc_cls).field_names
         payload: dict[str, Any] = {}
 
         # 1. Handle direct column fields
         for col in self.__table__.columns:
             if col.name in dc_field_names:
                 val = getattr(self, col.name, None)
-                payload[col.name] = str(val) if isinstance(val, UUID) else val
+                payload[col.name] = str(val) if isinstance(val, uuid.UUID) else val
 
         # 2. Handle related fields (1:M, M:M, 1:1)
         unloaded = inspect(self).unloaded
 
+        nested = None if depth is None else depth - 1
         for field in dc_field_names - payload.keys():
             # Avoid evaluating unloaded attributes
-            if field in unloaded:
+            if field in unloaded or depth == 0:
                 continue
 
             val = getattr(self, field, None)
@@ -165,17 +210,21 @@ class ServiceObjectDC(ServiceObject):
 
             elif isinstance(val, list):
                 payload[field] = [
-                    item.to_dataclass() if hasattr(item, "to_dataclass") else item
+                    item.to_dataclass(nested) if hasattr(item, "to_dataclass") else item
                     for item in val
                 ]
 
             elif hasattr(val, "to_dataclass"):
-                payload[field] = val.to_dataclass()
+                payload[field] = val.to_dataclass(nested)
 
             else:
-                payload[field] = str(val) if isinstance(val, UUID) else val
+                payload[field] = str(val) if isinstance(val, uuid.UUID) else val
 
-        return dc_cls(**payload)
+        # Values straight from the database already match the dataclass,
+        # and are the state later changes are measured from.
+        dc = dc_cls.from_trusted(**payload)
+        dc.mark_clean()
+        return dc
 
     @classmethod
     def from_dataclass(cls: Type[T], dc: Any) -> T:
@@ -193,8 +242,8 @@ class ServiceObjectDC(ServiceObject):
             if not model_cls:
                 raise ValueError(f"No ORM mapping found for dataclass {type(dc)}")
 
-            # Shallow copy of the data
-            data = dc.__dict__.copy()
+            # Shallow copy of the data (fields, not __dict__: dataclasses may be slotted)
+            data = {f.name: getattr(dc, f.name) for f in dataclass_meta(dc).fields}
 
             for key, value in data.items():
                 # Recursively resolve nested dataclasses
@@ -1,10 +1,12 @@
 import arrow
+from bisect import bisect_right
 from datetime import datetime
-from sqlalchemy import ForeignKey, String, Enum as SQLEnum, DateTime, Boolean
+from operator import attrgetter
+from sqlalchemy import ForeignKey, Index, String, Enum as SQLEnum, DateTime, Boolean, and_, func, or_, select
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from uuid import UUID
-from typing import List
+from typing import Any, ClassVar, Iterable, List, Optional, Tuple
 
 from pii.database.models.core.main import db
 from pii.database.models.core.service_object import ServiceObject, ServiceObjectDC
@@ -26,47 +28,165 @@ class History(ServiceObject, db.Model):
     start_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     end_date: Mapped[datetime] = mapped_column(DateTime, nullable=True)
 
+    # Columns (after person_id) that distinguish concurrent entries, e.g. a
+    # person has one current name *per name_type*. Used by as_of_query().
+    _as_of_partition: ClassVar[Tuple[str, ...]] = ()
+
+    @staticmethod
+    def _naive_utc(at: Optional[datetime]) -> datetime:
+        """Columns are naive UTC; normalise ``at`` (default: now) to match."""
+        return arrow.utcnow().naive if at is None else arrow.get(at).to("utc").naive
 
     @staticmethod
     def current(history_values: List["History"], value_type_name=None, value_type_value=None):
+        """
+        Return the entry in effect now (latest ``start_date`` wins), optionally
+        restricted to entries whose ``value_type_name`` equals ``value_type_value``.
+        Mirrors :meth:`current_expression` on the SQL side.
+        """
+        return History.as_of(history_values, None, value_type_name, value_type_value)
+
+    @staticmethod
+    def as_of(history_values: List["History"], at: Optional[datetime] = None,
+              value_type_name=None, value_type_value=None):
+        """
+        Return the entry in effect at ``at``: one linear pass, no copy or sort,
+        so per-access hybrids stay cheap.  Among entries starting at the same
+        time the later one in the collection wins, as in :class:`HistoryTimeline`
+        (use that for many lookups against one collection).
+        """
+        _check_value_type(value_type_name, value_type_value)
+        at = History._naive_utc(at)
+        found = None
         for value in history_values:
-            if not (value.start_date <= arrow.utcnow().naive and
-                    (value.end_date is None or value.end_date < arrow.utcnow().naive())):
+            start = value.start_date
+            if start > at or (found is not None and start < found.start_date):
+                continue
+            if value.end_date is not None and value.end_date <= at:
+                continue
+            if value_type_name is not None and _value_type(value, value_type_name) != value_type_value:
+                continue
+            found = value
+        return found
+
+    @classmethod
+    def as_of_clause(cls, at):
+        """``start_date <= at AND (end_date IS NULL OR end_date > at)``."""
+        return and_(cls.start_date <= at, or_(cls.end_date.is_(None), cls.end_date > at))
+
+    @classmethod
+    def as_of_expression(cls, value, person_id, at, *criteria):
+        """
+        Correlated scalar subquery selecting ``value`` from the entry in effect
+        at ``at`` for ``person_id``. Served by the ``(person_id, ..., start_date)``
+        indexes on the concrete history tables.
+        """
+        return (
+            select(value)
+            .where(cls.person_id == person_id, *criteria, cls.as_of_clause(at))
+            .order_by(cls.start_date.desc())
+            .limit(1)
+            .correlate_except(cls)
+            .scalar_subquery()
+        )
+
+    @classmethod
+    def current_expression(cls, value, person_id, *criteria):
+        return cls.as_of_expression(value, person_id, func.timezone("UTC", func.now()), *criteria)
+
+    @classmethod
+    def as_of_query(cls, person_ids: Iterable[Any], at: Optional[datetime] = None):
+        """
+        One statement returning, for every person in ``person_ids``, the entries
+        in effect at ``at`` (one per ``_as_of_partition`` value), via
+        ``DISTINCT ON (person_id, ...) ... ORDER BY ..., start_date DESC``.
+        """
+        partition = [cls.person_id, *(getattr(cls, c) for c in cls._as_of_partition)]
+        return (
+            select(cls)
+            .where(cls.person_id.in_(list(person_ids)), cls.as_of_clause(cls._naive_utc(at)))
+            .distinct(*partition)
+            .order_by(*partition, cls.start_date.desc())
+        )
+
+
+def _check_value_type(value_type_name, value_type_value) -> None:
+    if (value_type_name is None) != (value_type_value is None):
+        raise ValueError("Both value_type_name and value_type_value must be provided together.")
+
+
+def _value_type(value: "History", value_type_name: str) -> Any:
+    attr_value = getattr(value, value_type_name, MISSING)
+    if attr_value is MISSING:
+        raise AttributeError(f"Attribute '{value_type_name}' not found on {value}")
+    return attr_value
+
+
+class HistoryTimeline:
+    """
+    ``start_date``-sorted view over a history collection for repeated as-of
+    lookups.
+
+    Loaded collections are already ordered by ``start_date`` (see the Person
+    relationships) and are used in that order; only an out-of-order list is
+    sorted.  Each lookup is a bisect plus a short backwards walk over entries
+    that started earlier but may already have ended.
+    """
+
+    def __init__(self, history_values: List["History"]):
+        values = list(history_values)
+        starts = [v.start_date for v in values]
+        if any(a > b for a, b in zip(starts, starts[1:])):
+            values.sort(key=attrgetter("start_date"))
+            starts = [v.start_date for v in values]
+        self._values = values
+        self._starts = starts
+
+    def as_of(self, at: Optional[datetime] = None, value_type_name=None, value_type_value=None):
+        _check_value_type(value_type_name, value_type_value)
+
+        at = History._naive_utc(at)
+        for i in range(bisect_right(self._starts, at) - 1, -1, -1):
+            value = self._values[i]
+            if value.end_date is not None and value.end_date <= at:
                 continue
 
-            if value_type_name is None and value_type_value is None:
-                return value
-            elif value_type_name and value_type_value:
-                attr_value = getattr(value, value_type_name, MISSING)
-                if attr_value is MISSING:
-                    raise AttributeError(f"Attribute '{value_type_name}' not found on {value}")
-                if attr_value == value_type_value:
-                    return value
-            else:
-                raise ValueError("Both value_type_name and value_type_value must be provided together.")
+            if value_type_name is not None and _value_type(value, value_type_name) != value_type_value:
+                continue
 
+            return value
         return None
 
 
 class PersonName(History, ServiceObjectDC):
     __tablename__ = "person_name"
     __dataclass__ = PersonNameDC
+    _as_of_partition = ("name_type",)
+    __table_args__ = (
+        Index("ix_person_name_person_id_name_type_start_date", "person_id", "name_type", "start_date"),
+    )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     name_type: Mapped[PersonNameType] = mapped_column(SQLEnum(PersonNameType), nullable=False)
-    person_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("person.id"), nullable=False)
+    person_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("person.id", ondelete="CASCADE"), nullable=False)
     person: Mapped["Person"] = relationship("Person", foreign_keys=[person_id])
 
 class PersonGender(History, ServiceObjectDC):
     __tablename__ = "person_gender"
     __dataclass__ = PersonGenderDC
+    __table_args__ = (
+        Index("ix_person_gender_person_id_start_date", "person_id", "start_date"),
+    )
     gender: Mapped[GenderType] = mapped_column(SQLEnum(GenderType), nullable=False)
-    person_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("person.id"), nullable=False)
+    person_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("person.id", ondelete="CASCADE"), nullable=False)
     person: Mapped["Person"] = relationship("Person", foreign_keys=[person_id])
 
 
 class MaritalStatus(History, ServiceObjectDC):
     __tablename__ = "marital_status"
     __dataclass__ = MaritalStatusDC
+    __table_args__ = (
+        Index("ix_marital_status_person_id_start_date", "person_id", "start_date"),
+    )
     status: Mapped[MaritalStatusType] = mapped_column(SQLEnum(MaritalStatusType), nullable=False)
-    person_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("person.id"), nullable=False)
+    person_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("person.id", ondelete="CASCADE"), nullable=False)
     person: Mapped["Person"] = relationship("Person", foreign_keys=[person_id])
\ No newline at end of file
@@ -4,10 +4,10 @@ from uuid import UUID
 
 from sqlalchemy import String, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.ext.hybrid import hybrid_property
 
-from pii.database.models.history import History
+from pii.database.models.history import History, MaritalStatus, PersonGender, PersonName
 from pii.database.models.core.main import db
 from pii.database.models.core.service_object import ServiceObject, ServiceObjectDC
 from pii.database.models.core.validators.person import PersonValidator
@@ -33,16 +33,17 @@ class Party(ServiceObjectDC, db.Model):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     notes: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
+    __versioned__ = True
     __mapper_args__ = {
         "polymorphic_on": type,
         "polymorphic_identity": "party",
-        "with_polymorphic": "*",
     }
 
     party_roles: Mapped[list["PartyRole"]] = relationship(
         "PartyRole",
         back_populates="party",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
@@ -56,9 +57,11 @@ class Person(Party):
     __validator__ = PersonValidator
 
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), ForeignKey("party.id"), primary_key=True
+        PG_UUID(as_uuid=True), ForeignKey("party.id", ondelete="CASCADE"), primary_key=True
     )
     date_of_birth: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # Denormalized current state, maintained by models/person_snapshot.py
+    current_snapshot: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True, deferred=True)
 
     __mapper_args__ = {
         "polymorphic_identity": "person",
@@ -68,17 +71,21 @@ class Person(Party):
     staff_organizations: Mapped[list["OrganizationStaffAssociation"]] = relationship(
         "OrganizationStaffAssociation",
         back_populates="staff_person",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     _names_history = relationship(
-        "PersonName", back_populates="person", cascade="all, delete-orphan"
+        "PersonName", back_populates="person", cascade="all, delete-orphan", passive_deletes=True,
+        order_by="PersonName.start_date",
     )
     _gender_history = relationship(
-        "PersonGender", back_populates="person", cascade="all, delete-orphan"
+        "PersonGender", back_populates="person", cascade="all, delete-orphan", passive_deletes=True,
+        order_by="PersonGender.start_date",
     )
     _marital_status_history = relationship(
-        "MaritalStatus", back_populates="person", cascade="all, delete-orphan"
+        "MaritalStatus", back_populates="person", cascade="all, delete-orphan", passive_deletes=True,
+        order_by="MaritalStatus.start_date",
     )
 
     def __repr__(self):
@@ -86,19 +93,43 @@ class Person(Party):
 
     @hybrid_property
     def gender(self):
-        return History.current(self._gender_history)
+        current = History.current(self._gender_history)
+        return current.gender if current else None
+
+    @gender.expression
+    def gender(cls):
+        return PersonGender.current_expression(PersonGender.gender, cls.id)
 
     @hybrid_property
     def marital_status(self):
-        return History.current(self._marital_status_history)
+        current = History.current(self._marital_status_history)
+        return current.status if current else None
+
+    @marital_status.expression
+    def marital_status(cls):
+        return MaritalStatus.current_expression(MaritalStatus.status, cls.id)
 
     @hybrid_property
     def first_name(self):
-        return History.current(self._names_history, PersonNameType.FIRST)
+        current = History.current(self._names_history, "name_type", PersonNameType.FIRST)
+        return current.name if current else None
+
+    @first_name.expression
+    def first_name(cls):
+        return PersonName.current_expression(
+            PersonName.name, cls.id, PersonName.name_type == PersonNameType.FIRST
+        )
 
     @hybrid_property
     def last_name(self):
-        return History.current(self._names_history, PersonNameType.LAST)
+        current = History.current(self._names_history, "name_type", PersonNameType.LAST)
+        return current.name if current else None
+
+    @last_name.expression
+    def last_name(cls):
+        return PersonName.current_expression(
+            PersonName.name, cls.id, PersonName.name_type == PersonNameType.LAST
+        )
 
     @property
     def full_name(self):
@@ -114,7 +145,7 @@ class Organization(Party):
     __dataclass__ = OrganizationDC
 
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), ForeignKey("party.id"), primary_key=True
+        PG_UUID(as_uuid=True), ForeignKey("party.id", ondelete="CASCADE"), primary_key=True
     )
     legal_name: Mapped[str] = mapped_column(String(255), nullable=False)
     registration_number: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
@@ -128,20 +159,23 @@ class Organization(Party):
         "OrganizationToParentOrganization",
         back_populates="child_org",
         foreign_keys="OrganizationToParentOrganization.child_org_id",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     children_links: Mapped[list["OrganizationToParentOrganization"]] = relationship(
         "OrganizationToParentOrganization",
         back_populates="parent_org",
         foreign_keys="OrganizationToParentOrganization.parent_org_id",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     staff_members: Mapped[list["OrganizationStaffAssociation"]] = relationship(
         "OrganizationStaffAssociation",
         back_populates="organization",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self):
@@ -156,10 +190,10 @@ class OrganizationToParentOrganization(ServiceObject, db.Model):
     __tablename__ = "organization_to_parent_org"
 
     child_org_id: Mapped[UUID] = mapped_column(
-        ForeignKey("organization.id"), primary_key=True
+        ForeignKey("organization.id", ondelete="CASCADE"), primary_key=True
     )
     parent_org_id: Mapped[UUID] = mapped_column(
-        ForeignKey("organization.id"), primary_key=True
+        ForeignKey("organization.id", ondelete="CASCADE"), primary_key=True, index=True
     )
 
     child_org: Mapped["Organization"] = relationship(
@@ -185,10 +219,10 @@ class OrganizationStaffAssociation(ServiceObject, db.Model):
     )
 
     organization_id: Mapped[UUID] = mapped_column(
-        ForeignKey("organization.id"), primary_key=True
+        ForeignKey("organization.id", ondelete="CASCADE"), primary_key=True
     )
     staff_person_id: Mapped[UUID] = mapped_column(
-        ForeignKey("person.id"), primary_key=True
+        ForeignKey("person.id", ondelete="CASCADE"), primary_key=True, index=True
     )
 
     organization: Mapped["Organization"] = relationship(
@@ -0,0 +1,250 @@
+"""
+Denormalized current-state snapshot for Person aggregates.
+
+``person.current_snapshot`` (JSONB, deferred) holds everything needed to
+render a Person as of the last write: the party columns, the history entries
+currently in effect (one name per ``name_type``, gender, marital status) and
+the staff organizations.  :meth:`PersonStore.get_snapshot` builds the Person
+dataclass from that single column instead of joining three history tables
+and the staff associations.
+
+Maintenance happens in the flush that changes the data: an ``after_flush``
+listener collects every person touched by the flush (the Person row, its
+history children, staff associations, renamed organizations) and rebuilds
+their snapshots with one ``UPDATE`` on the flush's connection, so the
+snapshot commits or rolls back with the change itself.
+
+Snapshot reads are read-only views (:class:`PersonSnapshot`): they carry
+only the entries in effect and a trimmed staff list, so stores refuse to
+write them back (:class:`~pii.common.exceptions.ReadOnlyRecordError`).
+Re-read with :meth:`PersonStore.get` to edit.  They do carry the row's
+``version``, so a caller can still tell whether a snapshot is behind a
+later full read.
+
+A snapshot is only "current" until the next history boundary (an entry that
+starts or ends later); that instant is stored as ``valid_until`` and readers
+fall back to the normal load once it has passed.  Rows written outside the
+ORM (bulk loads, raw SQL) have no snapshot until :func:`refresh_snapshots`
+is run for them.
+
+Off by default; enable with ``DB_PERSON_SNAPSHOT`` or
+:func:`enable_snapshots`.  While disabled, snapshots are neither maintained
+nor read.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+import arrow
+from sqlalchemy import event, inspect, select, text
+from sqlalchemy.orm import Session
+
+from pii.common.abstracts.base_dataclass import RelationshipList
+from pii.database import db_config
+from pii.database.models.history import History, MaritalStatus, PersonGender, PersonName
+from pii.database.models.party import Organization, OrganizationStaffAssociation, Person
+from pii.domain.base.dataclasses import Organization as OrganizationDC, Person as PersonDC
+from pii.domain.base.history import (
+    MaritalStatus as MaritalStatusDC,
+    PersonGender as PersonGenderDC,
+    PersonName as PersonNameDC,
+)
+from pii.domain.enums import GenderType, MaritalStatusType, PersonNameType
+
+_enabled: bool = db_config.DB_PERSON_SNAPSHOT
+
+_AS_OF = "{h}.start_date <= :now AND ({h}.end_date IS NULL OR {h}.end_date > :now)"
+_NEXT_BOUNDARY = """
+    SELECT min(CASE WHEN start_date > :now THEN start_date ELSE end_date END)
+    FROM {table} WHERE person_id = p.id AND (start_date > :now OR end_date > :now)
+"""
+
+REFRESH_SQL = text(f"""
+UPDATE person AS p SET current_snapshot = jsonb_build_object(
+    'name', pa.name,
+    'version', pa.version,
+    'notes', pa.notes,
+    'date_of_birth', p.date_of_birth,
+    'names', COALESCE((
+        SELECT jsonb_agg(jsonb_build_object('name', n.name, 'name_type', n.name_type) ORDER BY n.name_type)
+        FROM (
+            SELECT DISTINCT ON (n.name_type) n.name, n.name_type
+            FROM person_name n
+            WHERE n.person_id = p.id AND {_AS_OF.format(h="n")}
+            ORDER BY n.name_type, n.start_date DESC
+        ) n
+    ), '[]'::jsonb),
+    'gender', (
+        SELECT g.gender FROM person_gender g
+        WHERE g.person_id = p.id AND {_AS_OF.format(h="g")}
+        ORDER BY g.start_date DESC LIMIT 1
+    ),
+    'marital_status', (
+        SELECT m.status FROM marital_status m
+        WHERE m.person_id = p.id AND {_AS_OF.format(h="m")}
+        ORDER BY m.start_date DESC LIMIT 1
+    ),
+    'staff_organizations', COALESCE((
+        SELECT jsonb_agg(jsonb_build_object('id', o.id, 'name', o.name) ORDER BY o.name)
+        FROM organization_staff_assoc s JOIN party o ON o.id = s.organization_id
+        WHERE s.staff_person_id = p.id
+    ), '[]'::jsonb),
+    'as_of', :now,
+    'valid_until', (
+        SELECT min(b) FROM (
+            {_NEXT_BOUNDARY.format(table="person_name")} UNION ALL
+            {_NEXT_BOUNDARY.format(table="person_gender")} UNION ALL
+            {_NEXT_BOUNDARY.format(table="marital_status")}
+        ) AS boundaries(b)
+    )
+)
+FROM party AS pa
+WHERE pa.id = p.id AND p.id = ANY(CAST(:ids AS uuid[]))
+""")
+
+STAFF_OF_ORGS_SQL = text(
+    "SELECT staff_person_id FROM organization_staff_assoc "
+    "WHERE organization_id = ANY(CAST(:ids AS uuid[]))"
+)
+
+
+def enable_snapshots(enabled: bool = True) -> None:
+    """Turn snapshot maintenance and the snapshot read path on or off."""
+    global _enabled
+    _enabled = enabled
+    install()
+
+
+def snapshots_enabled() -> bool:
+    return _enabled
+
+
+def refresh_snapshots(conn, person_ids: Iterable[Any], now: Optional[datetime] = None) -> None:
+    """Rebuild the snapshots of ``person_ids`` on ``conn`` (Connection or Session)."""
+    ids = sorted({str(pk) for pk in person_ids if pk is not None})
+    if ids:
+        conn.execute(REFRESH_SQL, {"ids": ids, "now": now or arrow.utcnow().naive})
+
+
+_PENDING_KEY = "person_snapshot_refresh"
+
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+    """
+    Staff links of organizations about to be deleted go with them through
+    ``ON DELETE CASCADE`` without passing through the session, so note the
+    affected staff while the links still exist.
+    """
+    if not _enabled:
+        return
+    org_ids = sorted(str(obj.id) for obj in session.deleted if isinstance(obj, Organization))
+    if org_ids:
+        session.info.setdefault(_PENDING_KEY, set()).update(
+            str(pk) for pk in session.connection().execute(STAFF_OF_ORGS_SQL, {"ids": org_ids}).scalars()
+        )
+
+
+def _touched_person_ids(session: Session) -> Set[str]:
+    person_ids: Set[str] = set(session.info.pop(_PENDING_KEY, ()))
+    org_ids: Set[str] = set()
+
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Person):
+            person_ids.add(obj.id)
+        elif isinstance(obj, (PersonName, PersonGender, MaritalStatus)):
+            person_ids.add(obj.person_id)
+        elif isinstance(obj, OrganizationStaffAssociation):
+            person_ids.add(obj.staff_person_id)
+        elif isinstance(obj, Organization) and obj in session.dirty \
+                and inspect(obj).attrs.name.history.has_changes():
+            org_ids.add(obj.id)
+
+    if org_ids:
+        person_ids.update(session.connection().execute(
+            STAFF_OF_ORGS_SQL, {"ids": sorted(str(pk) for pk in org_ids)}
+        ).scalars())
+    return {str(pk) for pk in person_ids if pk is not None}
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    if _enabled:
+        refresh_snapshots(session.connection(), _touched_person_ids(session))
+    else:
+        session.info.pop(_PENDING_KEY, None)
+
+
+def before_bulk_delete(session: Session, model: type, targets) -> Optional[Callable[[], None]]:
+    """
+    Delete hook for ``BaseStoreSQLAlchemy.delete``/``delete_where``, which
+    bypass the flush: refresh the persons whose history entries or staff
+    organizations are among ``targets`` (a SELECT of ids about to be deleted).
+    """
+    if not _enabled:
+        return None
+    if issubclass(model, History):
+        stmt = select(model.person_id).where(model.id.in_(targets))
+    elif issubclass(model, Organization) or issubclass(Organization, model):
+        stmt = select(OrganizationStaffAssociation.staff_person_id).where(
+            OrganizationStaffAssociation.organization_id.in_(targets)
+        )
+    else:
+        return None
+    person_ids = set(session.scalars(stmt))
+    return (lambda: refresh_snapshots(session, person_ids)) if person_ids else None
+
+
+def install() -> None:
+    """Attach the flush listeners (idempotent)."""
+    if not event.contains(Session, "before_flush", _before_flush):
+        event.listen(Session, "before_flush", _before_flush)
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+
+
+def is_fresh(snapshot: Optional[Dict[str, Any]], now: Optional[datetime] = None) -> bool:
+    if not snapshot:
+        return False
+    valid_until = snapshot.get("valid_until")
+    return valid_until is None or (now or arrow.utcnow().naive) < datetime.fromisoformat(valid_until)
+
+
+@dataclass(eq=False, slots=True)
+class PersonSnapshot(PersonDC):
+    """A Person read from its snapshot; partial, so never written back."""
+    __read_only__ = True
+
+
+def to_dataclass(pk: Any, snapshot: Dict[str, Any]) -> PersonSnapshot:
+    """
+    Build a read-only Person from a snapshot.  History collections contain
+    only the entries in effect when the snapshot was taken, and staff
+    organizations carry only ``id`` and ``name``.
+    """
+    pk = str(pk)
+    dob = snapshot.get("date_of_birth")
+    gender = snapshot.get("gender")
+    status = snapshot.get("marital_status")
+    return PersonSnapshot(
+        id=pk,
+        name=snapshot["name"],
+        version=snapshot.get("version"),
+        notes=snapshot.get("notes"),
+        date_of_birth=datetime.fromisoformat(dob) if dob else None,
+        staff_organizations=RelationshipList(
+            OrganizationDC(id=o["id"], name=o["name"]) for o in snapshot["staff_organizations"]
+        ),
+        _names_history=RelationshipList(
+            PersonNameDC(name=n["name"], name_type=PersonNameType[n["name_type"]], person_id=pk)
+            for n in snapshot["names"]
+        ),
+        _gender_history=RelationshipList(
+            [PersonGenderDC(gender=GenderType[gender], person_id=pk)] if gender else []
+        ),
+        _marital_status_history=RelationshipList(
+            [MaritalStatusDC(status=MaritalStatusType[status], person_id=pk)] if status else []
+        ),
+    )
+
+
+if _enabled:
+    install()
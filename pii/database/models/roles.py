@@ -1,6 +1,12 @@
 """
 Regenerated role models using a standalone Table for M:M associations
 and proper association_proxy for many-to-many semantics.
+
+Role relationships load lazily: eager loading pulled in the whole role
+neighbourhood, recursively, whenever a single role was read.  The role
+stores load each role's direct person/organization links (one level) so
+their dataclasses carry them; use PartyRoleStore.load_graph to fetch the
+adjacency of many roles in bulk.
 """
 from typing import Optional, TYPE_CHECKING
 from sqlalchemy.ext.declarative import declared_attr
@@ -86,7 +92,8 @@ person_role_to_organization_role = Table(
     Column(
         "organization_role_id", UUID,
         ForeignKey("party_role.id", ondelete="CASCADE"),
-        primary_key=True
+        primary_key=True,
+        index=True,
     ),
 )
 
@@ -99,10 +106,10 @@ class OrganizationManagedPersonAssociation(ServiceObject, db.Model):
     __tablename__ = "organization_managed_person_association"
 
     organization_role_id: Mapped[str] = mapped_column(
-        ForeignKey("party_role.id"), nullable=False, index=True
+        ForeignKey("party_role.id", ondelete="CASCADE"), nullable=False, index=True
     )
     person_role_id: Mapped[str] = mapped_column(
-        ForeignKey("party_role.id"), nullable=False, index=True
+        ForeignKey("party_role.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     organization_role = relationship(
@@ -132,10 +139,10 @@ class OrganizationOwnerAssociation(ServiceObject, db.Model):
     __tablename__ = "organization_owner_association"
 
     organization_role_id: Mapped[str] = mapped_column(
-        ForeignKey("party_role.id"), nullable=False, index=True
+        ForeignKey("party_role.id", ondelete="CASCADE"), nullable=False, index=True
     )
     person_role_id: Mapped[str] = mapped_column(
-        ForeignKey("party_role.id"), nullable=False, index=True
+        ForeignKey("party_role.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     organization_role = relationship(
@@ -172,7 +179,8 @@ class OrganizationRole(PartyRole):
         primaryjoin=lambda: OrganizationRole.id == person_role_to_organization_role.c.organization_role_id,
         secondaryjoin=lambda: PersonRole.id == person_role_to_organization_role.c.person_role_id,
         back_populates="organization_roles",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="select",
     )
 
     managed_person_roles = relationship(
@@ -180,14 +188,16 @@ class OrganizationRole(PartyRole):
         back_populates="organization_role",
         foreign_keys=[OrganizationManagedPersonAssociation.organization_role_id],
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="select",
     )
     organization_owner_associations = relationship(
         "OrganizationOwnerAssociation",
         back_populates="organization_role",
         foreign_keys=[OrganizationOwnerAssociation.organization_role_id],
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="select",
     )
 
 # ---------------------------------------------------------------------------
@@ -208,7 +218,8 @@ class PersonRole(PartyRole):
         primaryjoin=lambda: PersonRole.id == person_role_to_organization_role.c.person_role_id,
         secondaryjoin=lambda: OrganizationRole.id == person_role_to_organization_role.c.organization_role_id,
         back_populates="person_roles",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="select",
     )
 
     organization_managed_person_associations = relationship(
@@ -216,14 +227,16 @@ class PersonRole(PartyRole):
         back_populates="person_role",
         foreign_keys=[OrganizationManagedPersonAssociation.person_role_id],
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="select",
     )
     organization_owner_associations = relationship(
         "OrganizationOwnerAssociation",
         back_populates="person_role",
         foreign_keys=[OrganizationOwnerAssociation.person_role_id],
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="select",
     )
 
 
@@ -1,23 +1,54 @@
-from typing import Any, Dict, List, Type, Union, ClassVar, Optional, TypeVar
+from contextlib import contextmanager
+from typing import Any, Dict, List, Tuple, Type, Union, ClassVar, Optional, TypeVar
 from dataclasses import is_dataclass, asdict
 import importlib
 import pkgutil
+from sqlalchemy import delete as sql_delete, inspect, select
 from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import select
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, joinedload, selectin_polymorphic, selectinload, sessionmaker, with_polymorphic
 
 from pii.common.abstracts.base_store import BaseStore
+from pii.common.abstracts.dataclass_meta import dataclass_meta
+from pii.common.exceptions import VersionConflictError
 from pii.common.utils.filter import parse_filter_key, RecordFilter
 from pii.database.models.core.service_object import ServiceObjectDC
 from pii.database.models.core.main import db
+from pii.database.models.core.routing import ReplicaRouter, RoutingSession, primary_reads
+from pii.database.models import closure, person_snapshot
+from pii.database import db_config
+from pii.database.diagnostics.instrumentation import instrumented, conversion
 import pii.database.stores as store_pkg
 
 T = TypeVar("T")
 
+# Polymorphic loading modes accepted by ``_polymorphic_loading`` and the
+# ``polymorphic=`` argument of get/all/filter/get_by_remote_id.  A mapped
+# subclass (or a list of them) is also accepted and loads just those
+# subclasses' columns through ``with_polymorphic``.
+POLYMORPHIC_BASE = "base"          # base table only; subclass columns load on access
+POLYMORPHIC_SELECTIN = "selectin"  # one extra batched SELECT per subclass table
+POLYMORPHIC_ALL = "*"              # LEFT OUTER JOIN every subclass table
+
+# Run by delete()/delete_where() before their DELETE, as
+# ``hook(session, orm_model, targets)`` where ``targets`` selects the ids
+# about to go.  Each may return a callback to run after the DELETE, in the
+# same transaction; they keep derived tables in step where the ORM flush
+# listeners would have.
+_DELETE_HOOKS = (closure.before_bulk_delete, person_snapshot.before_bulk_delete)
+
 class BaseStoreSQLAlchemy(BaseStore):
     __abstract__ = True
     _model_to_store_registry: ClassVar[Dict[Type[ServiceObjectDC], Type["BaseStoreSQLAlchemy"]]] = {}
     _Session = db.Session
+    _polymorphic_loading: ClassVar[Any] = POLYMORPHIC_BASE
+    # Lazy collections every read loads (one batched SELECT each) so the
+    # dataclasses carry them, and how many relationship levels to_dataclass
+    # converts (None: everything loaded).  Stores whose collections link
+    # rows of the same graph cap the depth so cycles are not followed.
+    _eager_collections: ClassVar[Tuple[Any, ...]] = ()
+    _conversion_depth: ClassVar[Optional[int]] = None
 
     def __init_subclass__(cls, **kwargs):
 
@@ -28,76 +59,159 @@ class BaseStoreSQLAlchemy(BaseStore):
         super().__init_subclass__(**kwargs)
         BaseStoreSQLAlchemy._model_to_store_registry[orm_model] = cls
 
-    def __init__(self, session: Session | None = None):
+    def __init__(
+        self,
+        session: Session | None = None,
+        read_engine: Engine | None = None,
+        write_engine: Engine | None = None,
+    ):
+        """
+        :param session: Session factory to use; defaults to ``db.Session``,
+            which already routes reads per ``db_config``.
+        :param read_engine: Replica engine for ``get``/``filter``/``all``/
+            ``get_by_remote_id``. Passing either engine builds a dedicated
+            routing session factory for this store.
+        :param write_engine: Primary engine; defaults to ``db.engine``.
+        """
         if not self._model_to_store_registry:
             self._auto_discover_stores()
+        if session is None and (read_engine is not None or write_engine is not None):
+            session = self._routing_sessionmaker(write_engine or db.engine, read_engine)
         self._Session = session or db.Session
         super().__init__()
 
+    @staticmethod
+    def _routing_sessionmaker(write_engine: Engine, read_engine: Engine | None) -> sessionmaker:
+        router = ReplicaRouter(write_engine, read_engine, db_config.DB_READ_YOUR_WRITES_WINDOW)
+        return sessionmaker(class_=RoutingSession, bind=write_engine, router=router)
+
     @classmethod
     def _auto_discover_stores(cls) -> None:
         for _, module_name, is_pkg in pkgutil.iter_modules(store_pkg.__path__, store_pkg.__name__ + "."):
             if not is_pkg:
                 importlib.import_module(module_name)
 
-    def get(self, pk: Union[str, int], as_orm=False) -> Optional[T]:
+    def _polymorphic_query(self, session: Session, polymorphic: Any = None, joined: Tuple[str, ...] = ()):
+        """
+        Return ``(entity, query)`` for ``orm_model`` using the given polymorphic
+        loading mode, or the store's ``_polymorphic_loading`` when ``None``.
+        ``entity`` is what columns and relationships should be read from.
+        The query also loads the store's ``_eager_collections``, except those
+        named in ``joined`` (already joined-loaded by the caller).
+        """
+        entity, q = self._polymorphic_entity_query(session, polymorphic)
+        collections = [attr for attr in self._eager_collections if attr.key not in joined]
+        subclasses = list(dict.fromkeys(
+            attr.class_ for attr in collections if not issubclass(self.orm_model, attr.class_)
+        ))
+        if entity is self.orm_model and subclasses:
+            # Subclass collections can only be loaded through with_polymorphic.
+            entity, q = self._polymorphic_entity_query(session, subclasses)
+        options = [
+            selectinload(path) for path in (self._eager_path(entity, attr) for attr in collections)
+            if path is not None
+        ]
+        return entity, q.options(*options) if options else q
+
+    def _eager_path(self, entity: Any, attr: Any) -> Any:
+        """``attr`` as reachable from ``entity`` (the model or a ``with_polymorphic`` of it), if it is."""
+        if issubclass(self.orm_model, attr.class_):
+            return getattr(entity, attr.key)
+        for mapper in inspect(entity).with_polymorphic_mappers:
+            if issubclass(mapper.class_, attr.class_):
+                return getattr(getattr(entity, mapper.class_.__name__), attr.key)
+        return None
+
+    def _polymorphic_entity_query(self, session: Session, polymorphic: Any):
+        model = self.orm_model
+        mode = self._polymorphic_loading if polymorphic is None else polymorphic
+        subclasses = [m.class_ for m in model.__mapper__.self_and_descendants if m.class_ is not model]
+
+        if mode == POLYMORPHIC_BASE or (not subclasses and isinstance(mode, str)):
+            return model, session.query(model)
+        if mode == POLYMORPHIC_SELECTIN:
+            return model, session.query(model).options(selectin_polymorphic(model, subclasses))
+        if mode == POLYMORPHIC_ALL:
+            entity = with_polymorphic(model, "*")
+            return entity, session.query(entity)
+
+        classes = list(mode) if isinstance(mode, (list, tuple, set)) else [mode]
+        for cls in classes:
+            if not (isinstance(cls, type) and issubclass(cls, model)):
+                raise ValueError(f"Unsupported polymorphic loading {mode!r} for {model.__name__}")
+        entity = with_polymorphic(model, classes)
+        return entity, session.query(entity)
+
+    @staticmethod
+    def _filter_expressions(entity: Any, relationships: Dict[str, Any], filters: Dict[str, Any]) -> List[Any]:
+        """Translate ``field__suffix=value`` filters into SQL expressions on ``entity``."""
+        expressions = []
+        for raw_key, value in filters.items():
+            field_name, suffix = parse_filter_key(raw_key)
+            if field_name in relationships:
+                continue # Skip relationships; only filter on scalars
+
+            col = getattr(entity, field_name)
+
+            if suffix is None:
+                expr = (col == value)
+            elif suffix == RecordFilter.Suffixes.GTE.value:
+                expr = (col >= value)
+            elif suffix == RecordFilter.Suffixes.LTE.value:
+                expr = (col <= value)
+            elif suffix == RecordFilter.Suffixes.NEQ.value:
+                expr = (col != value)
+            elif suffix == RecordFilter.Suffixes.IN.value:
+                if not isinstance(value, (list, tuple, set)):
+                    raise ValueError(f"Expected iterable for '__in' filter, got {type(value)}")
+                expr = col.in_(value)
+            elif suffix == RecordFilter.Suffixes.NOTIN.value:
+                if not isinstance(value, (list, tuple, set)):
+                    raise ValueError(f"Expected iterable for '__notin' filter, got {type(value)}")
+                expr = col.notin_(value)
+            elif suffix == RecordFilter.Suffixes.CONTAINS.value:
+                expr = col.contains(value)
+            elif suffix == RecordFilter.Suffixes.NCONTAINS.value:
+                expr = ~col.contains(value)
+            else:
+                raise ValueError(f"Unsupported filter suffix __{suffix}")
+
+            if expr is None:
+                raise ValueError(f"Unsupported filter suffix '__{suffix}'")
+            expressions.append(expr)
+        return expressions
+
+    @instrumented
+    def get(self, pk: Union[str, int], as_orm=False, polymorphic: Any = None) -> Optional[T]:
         with self._Session() as session:
-            q = session.query(self._model)
-            for rel in self._model.__mapper__.relationships:
-                if rel.uselist:
-                    q = q.options(joinedload(getattr(self._model, rel.key)))
+            collections = tuple(rel.key for rel in self.orm_model.__mapper__.relationships if rel.uselist)
+            entity, q = self._polymorphic_query(session, polymorphic, joined=collections)
+            for key in collections:
+                q = q.options(joinedload(getattr(entity, key)))
             try:
-                orm = q.filter(getattr(self._model, self._pk) == pk).one()
+                orm = q.filter(getattr(entity, self.pk_field) == pk).one()
                 if as_orm:
                     return orm
                 return self.to_dataclass(orm)
             except NoResultFound:
                 return None
 
-    def all(self) -> List[T]:
+    @instrumented
+    def all(self, polymorphic: Any = None) -> List[T]:
         with self._Session() as session:
-            results = session.query(self.orm_model).order_by(self.orm_model.date_created.asc()).all()
+            entity, q = self._polymorphic_query(session, polymorphic)
+            results = q.order_by(entity.date_created.asc()).all()
             return [self.to_dataclass(obj) for obj in results]
 
-    def filter(self, **kwargs) -> List[T]:
+    @instrumented
+    def filter(self, polymorphic: Any = None, **kwargs) -> List[T]:
         with self._Session() as session:
-            q = session.query(self.orm_model)
-
-            for raw_key, value in kwargs.items():
-                field_name, suffix = parse_filter_key(raw_key)
-                if field_name in self.orm_model.relationship_map():
-                    continue # Skip relationships; only filter on scalars
-
-                col = getattr(self.orm_model, field_name)
-
-                if suffix is None:
-                    expr = (col == value)
-                elif suffix == RecordFilter.Suffixes.GTE.value:
-                    expr = (col >= value)
-                elif suffix == RecordFilter.Suffixes.LTE.value:
-                    expr = (col <= value)
-                elif suffix == RecordFilter.Suffixes.NEQ.value:
-                    expr = (col != value)
-                elif suffix == RecordFilter.Suffixes.IN.value:
-                    if not isinstance(value, (list, tuple, set)):
-                        raise ValueError(f"Expected iterable for '__in' filter, got {type(value)}")
-                    expr = col.in_(value)
-                elif suffix == RecordFilter.Suffixes.NOTIN.value:
-                    if not isinstance(value, (list, tuple, set)):
-                        raise ValueError(f"Expected iterable for '__notin' filter, got {type(value)}")
-                    expr = col.notin_(value)
-                elif suffix == RecordFilter.Suffixes.CONTAINS.value:
-                    expr = col.contains(value)
-                elif suffix == RecordFilter.Suffixes.NCONTAINS.value:
-                    expr = ~col.contains(value)
-                else:
-                    raise ValueError(f"Unsupported filter suffix __{suffix}")
-
-                if expr is None:
-                    raise ValueError(f"Unsupported filter suffix '__{suffix}'")
+            entity, q = self._polymorphic_query(session, polymorphic)
+            for expr in self._filter_expressions(entity, self.orm_model.relationship_map(), kwargs):
                 q = q.filter(expr)
             return [self.to_dataclass(o) for o in q.all()]
 
+    @instrumented
     def _insert(self, dc: T) -> T:
         orm_model = self.orm_model.from_dataclass(dc)
 
@@ -107,70 +221,178 @@ class BaseStoreSQLAlchemy(BaseStore):
             session.refresh(orm_model)
             return self.to_dataclass(orm_model)
 
+    @property
+    def _version_key(self) -> Optional[str]:
+        """Attribute holding the optimistic-concurrency version, if the model is versioned."""
+        col = self.orm_model.__mapper__.version_id_col
+        return col.key if col is not None else None
+
+    def _check_version(self, existing: Any, expected: Optional[int]) -> None:
+        """Fail fast when the caller's version is not the one stored."""
+        key = self._version_key
+        if key is None or expected is None:
+            return
+        actual = getattr(existing, key)
+        if actual != expected:
+            raise VersionConflictError(self.orm_model.__name__, getattr(existing, self.pk_field), expected, actual)
+
+    @contextmanager
+    def _version_conflicts(self, session: Session, pk: Any, expected: Optional[int]):
+        """Report a race lost on the version column (at any flush) as a conflict."""
+        try:
+            yield
+        except StaleDataError as exc:
+            session.rollback()
+            raise VersionConflictError(self.orm_model.__name__, pk, expected) from exc
+
+    def _write_data(self, dc: Any) -> Dict[str, Any]:
+        """
+        Values to write for ``dc``: every field, or – for a loaded dataclass
+        that tracks changes and had only column fields changed – just those.
+        Relationship collections are not columns and are not written back;
+        changing one on a loaded record is an error rather than a silent no-op.
+        """
+        self._reject_read_only(dc)
+        changed = self._changed_fields(dc)
+        if changed is None:
+            return asdict(dc)
+        relationships = sorted(changed & dataclass_meta(dc).relationships.keys())
+        if relationships:
+            raise ValueError(
+                f"{type(dc).__name__} {getattr(dc, self.pk_field, None)}: relationship fields "
+                f"{relationships} changed; write them through their own stores"
+            )
+        data = {k: getattr(dc, k) for k in changed}
+        if any(is_dataclass(v) or isinstance(v, (list, dict)) for v in data.values()):
+            # Nested values go through asdict() exactly as a full write would.
+            full = asdict(dc)
+            data = {k: full[k] for k in changed}
+        data[self.pk_field] = getattr(dc, self.pk_field, None)
+        return data
+
+    @instrumented
     def _patch(self, obj: Union[Dict, Any]) -> T:
         dc = self.to_dataclass(obj)
-        patch_data = asdict(dc)
-        pk_val = patch_data.get(self._pk)
+        patch_data = self._write_data(dc)
+        pk_val = patch_data.get(self.pk_field)
         if not pk_val:
-            raise ValueError(f"Missing primary key '{self._pk}' in patch data")
-
-        with self._Session() as session:
-            existing = session.get(self._model, pk_val)
+            raise ValueError(f"Missing primary key '{self.pk_field}' in patch data")
+
+        version_key = self._version_key
+        expected = getattr(dc, version_key, None) if version_key else None
+        patch_data.pop(version_key, None)
+        # Read-modify-write: the row must come from the primary, never a
+        # lagging replica (lost writes, false conflicts, duplicate inserts).
+        with primary_reads(), self._Session() as session:
+            existing = session.get(self.orm_model, pk_val)
             if not existing:
-                raise ValueError(f"{self._model.__name__} with {self._pk}={pk_val!r} not found")
-
-            for k, v in patch_data.items():
-                if k != self._pk and hasattr(existing, k):
-                    setattr(existing, k, v)
-
-            session.commit()
+                raise ValueError(f"{self.orm_model.__name__} with {self.pk_field}={pk_val!r} not found")
+            self._check_version(existing, expected)
+            if patch_data.keys() <= {self.pk_field}:
+                return self.to_dataclass(existing)
+
+            with self._version_conflicts(session, pk_val, expected):
+                for k, v in patch_data.items():
+                    if k != self.pk_field and hasattr(existing, k):
+                        setattr(existing, k, v)
+                session.commit()
             session.refresh(existing)
             return self.to_dataclass(existing)
 
+    @instrumented
     def _update(self, obj: Union[Dict, Any]) -> T:
         dc = self.to_dataclass(obj)
-        pk_val = getattr(dc, self._pk, None)
+        pk_val = getattr(dc, self.pk_field, None)
         if not pk_val:
             return self._insert(dc)
 
-        with self._Session() as session:
-            existing = session.get(self._model, pk_val)
+        version_key = self._version_key
+        data = self._write_data(dc)
+        expected = getattr(dc, version_key, None) if version_key else None
+        data.pop(version_key, None)
+        with primary_reads(), self._Session() as session:
+            existing = session.get(self.orm_model, pk_val)
             if not existing:
                 return self._insert(dc)
-
-            for k, v in asdict(dc).items():
-                if hasattr(existing, k):
-                    setattr(existing, k, v)
-
-            session.commit()
+            self._check_version(existing, expected)
+            if data.keys() <= {self.pk_field}:
+                return self.to_dataclass(existing)
+
+            with self._version_conflicts(session, pk_val, expected):
+                for k, v in data.items():
+                    if hasattr(existing, k):
+                        setattr(existing, k, v)
+                session.commit()
             session.refresh(existing)
             return self.to_dataclass(existing)
 
-    def delete(self, pk: Union[str, int]) -> None:
-        with self._Session() as session:
-            instance = session.get(self._model, pk)
-            if instance:
-                session.delete(instance)
-                session.commit()
-
-    def get_by_remote_id(self, remote_id: Any, pk: str = "remote_id") -> Optional[T]:
-        field = getattr(self._model, pk, None)
-        if field is None:
-            raise KeyError(f"{pk!r} not found in model {self._model.__name__}")
-        stmt = select(self._model).where(field == remote_id)
+    def _delete_rows(self, criteria: List[Any]) -> int:
+        """
+        Delete every ``orm_model`` row matching ``criteria`` with one DELETE on
+        the base table.  Subclass rows, history, links and roles go with it
+        through ``ON DELETE CASCADE``; nothing is loaded into the session.
+        """
+        model = self.orm_model
+        table = model.__mapper__.base_mapper.local_table
+        pk_col = table.c[self.pk_field]
+        targets = select(getattr(model, self.pk_field)).where(*criteria)
+
+        with primary_reads(), self._Session() as session:
+            after = [callback for hook in _DELETE_HOOKS if (callback := hook(session, model, targets))]
+            deleted = session.scalars(
+                sql_delete(table).where(pk_col.in_(targets)).returning(pk_col)
+            ).all()
+            for callback in after:
+                callback()
+            session.commit()
+        return len(deleted)
+
+    @instrumented
+    def delete(self, pk: Union[str, int]) -> bool:
+        return self._delete_rows([getattr(self.orm_model, self.pk_field) == pk]) > 0
+
+    @instrumented
+    def delete_where(self, **filters) -> int:
+        """
+        Delete every record matching ``filters`` (same syntax as
+        :meth:`filter`) in a single statement; returns the number deleted.
+        """
+        if not filters:
+            raise ValueError("delete_where() requires at least one filter")
+        # filter() skips relationship keys; here a skipped key would widen
+        # the DELETE, so anything that is not a mapped column is an error.
+        columns = self.orm_model.__mapper__.columns.keys()
+        unusable = [key for key in filters if parse_filter_key(key)[0] not in columns]
+        if unusable:
+            raise ValueError(f"delete_where() can only filter on columns, got {unusable!r}")
+        criteria = self._filter_expressions(self.orm_model, self.orm_model.relationship_map(), filters)
+        if not criteria:
+            raise ValueError("delete_where() produced no criteria")
+        return self._delete_rows(criteria)
+
+    @instrumented
+    def get_by_remote_id(self, remote_id: Any, pk: str = "remote_id", polymorphic: Any = None) -> Optional[T]:
+        if getattr(self.orm_model, pk, None) is None:
+            raise KeyError(f"{pk!r} not found in model {self.orm_model.__name__}")
         with self._Session() as session:
-            result = session.execute(stmt).unique().scalar_one_or_none()
+            entity, q = self._polymorphic_query(session, polymorphic)
+            result = q.filter(getattr(entity, pk) == remote_id).one_or_none()
         return self.to_dataclass(result) if result else None
 
+    @conversion
     def to_dataclass(self, model_instance: Any) -> T:
         if is_dataclass(model_instance):
             return model_instance
         if hasattr(model_instance, "to_dataclass"):
-            return model_instance.to_dataclass()
+            return model_instance.to_dataclass(self._conversion_depth)
         raise TypeError(f"Cannot convert {type(model_instance).__name__} to dataclass")
 
 
 
+    @instrumented
+    def put(self, obj: Any) -> Any:
+        return super().put(obj)
+
     @classmethod
     def get_store_for(cls, target: Any) -> "BaseStoreSQLAlchemy":
         if not cls._model_to_store_registry:
@@ -1,5 +1,8 @@
+from datetime import datetime
+from collections import defaultdict
 from pii.database.store_adapters.sqlalchemy_store import BaseStoreSQLAlchemy
-from typing import TypeVar
+from pii.database.diagnostics.instrumentation import instrumented
+from typing import Any, Dict, Iterable, List, Optional, TypeVar
 
 from pii.database.models.history import (
     PersonName,
@@ -10,23 +13,42 @@ from pii.database.models.history import (
 
 T = TypeVar('T')
 
-class PersonNameStore(BaseStoreSQLAlchemy):
+class HistoryStoreMixin:
+    """
+    Point-in-time reads for stores over :class:`History` models.
+    """
+
+    @instrumented
+    def as_of(self, person_ids: Iterable[Any], at: Optional[datetime] = None) -> Dict[str, List[T]]:
+        """
+        Entries in effect at ``at`` (default: now) for every person in
+        ``person_ids``, fetched in a single query and keyed by person id.
+        Persons with no entry in effect are absent from the result.
+        """
+        result: Dict[str, List[T]] = defaultdict(list)
+        with self._Session() as session:
+            for orm in session.scalars(self.orm_model.as_of_query(person_ids, at)):
+                result[str(orm.person_id)].append(self.to_dataclass(orm))
+        return dict(result)
+
+
+class PersonNameStore(HistoryStoreMixin, BaseStoreSQLAlchemy):
     """
     DB-based store for PersonName entities.
     """
     _orm_model = PersonName
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
 
 
-class PersonGenderStore(BaseStoreSQLAlchemy):
+class PersonGenderStore(HistoryStoreMixin, BaseStoreSQLAlchemy):
     """
     DB-based store for PersonGender entities.
     """
     _orm_model = PersonGender
 
-class MaritalStatusStore(BaseStoreSQLAlchemy):
+class MaritalStatusStore(HistoryStoreMixin, BaseStoreSQLAlchemy):
     """
     DB-based store for MaritalStatus entities.
     """
-    _orm_model = MaritalStatus
\ No newline at end of file
+    _orm_model = MaritalStatus
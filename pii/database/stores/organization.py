@@ -1,7 +1,17 @@
 from pii.database.store_adapters.sqlalchemy_store import BaseStoreSQLAlchemy
-from typing import Any, Optional, TypeVar
+from typing import Any, List, Optional, TypeVar
 
-from pii.database.models.party import Organization
+from sqlalchemy import Integer, all_, false, func, literal, select
+from sqlalchemy.dialects.postgresql import UUID, array
+
+from pii.database.diagnostics.instrumentation import instrumented
+from pii.database.models import closure
+from pii.database.models.party import (
+    Organization,
+    OrganizationStaffAssociation,
+    OrganizationToParentOrganization,
+    Person,
+)
 
 
 T = TypeVar('T')
@@ -9,5 +19,98 @@ T = TypeVar('T')
 class OrganizationStore(BaseStoreSQLAlchemy):
     _orm_model = Organization
 
-    def __init__(self):
-        super().__init__()
\ No newline at end of file
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    # ------------------------------------------------------------------
+    #  Hierarchy traversal
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _hierarchy_cte(org_id: Any, upwards: bool, max_depth: Optional[int] = None):
+        """
+        ``WITH RECURSIVE`` over organization_to_parent_org yielding ``(id, depth)``
+        for every org reachable from ``org_id`` (parents when ``upwards``,
+        children otherwise). The visited path is carried along so cycles in
+        the link table terminate instead of recursing forever.
+        """
+        link = OrganizationToParentOrganization.__table__.c
+        start, step = (link.child_org_id, link.parent_org_id) if upwards else (link.parent_org_id, link.child_org_id)
+
+        seed = select(
+            step.label("id"),
+            literal(1, Integer).label("depth"),
+            array([start, step]).label("path"),
+        ).where(start == org_id)
+        if max_depth is not None and max_depth < 1:
+            # The seed is already depth 1; as with the closure table, nothing qualifies.
+            seed = seed.where(false())
+        walk = seed.cte("org_hierarchy", recursive=True)
+
+        recurse = (
+            select(
+                step,
+                walk.c.depth + 1,
+                walk.c.path.op("||")(step),
+            )
+            .join_from(walk, OrganizationToParentOrganization.__table__, start == walk.c.id)
+            .where(step != all_(walk.c.path))
+        )
+        if max_depth is not None:
+            recurse = recurse.where(walk.c.depth < max_depth)
+        walk = walk.union_all(recurse)
+
+        return (
+            select(walk.c.id, func.min(walk.c.depth).label("depth"))
+            .group_by(walk.c.id)
+            .subquery("org_hierarchy_depth")
+        )
+
+    @classmethod
+    def _hierarchy(cls, org_id: Any, upwards: bool, max_depth: Optional[int] = None):
+        """``(id, depth)`` of the orgs above/below ``org_id``; from the closure table when enabled."""
+        if not closure.closure_enabled():
+            return cls._hierarchy_cte(org_id, upwards, max_depth)
+        c = closure.organization_closure.c
+        start, step = (c.descendant_id, c.ancestor_id) if upwards else (c.ancestor_id, c.descendant_id)
+        stmt = select(step.label("id"), c.depth).where(start == org_id)
+        if max_depth is not None:
+            stmt = stmt.where(c.depth <= max_depth)
+        return stmt.subquery("org_hierarchy_depth")
+
+    def _orgs_in(self, hierarchy) -> List[T]:
+        stmt = (
+            select(Organization)
+            .join(hierarchy, Organization.id == hierarchy.c.id)
+            .order_by(hierarchy.c.depth, Organization.name)
+        )
+        with self._Session() as session:
+            return [self.to_dataclass(org) for org in session.scalars(stmt)]
+
+    @instrumented
+    def ancestors(self, org_id: Any, max_depth: Optional[int] = None) -> List[T]:
+        """All parent organizations of ``org_id``, nearest first, in one query."""
+        return self._orgs_in(self._hierarchy(org_id, upwards=True, max_depth=max_depth))
+
+    @instrumented
+    def descendants(self, org_id: Any, max_depth: Optional[int] = None) -> List[T]:
+        """All organizations below ``org_id`` down to ``max_depth`` levels, nearest first."""
+        return self._orgs_in(self._hierarchy(org_id, upwards=False, max_depth=max_depth))
+
+    @instrumented
+    def subtree_staff(self, org_id: Any) -> List[Any]:
+        """Distinct staff of ``org_id`` and every organization below it, in one query."""
+        below = self._hierarchy(org_id, upwards=False)
+        org_ids = select(below.c.id).union(select(literal(org_id, UUID)))
+        staff_ids = (
+            select(OrganizationStaffAssociation.staff_person_id)
+            .where(OrganizationStaffAssociation.organization_id.in_(org_ids))
+        )
+        stmt = select(Person).where(Person.id.in_(staff_ids)).order_by(Person.name)
+        with self._Session() as session:
+            return [person.to_dataclass() for person in session.scalars(stmt)]
+
+    @instrumented
+    def is_ancestor(self, ancestor_id: Any, org_id: Any) -> bool:
+        """Whether ``ancestor_id`` is above ``org_id``; a single index lookup with closure tables."""
+        with self._Session() as session:
+            return closure.is_ancestor(session, closure.ORGANIZATION_GRAPH, ancestor_id, org_id)
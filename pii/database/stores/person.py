@@ -1,6 +1,10 @@
-from pii.database.store_adapters.sqlalchemy_store import BaseStoreSQLAlchemy
+from pii.database.store_adapters.sqlalchemy_store import BaseStoreSQLAlchemy, POLYMORPHIC_SELECTIN
 from typing import Any, Optional, TypeVar
 
+from sqlalchemy import select
+
+from pii.database.diagnostics.instrumentation import instrumented
+from pii.database.models import person_snapshot
 from pii.database.models.party import Person, Party
 
 
@@ -8,12 +12,31 @@ T = TypeVar('T')
 
 class PartyStore(BaseStoreSQLAlchemy):
     _orm_model = Party
+    # Parties are mostly read as full Person / Organization dataclasses, so
+    # fetch subclass columns in one batched query per subclass instead of
+    # outer-joining every subclass table.
+    _polymorphic_loading = POLYMORPHIC_SELECTIN
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
 
 class PersonStore(BaseStoreSQLAlchemy):
     _orm_model = Person
 
-    def __init__(self):
-        super().__init__()
\ No newline at end of file
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    @instrumented
+    def get_snapshot(self, pk: Any) -> Optional[T]:
+        """
+        Read a Person from its denormalized ``current_snapshot`` in a single
+        statement, falling back to :meth:`get` when snapshots are disabled or
+        the snapshot is missing or has outlived its ``valid_until``.
+        """
+        if not person_snapshot.snapshots_enabled():
+            return self.get(pk)
+        with self._Session() as session:
+            snapshot = session.scalar(select(Person.current_snapshot).where(Person.id == pk))
+        if not person_snapshot.is_fresh(snapshot):
+            return self.get(pk)
+        return person_snapshot.to_dataclass(pk, snapshot)
@@ -1,17 +1,132 @@
 from pii.database.store_adapters.sqlalchemy_store import BaseStoreSQLAlchemy
-from typing import TypeVar
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple, TypeVar
 
-from pii.database.models.roles import PartyRole, OrganizationRole, SystemRole, PersonRole
+from sqlalchemy import or_, select
+
+from pii.database.diagnostics.instrumentation import instrumented
+from pii.database.models import closure
+from pii.database.models.roles import (
+    OrganizationManagedPersonAssociation,
+    OrganizationOwnerAssociation,
+    OrganizationRole,
+    PartyRole,
+    PersonRole,
+    SystemRole,
+    person_role_to_organization_role,
+)
 
 
 T = TypeVar('T')
+
+
+class RoleGraph:
+    """
+    In-memory adjacency between organization roles and person roles, as
+    loaded by :meth:`PartyRoleStore.load_graph`.  Every edge points from an
+    organization role to a person role and has a kind:
+
+    * ``MEMBER``  -- person_role_to_organization_role
+    * ``MANAGED`` -- OrganizationManagedPersonAssociation
+    * ``OWNER``   -- OrganizationOwnerAssociation
+    """
+    MEMBER = "member"
+    MANAGED = "managed"
+    OWNER = "owner"
+    KINDS = (MEMBER, MANAGED, OWNER)
+
+    def __init__(self, role_ids: Iterable[Any] = ()):
+        self.role_ids = frozenset(str(pk) for pk in role_ids)
+        self.roles: Dict[str, T] = {}
+        self._down: Dict[str, Dict[str, Set[str]]] = {kind: defaultdict(set) for kind in self.KINDS}
+        self._up: Dict[str, Dict[str, Set[str]]] = {kind: defaultdict(set) for kind in self.KINDS}
+
+    def add_edge(self, kind: str, organization_role_id: Any, person_role_id: Any) -> None:
+        org_role, person_role = str(organization_role_id), str(person_role_id)
+        self._down[kind][org_role].add(person_role)
+        self._up[kind][person_role].add(org_role)
+
+    def edges(self, kind: Optional[str] = None) -> Iterator[Tuple[str, str, str]]:
+        """``(kind, organization_role_id, person_role_id)`` for every loaded edge."""
+        for k in (kind,) if kind else self.KINDS:
+            for org_role, person_roles in self._down[k].items():
+                for person_role in sorted(person_roles):
+                    yield k, org_role, person_role
+
+    def person_roles(self, organization_role_id: Any, kind: str = MEMBER) -> Set[str]:
+        return set(self._down[kind].get(str(organization_role_id), ()))
+
+    def organization_roles(self, person_role_id: Any, kind: str = MEMBER) -> Set[str]:
+        return set(self._up[kind].get(str(person_role_id), ()))
+
+    def neighbours(self, role_id: Any) -> Set[str]:
+        """Every role linked to ``role_id`` by an edge of any kind, in either direction."""
+        pk = str(role_id)
+        return {
+            other
+            for kind in self.KINDS
+            for other in (*self._down[kind].get(pk, ()), *self._up[kind].get(pk, ()))
+        }
+
+    def node_ids(self) -> Set[str]:
+        """The requested roles plus everything adjacent to them."""
+        return set(self.role_ids).union(*(self.neighbours(pk) for pk in self.role_ids))
+
 class PartyRoleStore(BaseStoreSQLAlchemy):
     """
     DB-based store for PartyRole entities.
     """
     _orm_model = PartyRole
-    def __init__(self):
-        super().__init__()
+    _eager_collections = (PersonRole.organization_roles, OrganizationRole.person_roles)
+    _conversion_depth = 1
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    @instrumented
+    def is_ancestor(self, ancestor_id: Any, role_id: Any) -> bool:
+        """
+        Whether role ``ancestor_id`` is above ``role_id`` through organization
+        links or managed-person associations.
+        """
+        with self._Session() as session:
+            return closure.is_ancestor(session, closure.ROLE_GRAPH, ancestor_id, role_id)
+
+    # (kind, organization-role column, person-role column) per association table
+    _GRAPH_EDGES = (
+        (RoleGraph.MEMBER,
+         person_role_to_organization_role.c.organization_role_id,
+         person_role_to_organization_role.c.person_role_id),
+        (RoleGraph.MANAGED,
+         OrganizationManagedPersonAssociation.organization_role_id,
+         OrganizationManagedPersonAssociation.person_role_id),
+        (RoleGraph.OWNER,
+         OrganizationOwnerAssociation.organization_role_id,
+         OrganizationOwnerAssociation.person_role_id),
+    )
+
+    @instrumented
+    def load_graph(self, role_ids: Iterable[Any], with_roles: bool = False) -> RoleGraph:
+        """
+        Adjacency of ``role_ids`` (in both directions) with one query per
+        association table, instead of walking the role relationships one
+        role at a time.  With ``with_roles`` the requested roles and their
+        neighbours are fetched as dataclasses in one more query, into
+        :attr:`RoleGraph.roles`.
+        """
+        graph = RoleGraph(role_ids)
+        ids = sorted(graph.role_ids)
+        if not ids:
+            return graph
+        with self._Session() as session:
+            for kind, org_col, person_col in self._GRAPH_EDGES:
+                stmt = select(org_col, person_col).where(or_(org_col.in_(ids), person_col.in_(ids)))
+                for org_role, person_role in session.execute(stmt):
+                    graph.add_edge(kind, org_role, person_role)
+            if with_roles:
+                stmt = select(PartyRole).where(PartyRole.id.in_(sorted(graph.node_ids())))
+                graph.roles = {str(role.id): self.to_dataclass(role) for role in session.scalars(stmt)}
+        return graph
 
 
 class PersonRoleStore(BaseStoreSQLAlchemy):
@@ -19,8 +134,11 @@ class PersonRoleStore(BaseStoreSQLAlchemy):
     DB-based store for PersonRole entities.
     """
     _orm_model = PersonRole
-    def __init__(self):
-        super().__init__()
+    _eager_collections = (PersonRole.organization_roles,)
+    _conversion_depth = 1
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
 
 
 class OrganizationRoleStore(BaseStoreSQLAlchemy):
@@ -28,9 +146,13 @@ class OrganizationRoleStore(BaseStoreSQLAlchemy):
     DB-based store for OrgRole entities.
     """
     _orm_model = OrganizationRole
+    _eager_collections = (OrganizationRole.person_roles,)
+    _conversion_depth = 1
 
 class SystemRoleStore(BaseStoreSQLAlchemy):
     """
     DB-based store for SystemRole entities.
     """
-    _orm_model = SystemRole
\ No newline at end of file
+    _orm_model = SystemRole
+    _eager_collections = (SystemRole.organization_roles,)
+    _conversion_depth = 1
\ No newline at end of file
@@ -0,0 +1,148 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from pii.database.diagnostics.instrumentation import capture_store_stats
+from pii.database.diagnostics.query_plan import capture_statements
+from pii.database.models import closure, person_snapshot
+from pii.database.models.history import PersonGender, PersonName
+from pii.database.models.party import (
+    Organization,
+    OrganizationStaffAssociation,
+    OrganizationToParentOrganization,
+    Party,
+    Person,
+)
+from pii.database.models.roles import PartyRole, PersonRole
+from pii.database.stores.history import PersonNameStore
+from pii.database.stores.organization import OrganizationStore
+from pii.database.stores.person import PersonStore
+from pii.domain.enums import GenderType, PersonNameType
+
+PAST = datetime(2000, 1, 1)
+
+
+def _person(session, name="Ada", org=None):
+    person = Person(id=str(uuid4()), name=name)
+    person._names_history.extend([
+        PersonName(name=name, name_type=PersonNameType.FIRST, start_date=PAST),
+        PersonName(name="Lovelace", name_type=PersonNameType.LAST, start_date=PAST),
+    ])
+    person._gender_history.append(PersonGender(gender=GenderType.FEMALE, start_date=PAST))
+    session.add(person)
+    session.flush()
+    session.add(PersonRole(party_id=person.id))
+    if org is not None:
+        session.add(OrganizationStaffAssociation(organization_id=org.id, staff_person_id=person.id))
+    session.commit()
+    return str(person.id)
+
+
+def _org(session, name, parent=None):
+    org = Organization(id=str(uuid4()), name=name, legal_name=f"{name} ltd")
+    session.add(org)
+    session.flush()
+    if parent is not None:
+        session.add(OrganizationToParentOrganization(child_org_id=org.id, parent_org_id=parent.id))
+    session.commit()
+    return org
+
+
+def _count(session, column, pk):
+    return session.scalar(select(func.count()).where(column == pk))
+
+
+def test_delete_is_one_statement_and_cascades(session):
+    org = _org(session, "Acme")
+    pk = _person(session, org=org)
+
+    with capture_store_stats() as capture:
+        assert PersonStore().delete(pk) is True
+    assert capture.statement_count == 1
+
+    for column in (Party.id, Person.id, PersonName.person_id, PersonGender.person_id,
+                   PartyRole.party_id, OrganizationStaffAssociation.staff_person_id):
+        assert _count(session, column, pk) == 0
+    assert _count(session, Organization.id, org.id) == 1
+
+
+def test_delete_missing_returns_false():
+    assert PersonStore().delete(str(uuid4())) is False
+
+
+def test_delete_only_within_store_model(session):
+    org = _org(session, "Acme")
+    assert PersonStore().delete(org.id) is False
+    assert _count(session, Organization.id, org.id) == 1
+
+
+def test_delete_where(session):
+    ada, grace = _person(session, "Ada"), _person(session, "Grace")
+
+    with capture_store_stats() as capture:
+        assert PersonNameStore().delete_where(name_type=PersonNameType.LAST, person_id=ada) == 1
+    assert capture.statement_count == 1
+    assert PersonNameStore().delete_where(name__in=["Ada", "Grace"]) == 2
+    assert [n.name for n in PersonNameStore().filter(person_id=grace)] == ["Lovelace"]
+
+    with pytest.raises(ValueError):
+        PersonStore().delete_where()
+
+
+@pytest.mark.parametrize("filters", [{"party_roles": []}, {"staff_organizations__in": [[]]}, {"no_such_field": 1}])
+def test_delete_where_rejects_non_column_filters(session, filters):
+    pk = _person(session)
+    with pytest.raises(ValueError):
+        PersonStore().delete_where(**filters)
+    assert _count(session, Person.id, pk) == 1
+
+
+def test_orm_delete_does_not_load_children(session):
+    pk = _person(session)
+    person = session.get(Person, pk)
+    session.expire(person)
+
+    with capture_statements() as captured:
+        session.delete(person)
+        session.commit()
+    assert not any("person_name" in c.statement or "party_role" in c.statement for c in captured)
+    assert _count(session, PersonName.person_id, pk) == 0
+
+
+def _snapshot(session, pk):
+    return session.scalar(select(Person.current_snapshot).where(Person.id == pk))
+
+
+def test_delete_keeps_closure_and_snapshots_current(session):
+    closure.enable_closure(True)
+    person_snapshot.enable_snapshots(True)
+    try:
+        root = _org(session, "root")
+        mid = _org(session, "mid", parent=root)
+        leaf = _org(session, "leaf", parent=mid)
+        pk = _person(session, org=mid)
+        root_id, leaf_id = root.id, leaf.id
+
+        assert OrganizationStore().is_ancestor(root_id, leaf_id)
+        assert [o["name"] for o in _snapshot(session, pk)["staff_organizations"]] == ["mid"]
+
+        assert OrganizationStore().delete(mid.id)
+        assert not OrganizationStore().is_ancestor(root_id, leaf_id)
+        assert _snapshot(session, pk)["staff_organizations"] == []
+    finally:
+        closure.enable_closure(False)
+        person_snapshot.enable_snapshots(False)
+
+
+def test_orm_org_delete_refreshes_staff_snapshots(session):
+    person_snapshot.enable_snapshots(True)
+    try:
+        org = _org(session, "Acme")
+        pk = _person(session, org=org)
+        session.delete(org)
+        session.commit()
+        assert _snapshot(session, pk)["staff_organizations"] == []
+    finally:
+        person_snapshot.enable_snapshots(False)
@@ -0,0 +1,114 @@
+from dataclasses import fields
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from pii.database.models.history import PersonName
+from pii.database.models.party import Person
+from pii.database.stores.person import PersonStore
+from pii.domain.base.dataclasses import Person as PersonDC
+from pii.domain.base.history import PersonName as PersonNameDC
+from pii.domain.enums import PersonNameType
+
+
+@pytest.fixture
+def updates(engine):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("UPDATE"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+def test_put_writes_only_changed_columns(updates):
+    store = PersonStore()
+    person = store.get(store.put(PersonDC(name="Ada", notes="kept")).id)
+    assert person.dirty_fields() == frozenset()
+
+    person.name = "Ada Lovelace"
+    assert person.dirty_fields() == {"name"}
+    saved = store.put(person)
+
+    assert len(updates) == 1
+    set_clause = _set_clause(updates[0])
+    assert "name" in set_clause and "notes" not in set_clause
+    assert (saved.name, saved.notes, saved.version) == ("Ada Lovelace", "kept", 2)
+
+
+def test_unchanged_put_issues_no_update(updates):
+    store = PersonStore()
+    person = store.get(store.put(PersonDC(name="Ada")).id)
+
+    saved = store.put(person)
+    assert updates == []
+    assert saved.version == person.version == 1
+
+
+def test_hand_built_instance_writes_every_field(updates):
+    store = PersonStore()
+    created = store.put(PersonDC(name="Ada", notes="old"))
+    replacement = PersonDC(id=created.id, name="Ada", version=created.version)
+    assert replacement.dirty_fields() is None
+
+    assert store.put(replacement).notes is None
+    assert len(updates) == 1
+
+
+def _set_clause(statement):
+    return statement.split(" SET ", 1)[1].split(" WHERE ", 1)[0]
+
+
+def test_person_with_history_writes_only_changed_columns(session, updates):
+    store = PersonStore()
+    pk = store.put(PersonDC(name="Ada", notes="kept")).id
+    row = session.get(Person, pk)
+    row._names_history.append(
+        PersonName(name="Ada", name_type=PersonNameType.FIRST, start_date=datetime(2000, 1, 1))
+    )
+    session.commit()
+    updates.clear()
+
+    person = store.get(pk)
+    assert [n.name for n in person._names_history] == ["Ada"]
+    assert person.dirty_fields() == frozenset()
+
+    person.name = "Ada Lovelace"
+    saved = store.put(person)
+
+    assert len(updates) == 1
+    assert "notes" not in _set_clause(updates[0])
+    assert (saved.name, saved.notes, saved.version) == ("Ada Lovelace", "kept", 2)
+    reread = store.get(pk)
+    assert [n.name for n in reread._names_history] == ["Ada"]
+
+    updates.clear()
+    assert store.put(reread).version == 2
+    assert updates == []
+
+
+def test_append_then_put_is_not_a_silent_no_op(updates):
+    store = PersonStore()
+    person = store.get(store.put(PersonDC(name="Ada")).id)
+    person._names_history.append(PersonNameDC(name="Ada", name_type=PersonNameType.FIRST, person_id=person.id))
+    assert person.dirty_fields() == {"_names_history"}
+
+    with pytest.raises(ValueError, match="_names_history"):
+        store.put(person)
+    assert updates == []
+    assert store.get(person.id)._names_history == []
+
+
+def test_trusted_copy_is_not_treated_as_clean(updates):
+    store = PersonStore()
+    loaded = store.get(store.put(PersonDC(name="Ada")).id)
+    copy = PersonDC.from_trusted(**{f.name: getattr(loaded, f.name) for f in fields(PersonDC)})
+    copy.name = "Copy"
+    assert copy.dirty_fields() is None
+
+    assert store.put(copy).name == "Copy"
+    assert len(updates) == 1
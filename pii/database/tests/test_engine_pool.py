@@ -0,0 +1,85 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from pii.database import db_config
+from pii.database.models.core.main import engine as main_engine
+from pii.database.models.core.engine import (
+    MeteredQueuePool,
+    create_db_engine,
+    engine_options,
+    pool_status,
+    reset_pool_metrics,
+)
+
+
+@pytest.fixture
+def small_engine(tmp_path):
+    eng = create_db_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    yield eng
+    eng.dispose()
+
+
+def test_main_engine_uses_metered_pool():
+    assert isinstance(main_engine.pool, MeteredQueuePool)
+
+
+def test_engine_options_come_from_db_config():
+    opts = engine_options(db_config.SQLALCHEMY_DATABASE_URL)
+    assert opts["pool_size"] == db_config.DB_POOL_SIZE
+    assert opts["max_overflow"] == db_config.DB_MAX_OVERFLOW
+    assert opts["pool_recycle"] == db_config.DB_POOL_RECYCLE
+    assert opts["pool_pre_ping"] == db_config.DB_POOL_PRE_PING
+    assert opts["connect_args"]["options"] == (
+        f"-c statement_timeout={db_config.DB_STATEMENT_TIMEOUT_MS}"
+    )
+
+
+def test_engine_options_skip_postgres_connect_args_for_sqlite():
+    opts = engine_options("sqlite:///:memory:", pool_size=2)
+    assert "connect_args" not in opts
+    assert opts["pool_size"] == 2
+
+
+def test_pool_status_tracks_checkouts_and_overflow(small_engine):
+    c1 = small_engine.connect()
+    c2 = small_engine.connect()
+    c1.execute(text("select 1"))
+
+    status = pool_status(small_engine)
+    assert status["checked_out"] == 2
+    assert status["overflow"] == 1
+    assert status["checkouts"] == 2
+    assert status["overflow_checkouts"] == 1
+    assert status["peak_checked_out"] == 2
+
+    c1.close()
+    c2.close()
+    assert pool_status(small_engine)["checked_out"] == 0
+
+
+def test_pool_exhaustion_is_counted(small_engine):
+    conns = [small_engine.connect(), small_engine.connect()]
+    with pytest.raises(PoolTimeoutError):
+        small_engine.connect()
+
+    status = pool_status(small_engine)
+    assert status["timeouts"] == 1
+    assert status["max_wait_ms"] >= 50
+
+    for c in conns:
+        c.close()
+    reset_pool_metrics(small_engine)
+    assert pool_status(small_engine)["timeouts"] == 0
+
+
+def test_metrics_survive_dispose(small_engine):
+    with small_engine.connect():
+        pass
+    small_engine.dispose()
+    assert pool_status(small_engine)["checkouts"] == 1
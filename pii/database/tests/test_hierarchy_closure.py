@@ -0,0 +1,139 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from pii.database.diagnostics.query_plan import capture_statements
+from pii.database.models import closure
+from pii.database.models.party import Organization, OrganizationToParentOrganization, Person
+from pii.database.models.roles import (
+    OrganizationManagedPersonAssociation,
+    OrganizationRole,
+    PersonRole,
+)
+from pii.database.stores.organization import OrganizationStore
+from pii.database.stores.role import PartyRoleStore
+
+
+@pytest.fixture
+def closure_tables():
+    closure.enable_closure(True)
+    yield
+    closure.enable_closure(False)
+
+
+def _build(session):
+    """
+    root ─┬─ east ── clinic_e
+          └─ west ─┬─ clinic_w
+                   └─ clinic_e   (clinic_e has two parents)
+    """
+    orgs = {
+        name: Organization(id=str(uuid4()), name=name, legal_name=f"{name} ltd")
+        for name in ("root", "east", "west", "clinic_e", "clinic_w")
+    }
+    session.add_all(orgs.values())
+    session.flush()
+    links = {}
+    for child, parent in [("east", "root"), ("west", "root"), ("clinic_e", "east"),
+                          ("clinic_w", "west"), ("clinic_e", "west")]:
+        links[child, parent] = OrganizationToParentOrganization(
+            child_org_id=orgs[child].id, parent_org_id=orgs[parent].id
+        )
+    session.add_all(links.values())
+    session.commit()
+    return orgs, links
+
+
+def _rows(session, orgs):
+    names = {str(org.id): name for name, org in orgs.items()}
+    c = closure.organization_closure.c
+    rows = session.execute(select(c.ancestor_id, c.descendant_id, c.depth)).all()
+    return {(names[str(a)], names[str(d)], depth) for a, d, depth in rows if str(a) in names}
+
+
+EXPECTED = {
+    ("root", "east", 1), ("root", "west", 1), ("root", "clinic_e", 2), ("root", "clinic_w", 2),
+    ("east", "clinic_e", 1), ("west", "clinic_e", 1), ("west", "clinic_w", 1),
+}
+
+
+def test_links_maintain_closure(session, closure_tables):
+    orgs, _ = _build(session)
+    assert _rows(session, orgs) == EXPECTED
+
+
+def test_is_ancestor_is_one_lookup(session, closure_tables):
+    orgs, _ = _build(session)
+    store = OrganizationStore()
+    root, clinic_e = orgs["root"].id, orgs["clinic_e"].id
+
+    with capture_statements() as captured:
+        assert store.is_ancestor(root, clinic_e)
+    assert len(captured) == 1
+    assert "organization_closure" in captured[0].statement
+
+    assert not store.is_ancestor(orgs["clinic_e"].id, orgs["root"].id)
+    assert not store.is_ancestor(orgs["east"].id, orgs["clinic_w"].id)
+    assert [o.name for o in store.ancestors(orgs["clinic_e"].id)] == ["east", "west", "root"]
+    assert [o.name for o in store.descendants(orgs["root"].id, max_depth=1)] == ["east", "west"]
+
+
+def test_removed_link_recomputes_below(session, closure_tables):
+    orgs, links = _build(session)
+
+    session.delete(links["clinic_e", "east"])
+    session.commit()
+    assert _rows(session, orgs) == EXPECTED - {("east", "clinic_e", 1)}
+
+    session.delete(links["west", "root"])
+    session.commit()
+    assert _rows(session, orgs) == {
+        ("root", "east", 1), ("west", "clinic_e", 1), ("west", "clinic_w", 1),
+    }
+
+
+def test_deleted_org_drops_paths_through_it(session, closure_tables):
+    orgs, _ = _build(session)
+    session.delete(orgs["west"])
+    session.commit()
+    del orgs["west"]
+    assert _rows(session, orgs) == {("root", "east", 1), ("root", "clinic_e", 2), ("east", "clinic_e", 1)}
+
+
+def test_rebuild_matches_incremental(session, closure_tables):
+    orgs, _ = _build(session)
+    closure.rebuild(session.connection(), closure.ORGANIZATION_GRAPH)
+    assert _rows(session, orgs) == EXPECTED
+
+
+def test_role_graph(session, closure_tables):
+    org = Organization(id=str(uuid4()), name="clinic", legal_name="clinic ltd")
+    person = Person(id=str(uuid4()), name="ann")
+    session.add_all([org, person])
+    session.flush()
+    org_role = OrganizationRole(party_id=org.id)
+    staff, patient = PersonRole(party_id=person.id), PersonRole(party_id=person.id)
+    org_role.person_roles.append(staff)
+    session.add_all([org_role, staff, patient])
+    session.flush()
+    session.add(OrganizationManagedPersonAssociation(organization_role_id=org_role.id, person_role_id=patient.id))
+    session.commit()
+
+    store = PartyRoleStore()
+    assert store.is_ancestor(org_role.id, staff.id)
+    assert store.is_ancestor(org_role.id, patient.id)
+    assert not store.is_ancestor(staff.id, org_role.id)
+
+    org_role.person_roles.remove(staff)
+    session.commit()
+    assert not store.is_ancestor(org_role.id, staff.id)
+    assert store.is_ancestor(org_role.id, patient.id)
+
+
+def test_disabled_closure_walks_links(session):
+    orgs, _ = _build(session)
+    assert _rows(session, orgs) == set()
+    store = OrganizationStore()
+    assert store.is_ancestor(orgs["root"].id, orgs["clinic_e"].id)
+    assert not store.is_ancestor(orgs["clinic_e"].id, orgs["root"].id)
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from pii.database.diagnostics.instrumentation import capture_store_stats
+from pii.database.models.history import History, HistoryTimeline, MaritalStatus, PersonName
+from pii.database.models.party import Person
+from pii.database.stores.history import MaritalStatusStore, PersonNameStore
+from pii.domain.enums import MaritalStatusType, PersonNameType
+
+JAN = datetime(2000, 1, 1)
+JUN = datetime(2000, 6, 1)
+DEC = datetime(2000, 12, 1)
+
+
+def _names():
+    # deliberately unsorted
+    return [
+        PersonName(name="Lovelace", name_type=PersonNameType.LAST, start_date=JUN),
+        PersonName(name="Ada", name_type=PersonNameType.FIRST, start_date=JAN),
+        PersonName(name="Byron", name_type=PersonNameType.LAST, start_date=JAN, end_date=JUN),
+    ]
+
+
+@pytest.mark.parametrize("at, expected", [
+    (JAN - timedelta(days=1), None),
+    (JAN, "Byron"),
+    (JUN - timedelta(seconds=1), "Byron"),
+    (JUN, "Lovelace"),
+    (DEC, "Lovelace"),
+])
+def test_in_memory_as_of(at, expected):
+    value = History.as_of(_names(), at, "name_type", PersonNameType.LAST)
+    assert (value.name if value else None) == expected
+
+
+def test_timeline_reuse_and_timezone_aware_timestamps():
+    timeline = HistoryTimeline(_names())
+    assert timeline.as_of(JAN, "name_type", PersonNameType.FIRST).name == "Ada"
+    # 2000-06-01 01:00+02:00 is still May 31st in UTC
+    aware = datetime(2000, 6, 1, 1, 0, tzinfo=timezone(timedelta(hours=2)))
+    assert timeline.as_of(aware, "name_type", PersonNameType.LAST).name == "Byron"
+    with pytest.raises(ValueError):
+        timeline.as_of(JAN, "name_type")
+
+
+def test_linear_as_of_matches_timeline_on_ties():
+    names = sorted(_names(), key=lambda n: n.start_date) + [
+        PersonName(name="Tie", name_type=PersonNameType.LAST, start_date=JUN),
+        PersonName(name="Ended", name_type=PersonNameType.LAST, start_date=JUN, end_date=DEC),
+    ]
+    timeline = HistoryTimeline(names)
+    for at in (JAN, JUN, DEC):
+        for kind in PersonNameType:
+            assert History.as_of(names, at, "name_type", kind) is timeline.as_of(at, "name_type", kind)
+    assert History.as_of(names, JUN, "name_type", PersonNameType.LAST).name == "Ended"
+    assert History.as_of(names, DEC, "name_type", PersonNameType.LAST).name == "Tie"
+
+
+def _person(session, with_history=True):
+    person = Person(id=str(uuid4()), name="Ada")
+    if with_history:
+        person._names_history.extend(_names())
+        person._marital_status_history.extend([
+            MaritalStatus(status=MaritalStatusType.SINGLE, start_date=JAN, end_date=JUN),
+            MaritalStatus(status=MaritalStatusType.MARRIED, start_date=JUN),
+        ])
+    session.add(person)
+    session.commit()
+    return str(person.id)
+
+
+def test_sql_as_of_clause(session):
+    pk = _person(session)
+    stmt = select(PersonName.name).where(
+        PersonName.person_id == pk,
+        PersonName.name_type == PersonNameType.LAST,
+        PersonName.as_of_clause(JUN - timedelta(seconds=1)),
+    )
+    assert session.scalars(stmt).all() == ["Byron"]
+    assert session.scalar(
+        select(Person.id).where(
+            Person.id == pk,
+            PersonName.as_of_expression(
+                PersonName.name, Person.id, DEC, PersonName.name_type == PersonNameType.LAST
+            ) == "Lovelace",
+        )
+    ) is not None
+
+
+def test_store_as_of_is_batched_across_persons(session):
+    ada, grace, nobody = _person(session), _person(session), _person(session, with_history=False)
+
+    with capture_store_stats() as capture:
+        names = PersonNameStore().as_of([ada, grace, nobody], at=JAN)
+        statuses = MaritalStatusStore().as_of([ada, grace, nobody], at=DEC)
+
+    assert [c.statement_count for c in capture.calls] == [1, 1]
+    assert set(names) == {ada, grace}
+    assert sorted(n.name for n in names[ada]) == ["Ada", "Byron"]
+    assert [s.status for s in statuses[grace]] == [MaritalStatusType.MARRIED]
+    assert nobody not in statuses
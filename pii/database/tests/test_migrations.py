@@ -0,0 +1,109 @@
+import argparse
+import os
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+from testcontainers.postgres import PostgresContainer
+
+from pii.database import db_config
+
+MIGRATIONS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "migrations")
+
+FOREIGN_KEYS = text(
+    "SELECT conrelid::regclass::text, conname, confdeltype FROM pg_constraint WHERE contype = 'f'"
+)
+
+
+@pytest.fixture(scope="module")
+def migrated_url(monkeypatch_module):
+    """A database built only from the migration chain (no create_all)."""
+    with PostgresContainer("postgres:14") as pg:
+        url = pg.get_connection_url()
+        monkeypatch_module.setattr(db_config, "SQLALCHEMY_DATABASE_URL", url)
+        yield url
+
+
+@pytest.fixture(scope="module")
+def monkeypatch_module():
+    with pytest.MonkeyPatch.context() as mp:
+        yield mp
+
+
+def _alembic(*x: str) -> Config:
+    cfg = Config(cmd_opts=argparse.Namespace(x=list(x)))
+    cfg.set_main_option("script_location", MIGRATIONS)
+    return cfg
+
+
+def _foreign_keys(url):
+    engine = create_engine(url)
+    try:
+        with engine.connect() as conn:
+            return conn.execute(FOREIGN_KEYS).all()
+    finally:
+        engine.dispose()
+
+
+def test_upgrade_makes_every_foreign_key_cascade(migrated_url):
+    command.upgrade(_alembic(), "head")
+    fks = _foreign_keys(migrated_url)
+    assert fks
+    assert [(table, name) for table, name, on_delete in fks if on_delete != "c"] == []
+
+
+def test_cascade_migration_round_trips(migrated_url):
+    command.upgrade(_alembic(), "head")
+    command.downgrade(_alembic(), "f2b9c4d7e815")
+    restricted = {(table, name) for table, name, on_delete in _foreign_keys(migrated_url) if on_delete != "c"}
+    assert ("person", "fk_person_id_party") in restricted
+
+    command.upgrade(_alembic(), "head")
+    assert all(on_delete == "c" for _, _, on_delete in _foreign_keys(migrated_url))
+
+
+def test_uuid_v7_migration_ignores_environment(migrated_url):
+    from pii.common.utils import id_generator
+
+    command.upgrade(_alembic(), "head")
+    command.downgrade(_alembic(), "b8d1e6f3a920")
+    previous = id_generator.id_version()
+    id_generator.set_id_version(7)
+    try:
+        command.upgrade(_alembic(), "head")
+    finally:
+        id_generator.set_id_version(previous)
+
+    engine = create_engine(migrated_url)
+    try:
+        with engine.connect() as conn:
+            assert conn.scalar(text("SELECT uuid_generate_v7()")).version == 7
+    finally:
+        engine.dispose()
+    assert _id_defaults(migrated_url) == {"uuid_generate_v4()"}
+
+
+def test_uuid_v7_defaults_are_opt_in(migrated_url):
+    command.upgrade(_alembic(), "head")
+    command.downgrade(_alembic(), "d9a3f6b0c251")
+    command.upgrade(_alembic("id_version=7"), "head")
+    assert _id_defaults(migrated_url) == {"uuid_generate_v7()"}
+
+    command.downgrade(_alembic(), "d9a3f6b0c251")
+    assert _id_defaults(migrated_url) == {"uuid_generate_v4()"}
+    command.upgrade(_alembic(), "head")
+    assert _id_defaults(migrated_url) == {"uuid_generate_v4()"}
+
+
+def _id_defaults(url):
+    engine = create_engine(url)
+    try:
+        with engine.connect() as conn:
+            return set(conn.scalars(text(
+                "SELECT column_default FROM information_schema.columns "
+                "WHERE column_name = 'id' AND table_name IN ("
+                "'party', 'party_role', 'person_name', 'person_gender', 'marital_status')"
+            )))
+    finally:
+        engine.dispose()
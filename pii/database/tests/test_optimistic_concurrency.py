@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from pii.common.exceptions import VersionConflictError
+from pii.database.stores.person import PersonStore
+from pii.domain.base.dataclasses import Person as PersonDC
+
+
+def test_version_starts_at_one_and_bumps():
+    store = PersonStore()
+    created = store.put(PersonDC(name="Ada"))
+    assert created.version == 1
+
+    created.name = "Ada Lovelace"
+    updated = store.put(created)
+    assert updated.version == 2
+    assert store.get(created.id).version == 2
+
+
+def test_stale_put_fails_fast():
+    store = PersonStore()
+    first = store.put(PersonDC(name="Ada"))
+    stale = PersonDC(id=first.id, name="Stale", version=first.version)
+    store.put(PersonDC(id=first.id, name="Winner", version=first.version))
+
+    with pytest.raises(VersionConflictError) as exc:
+        store.put(stale)
+    assert (exc.value.expected, exc.value.actual) == (1, 2)
+    assert store.get(first.id).name == "Winner"
+
+
+def test_patch_checks_version_only_when_given():
+    store = PersonStore()
+    person = store.put(PersonDC(name="Ada"))
+    assert store._patch(PersonDC(id=person.id, name="Blind")).version == 2
+    with pytest.raises(VersionConflictError):
+        store._patch(PersonDC(id=person.id, name="Stale", version=1))
+
+
+def test_concurrent_write_between_read_and_commit(session):
+    store = PersonStore()
+    person = store.put(PersonDC(name="Ada"))
+
+    def other_writer(sess, flush_context, instances):
+        sess.connection().execute(
+            text("UPDATE party SET version = version + 1 WHERE id = :id"), {"id": person.id}
+        )
+
+    event.listen(Session, "before_flush", other_writer, once=True)
+    person.name = "Loser"
+    with pytest.raises(VersionConflictError):
+        store.put(person)
@@ -0,0 +1,122 @@
+from uuid import uuid4
+
+import pytest
+
+from pii.database.diagnostics.instrumentation import capture_store_stats
+from pii.database.models import closure
+from pii.database.models.party import (
+    Organization,
+    OrganizationStaffAssociation,
+    OrganizationToParentOrganization,
+    Person,
+)
+from pii.database.stores.organization import OrganizationStore
+from pii.domain.base.dataclasses import Organization as OrganizationDC, Person as PersonDC
+from pii.domain.base.stores.organization import OrganizationStore_NoDB
+
+
+ORGS = ("root", "east", "west", "clinic_e", "clinic_w")
+PEOPLE = ("ann", "bob", "cy")
+# (child, parent) and (organization, staff person)
+LINKS = [("east", "root"), ("west", "root"), ("clinic_e", "east"), ("clinic_w", "west"), ("clinic_e", "west")]
+STAFF = [("root", "ann"), ("clinic_e", "bob"), ("clinic_w", "bob"), ("west", "cy")]
+
+
+@pytest.fixture
+def network(session):
+    """
+    root ─┬─ east ── clinic_e
+          └─ west ─┬─ clinic_w
+                   └─ clinic_e   (clinic_e has two parents)
+    """
+    return _build(session)
+
+
+def _build(session):
+    orgs = {name: Organization(id=str(uuid4()), name=name, legal_name=f"{name} ltd") for name in ORGS}
+    people = {name: Person(id=str(uuid4()), name=name) for name in PEOPLE}
+    session.add_all([*orgs.values(), *people.values()])
+    session.flush()
+    for child, parent in LINKS:
+        session.add(OrganizationToParentOrganization(
+            child_org_id=orgs[child].id, parent_org_id=orgs[parent].id
+        ))
+    for org, person in STAFF:
+        session.add(OrganizationStaffAssociation(
+            organization_id=orgs[org].id, staff_person_id=people[person].id
+        ))
+    session.commit()
+    return {name: str(obj.id) for name, obj in {**orgs, **people}.items()}
+
+
+def _build_nodb():
+    store = OrganizationStore_NoDB()
+    orgs = {name: store.put(OrganizationDC(name=name)) for name in ORGS}
+    people = {name: PersonDC(id=str(uuid4()), name=name) for name in PEOPLE}
+    for child, parent in LINKS:
+        orgs[child].parent_links.append(orgs[parent])
+    for org, person in STAFF:
+        orgs[org].staff_members.append(people[person])
+    return store, {name: org.id for name, org in orgs.items()}
+
+
+@pytest.fixture(params=["cte", "closure", "nodb"])
+def hierarchy_store(request, session):
+    """``(store, ids)`` for the same network on each traversal path."""
+    if request.param == "nodb":
+        yield _build_nodb()
+        return
+    closure.enable_closure(request.param == "closure")
+    try:
+        yield OrganizationStore(), _build(session)
+    finally:
+        closure.enable_closure(False)
+
+
+def _names(dcs):
+    return [dc.name for dc in dcs]
+
+
+def test_ancestors_nearest_first(network):
+    store = OrganizationStore()
+    assert _names(store.ancestors(network["clinic_e"])) == ["east", "west", "root"]
+    assert _names(store.ancestors(network["clinic_e"], max_depth=1)) == ["east", "west"]
+    assert store.ancestors(network["root"]) == []
+
+
+def test_descendants_single_query(network):
+    with capture_store_stats() as capture:
+        found = OrganizationStore().descendants(network["root"])
+
+    assert _names(found) == ["east", "west", "clinic_e", "clinic_w"]
+    assert capture.statement_count == 1
+    assert _names(OrganizationStore().descendants(network["root"], max_depth=1)) == ["east", "west"]
+
+
+def test_subtree_staff_is_distinct(network):
+    assert _names(OrganizationStore().subtree_staff(network["west"])) == ["bob", "cy"]
+    assert _names(OrganizationStore().subtree_staff(network["root"])) == ["ann", "bob", "cy"]
+
+
+def test_cycles_terminate(session, network):
+    # root becomes a child of clinic_w: root -> west -> clinic_w -> root
+    session.add(OrganizationToParentOrganization(
+        child_org_id=network["root"], parent_org_id=network["clinic_w"]
+    ))
+    session.commit()
+
+    assert _names(OrganizationStore().descendants(network["west"])) == ["clinic_e", "clinic_w", "root", "east"]
+    assert _names(OrganizationStore().ancestors(network["west"])) == ["root", "clinic_w"]
+
+
+@pytest.mark.parametrize("max_depth, below_root, above_clinic_e", [
+    (0, [], []),
+    (1, ["east", "west"], ["east", "west"]),
+    (None, ["east", "west", "clinic_e", "clinic_w"], ["east", "west", "root"]),
+])
+def test_paths_agree(hierarchy_store, max_depth, below_root, above_clinic_e):
+    store, ids = hierarchy_store
+    assert _names(store.descendants(ids["root"], max_depth=max_depth)) == below_root
+    assert _names(store.ancestors(ids["clinic_e"], max_depth=max_depth)) == above_clinic_e
+    assert _names(store.subtree_staff(ids["west"])) == ["bob", "cy"]
+    assert _names(store.subtree_staff(ids["root"])) == ["ann", "bob", "cy"]
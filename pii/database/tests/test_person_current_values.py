@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from pii.database.diagnostics.query_plan import capture_statements
+from pii.database.models.history import MaritalStatus, PersonGender, PersonName
+from pii.database.models.party import Person
+from pii.database.stores.person import PersonStore
+from pii.domain.enums import GenderType, MaritalStatusType, PersonNameType
+
+PAST = datetime(2000, 1, 1)
+FUTURE = datetime.utcnow() + timedelta(days=365)
+
+
+def _person(session, first, last, former_last=None):
+    person = Person(id=str(uuid4()), name=f"{first} {last}")
+    person._names_history.extend([
+        PersonName(name=first, name_type=PersonNameType.FIRST, start_date=PAST),
+        PersonName(name=last, name_type=PersonNameType.LAST, start_date=PAST + timedelta(days=1)),
+    ])
+    if former_last:
+        person._names_history.append(PersonName(
+            name=former_last, name_type=PersonNameType.LAST,
+            start_date=PAST, end_date=PAST + timedelta(days=1),
+        ))
+    person._gender_history.append(PersonGender(gender=GenderType.FEMALE, start_date=PAST))
+    person._marital_status_history.extend([
+        MaritalStatus(status=MaritalStatusType.SINGLE, start_date=PAST),
+        MaritalStatus(status=MaritalStatusType.MARRIED, start_date=FUTURE),
+    ])
+    session.add(person)
+    session.commit()
+    return person
+
+
+def test_instance_side_returns_current_values(session):
+    person = _person(session, "Ada", "Lovelace", former_last="Byron")
+    assert person.first_name == "Ada"
+    assert person.last_name == "Lovelace"
+    assert person.full_name == "Ada Lovelace"
+    assert person.gender is GenderType.FEMALE
+    assert person.marital_status is MaritalStatusType.SINGLE
+
+
+def test_sql_side_filters_and_sorts(session):
+    ada = _person(session, "Ada", "Lovelace", former_last="Byron")
+    grace = _person(session, "Grace", "Hopper")
+
+    assert session.scalars(select(Person.id).where(Person.last_name == "Byron")).all() == []
+    assert session.scalars(select(Person.id).where(Person.last_name == "Lovelace")).all() == [ada.id]
+    ordered = session.scalars(
+        select(Person.first_name).where(Person.id.in_([ada.id, grace.id])).order_by(Person.first_name.desc())
+    ).all()
+    assert ordered == ["Grace", "Ada"]
+    assert session.scalar(select(Person.marital_status).where(Person.id == ada.id)) is MaritalStatusType.SINGLE
+    assert session.scalar(select(Person.gender).where(Person.id == grace.id)) is GenderType.FEMALE
+
+
+def test_store_filter_runs_in_one_statement(session):
+    ada = _person(session, "Ada", "Lovelace")
+    _person(session, "Grace", "Hopper")
+
+    with capture_statements() as captured:
+        found = PersonStore().filter(last_name="Lovelace")
+
+    assert [p.id for p in found] == [str(ada.id)]
+    assert len(captured) == 1
+    assert "person_name" in captured[0].statement
@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, text
+
+from pii.common.exceptions import ReadOnlyRecordError
+from pii.database.diagnostics.instrumentation import capture_store_stats
+from pii.database.models import person_snapshot
+from pii.database.models.history import MaritalStatus, PersonGender, PersonName
+from pii.database.models.party import Organization, OrganizationStaffAssociation, Person
+from pii.database.stores.person import PersonStore
+from pii.domain.enums import GenderType, MaritalStatusType, PersonNameType
+
+PAST = datetime(2000, 1, 1)
+
+
+@pytest.fixture
+def snapshots():
+    person_snapshot.enable_snapshots(True)
+    yield
+    person_snapshot.enable_snapshots(False)
+
+
+def _person(session):
+    org = Organization(id=str(uuid4()), name="Acme", legal_name="Acme Ltd")
+    person = Person(id=str(uuid4()), name="Ada", date_of_birth=datetime(1990, 5, 1))
+    person._names_history.extend([
+        PersonName(name="Ada", name_type=PersonNameType.FIRST, start_date=PAST),
+        PersonName(name="Byron", name_type=PersonNameType.LAST, start_date=PAST, end_date=PAST + timedelta(days=1)),
+        PersonName(name="Lovelace", name_type=PersonNameType.LAST, start_date=PAST + timedelta(days=1)),
+    ])
+    person._gender_history.append(PersonGender(gender=GenderType.FEMALE, start_date=PAST))
+    session.add_all([org, person])
+    session.flush()
+    session.add(OrganizationStaffAssociation(organization_id=org.id, staff_person_id=person.id))
+    session.commit()
+    return str(person.id), org
+
+
+def _snapshot(session, pk):
+    return session.scalar(select(Person.current_snapshot).where(Person.id == pk))
+
+
+def test_snapshot_written_on_flush(session, snapshots):
+    pk, _ = _person(session)
+    snap = _snapshot(session, pk)
+
+    assert snap["name"] == "Ada"
+    assert {n["name_type"]: n["name"] for n in snap["names"]} == {"FIRST": "Ada", "LAST": "Lovelace"}
+    assert snap["gender"] == "FEMALE"
+    assert snap["marital_status"] is None
+    assert [o["name"] for o in snap["staff_organizations"]] == ["Acme"]
+    assert snap["valid_until"] is None
+
+
+def test_child_and_organization_writes_refresh_snapshot(session, snapshots):
+    pk, org = _person(session)
+    session.add(MaritalStatus(person_id=pk, status=MaritalStatusType.MARRIED, start_date=PAST))
+    session.commit()
+    assert _snapshot(session, pk)["marital_status"] == "MARRIED"
+
+    org.name = "Acme Holdings"
+    session.commit()
+    assert [o["name"] for o in _snapshot(session, pk)["staff_organizations"]] == ["Acme Holdings"]
+
+
+def test_get_snapshot_reads_one_row(session, snapshots):
+    pk, org = _person(session)
+
+    with capture_store_stats() as capture:
+        dc = PersonStore().get_snapshot(pk)
+
+    assert capture.statement_count == 1
+    assert dc.id == pk
+    assert dc.date_of_birth == datetime(1990, 5, 1)
+    assert sorted(n.name for n in dc._names_history) == ["Ada", "Lovelace"]
+    assert [g.gender for g in dc._gender_history] == [GenderType.FEMALE]
+    assert [o.id for o in dc.staff_organizations] == [str(org.id)]
+
+
+def test_future_entries_bound_the_snapshot(session, snapshots):
+    pk, _ = _person(session)
+    starts = datetime.utcnow() + timedelta(days=30)
+    session.add(MaritalStatus(person_id=pk, status=MaritalStatusType.MARRIED, start_date=starts))
+    session.commit()
+
+    snap = _snapshot(session, pk)
+    assert snap["marital_status"] is None
+    assert datetime.fromisoformat(snap["valid_until"]) == starts
+    assert person_snapshot.is_fresh(snap)
+    assert not person_snapshot.is_fresh(snap, now=starts)
+
+
+def test_stale_or_missing_snapshot_falls_back(session, snapshots):
+    pk, _ = _person(session)
+    session.execute(
+        text("UPDATE person SET current_snapshot = jsonb_set(current_snapshot, '{valid_until}', '\"2001-01-01T00:00:00\"') WHERE id = :id"),
+        {"id": pk},
+    )
+    with capture_store_stats() as capture:
+        dc = PersonStore().get_snapshot(pk)
+    assert dc.name == "Ada"
+    assert capture.statement_count > 1
+
+
+def test_disabled_snapshots_are_not_maintained(session):
+    pk, _ = _person(session)
+    assert _snapshot(session, pk) is None
+    assert PersonStore().get_snapshot(pk).name == "Ada"
+
+
+def test_snapshot_carries_version_and_is_read_only(session, snapshots):
+    pk, _ = _person(session)
+    store = PersonStore()
+    full = store.get(pk)
+
+    dc = store.get_snapshot(pk)
+    assert dc.version == full.version is not None
+    dc.name = "Overwrite"
+    with pytest.raises(ReadOnlyRecordError):
+        store.put(dc)
+    with pytest.raises(ReadOnlyRecordError):
+        store._patch(dc)
+    assert store.get(pk).name == "Ada"
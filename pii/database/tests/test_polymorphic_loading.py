@@ -0,0 +1,88 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from pii.database.diagnostics.query_plan import capture_statements
+from pii.database.models.party import Organization, Person
+from pii.database.models.roles import PersonRole, SystemRole
+from pii.database.store_adapters.sqlalchemy_store import (
+    POLYMORPHIC_ALL,
+    POLYMORPHIC_BASE,
+    POLYMORPHIC_SELECTIN,
+)
+from pii.database.stores.person import PartyStore
+from pii.database.stores.role import PartyRoleStore
+from pii.domain.base.dataclasses import Organization as OrganizationDC, Person as PersonDC
+
+
+@pytest.fixture
+def parties(session):
+    person = Person(id=str(uuid4()), name="Ada", date_of_birth=datetime(1990, 1, 1))
+    org = Organization(id=str(uuid4()), name="Acme", legal_name="Acme Ltd")
+    session.add_all([person, org])
+    session.commit()
+    return person.id, org.id
+
+
+def _selects(call):
+    with capture_statements() as captured:
+        result = call()
+    return result, [c.statement for c in captured]
+
+
+def _joins(statement, table):
+    return f"JOIN {table} " in statement
+
+
+def test_base_mode_reads_only_the_party_table(parties):
+    person_id, _ = parties
+    orm, statements = _selects(
+        lambda: PartyStore().get(person_id, as_orm=True, polymorphic=POLYMORPHIC_BASE)
+    )
+    assert isinstance(orm, Person)
+    assert not any(_joins(s, "person") or _joins(s, "organization") for s in statements)
+
+
+def test_selectin_mode_is_the_party_store_default(parties):
+    dcs, statements = _selects(lambda: PartyStore().filter(name__in=["Ada", "Acme"]))
+
+    assert {type(dc) for dc in dcs} == {PersonDC, OrganizationDC}
+    assert {dc.name: dc for dc in dcs}["Ada"].date_of_birth == datetime(1990, 1, 1)
+    # the base query joins nothing; each subclass table is read once, in batch
+    base = statements[0]
+    assert not _joins(base, "person") and not _joins(base, "organization")
+    assert sum("FROM party JOIN person" in s for s in statements) == 1
+    assert sum("FROM party JOIN organization" in s for s in statements) == 1
+
+
+def test_all_mode_outer_joins_every_subclass(parties):
+    person_id, _ = parties
+    dc, statements = _selects(lambda: PartyStore().get(person_id, polymorphic=POLYMORPHIC_ALL))
+    assert dc.date_of_birth == datetime(1990, 1, 1)
+    assert "LEFT OUTER JOIN person" in statements[0]
+    assert "LEFT OUTER JOIN organization" in statements[0]
+
+
+def test_subclass_mode_joins_only_that_subclass(parties):
+    dcs, statements = _selects(lambda: PartyStore().filter(polymorphic=Organization, name="Acme"))
+    assert [dc.legal_name for dc in dcs] == ["Acme Ltd"]
+    assert "LEFT OUTER JOIN organization" in statements[0]
+    assert not _joins(statements[0], "person")
+
+
+def test_subclass_mode_rejects_unrelated_classes(parties):
+    with pytest.raises(ValueError):
+        PartyStore().all(polymorphic=PersonRole)
+
+
+@pytest.mark.parametrize("mode", [POLYMORPHIC_BASE, POLYMORPHIC_SELECTIN, POLYMORPHIC_ALL, SystemRole])
+def test_party_role_hierarchy_modes(session, parties, mode):
+    person_id, _ = parties
+    role = SystemRole(id=str(uuid4()), party_id=person_id)
+    session.add(role)
+    session.commit()
+
+    orm = PartyRoleStore().get(role.id, as_orm=True, polymorphic=mode)
+    assert isinstance(orm, SystemRole)
+    assert PartyRoleStore().filter(polymorphic=mode, party_id=person_id)
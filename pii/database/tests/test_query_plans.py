@@ -0,0 +1,159 @@
+"""
+Query plan regression tests.
+
+Each test seeds enough rows for the planner to prefer indexes, runs a store
+call, captures every SELECT it issued (eager and ``selectin`` loads
+included) and checks the ``EXPLAIN`` output: no sequential scans on large
+tables, an index used wherever a large table is read, and estimated rows
+within a budget.  A new relationship or a polymorphic-loading change that
+adds an unindexed join will fail here.
+"""
+import random
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, text
+
+from pii.database.diagnostics.query_plan import capture_statements, explain, large_tables
+from pii.database.models.history import MaritalStatus, PersonGender, PersonName
+from pii.database.models.party import (
+    Organization,
+    OrganizationStaffAssociation,
+    OrganizationToParentOrganization,
+    Party,
+    Person,
+)
+from pii.database.models.roles import PartyRole, person_role_to_organization_role
+from pii.database.stores.history import PersonNameStore
+from pii.database.stores.organization import OrganizationStore
+from pii.database.stores.person import PartyStore, PersonStore
+from pii.database.stores.role import OrganizationRoleStore, PartyRoleStore, PersonRoleStore
+from pii.domain.enums import GenderType, MaritalStatusType, PersonNameType
+
+PEOPLE = 2000
+ORGS = 200
+LARGE_TABLE_ROWS = 1000
+ROW_BUDGET = 50
+
+
+@pytest.fixture
+def seeded(session):
+    """Bulk-load a realistic graph inside the test transaction and ANALYZE it."""
+    rng = random.Random(42)
+    conn = session.connection()
+    start = datetime(2000, 1, 1)
+
+    people = [uuid4() for _ in range(PEOPLE)]
+    orgs = [uuid4() for _ in range(ORGS)]
+    conn.execute(insert(Party.__table__), (
+        [{"id": pk, "type": "person", "name": f"person {i}"} for i, pk in enumerate(people)]
+        + [{"id": pk, "type": "organization", "name": f"org {i}"} for i, pk in enumerate(orgs)]
+    ))
+    conn.execute(insert(Person.__table__), [{"id": pk} for pk in people])
+    conn.execute(insert(Organization.__table__), [
+        {"id": pk, "legal_name": f"org {i} ltd"} for i, pk in enumerate(orgs)
+    ])
+    conn.execute(insert(OrganizationToParentOrganization.__table__), [
+        {"id": uuid4(), "child_org_id": child, "parent_org_id": orgs[i // 10]}
+        for i, child in enumerate(orgs[10:], start=10)
+    ])
+    conn.execute(insert(OrganizationStaffAssociation.__table__), [
+        {"id": uuid4(), "organization_id": rng.choice(orgs), "staff_person_id": pk}
+        for pk in people
+    ])
+    conn.execute(insert(PersonName.__table__), [
+        {"id": uuid4(), "person_id": pk, "name": f"n{i}", "name_type": name_type, "start_date": start}
+        for i, pk in enumerate(people)
+        for name_type in (PersonNameType.FIRST, PersonNameType.LAST)
+    ])
+    conn.execute(insert(PersonGender.__table__), [
+        {"id": uuid4(), "person_id": pk, "gender": GenderType.FEMALE, "start_date": start}
+        for pk in people
+    ])
+    conn.execute(insert(MaritalStatus.__table__), [
+        {"id": uuid4(), "person_id": pk, "status": MaritalStatusType.SINGLE, "start_date": start}
+        for pk in people
+    ])
+
+    person_roles = [uuid4() for _ in people]
+    org_roles = [uuid4() for _ in orgs]
+    conn.execute(insert(PartyRole.__table__), (
+        [{"id": r, "type": "person_role", "party_id": p, "terminated": False}
+         for r, p in zip(person_roles, people)]
+        + [{"id": r, "type": "organization_role", "party_id": o, "terminated": False}
+           for r, o in zip(org_roles, orgs)]
+    ))
+    conn.execute(insert(person_role_to_organization_role), [
+        {"person_role_id": r, "organization_role_id": rng.choice(org_roles)}
+        for r in person_roles
+    ])
+
+    conn.execute(text("ANALYZE"))
+    return {
+        "person": str(people[7]),
+        "organization": str(orgs[3]),
+        "person_role": str(person_roles[7]),
+        "organization_role": str(org_roles[3]),
+    }
+
+
+def _plans_for(session, call):
+    with capture_statements() as captured:
+        call()
+    assert captured, "store call issued no SELECT"
+    return [(c.statement, explain(session, c.statement, c.parameters)) for c in captured]
+
+
+def _assert_plans(session, call, row_budget=ROW_BUDGET):
+    large = large_tables(session, LARGE_TABLE_ROWS)
+    assert {"party", "person", "person_name"} <= large, "seed did not produce large tables"
+
+    for statement, plan in _plans_for(session, call):
+        assert not plan.seq_scans(large), f"seq scan on large table:\n{statement}\n{plan}"
+        if plan.relations() & large:
+            assert plan.index_scans(), f"no index used:\n{statement}\n{plan}"
+        assert plan.estimated_rows <= row_budget, f"row estimate over budget:\n{statement}\n{plan}"
+
+
+def test_person_get(session, seeded):
+    _assert_plans(session, lambda: PersonStore().get(seeded["person"]))
+
+
+def test_party_get_polymorphic(session, seeded):
+    _assert_plans(session, lambda: PartyStore().get(seeded["person"]))
+
+
+def test_organization_get(session, seeded):
+    # as_orm: only the queries matter here, not the dataclass conversion.
+    # get() joins staff and child links in one statement, so their counts
+    # multiply; the budget covers ~10 staff x ~10 children.
+    _assert_plans(
+        session,
+        lambda: OrganizationStore().get(seeded["organization"], as_orm=True),
+        row_budget=150,
+    )
+
+
+@pytest.mark.parametrize("store, key", [
+    (PartyRoleStore, "person_role"),
+    (PersonRoleStore, "person_role"),
+    (OrganizationRoleStore, "organization_role"),
+])
+def test_role_get(session, seeded, store, key):
+    _assert_plans(session, lambda: store().get(seeded[key]))
+
+
+def test_history_filter_by_person(session, seeded):
+    _assert_plans(session, lambda: PersonNameStore().filter(person_id=seeded["person"]))
+
+
+def test_roles_filter_by_party(session, seeded):
+    _assert_plans(session, lambda: PartyRoleStore().filter(party_id=seeded["person"]))
+
+
+def test_role_graph_load(session, seeded):
+    _assert_plans(
+        session,
+        lambda: PartyRoleStore().load_graph([seeded["person_role"], seeded["organization_role"]]),
+    )
@@ -0,0 +1,118 @@
+import time
+
+import pytest
+from sqlalchemy import Column, MetaData, String, Table, create_engine, event, insert, select, text
+from sqlalchemy.orm import sessionmaker
+
+from pii.database.models.core.engine import create_db_engine
+from pii.database.models.core.routing import ReplicaRouter, RoutingSession, primary_reads
+from pii.database.stores.person import PersonStore
+from pii.domain.base.dataclasses import Person as PersonDC
+
+# Each database answers "which one am I" so routing can be observed directly.
+marker = Table("routing_marker", MetaData(), Column("name", String))
+
+
+@pytest.fixture
+def engines(tmp_path):
+    primary = create_db_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica = create_db_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    for eng, name in ((primary, "primary"), (replica, "replica")):
+        marker.create(eng)
+        with eng.begin() as conn:
+            conn.execute(insert(marker).values(name=name))
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def _sessionmaker(primary, replica, window=60.0):
+    router = ReplicaRouter(primary, replica, read_your_writes_window=window)
+    return sessionmaker(class_=RoutingSession, bind=primary, router=router)
+
+
+def _who(session):
+    return session.execute(select(marker.c.name).limit(1)).scalar_one()
+
+
+def test_reads_go_to_replica(engines):
+    Session = _sessionmaker(*engines)
+    with Session() as session:
+        assert _who(session) == "replica"
+
+
+def test_writes_go_to_primary_and_pin_the_transaction(engines):
+    Session = _sessionmaker(*engines)
+    with Session() as session:
+        session.execute(insert(marker).values(name="written"))
+        # same transaction must see its own write
+        names = session.execute(select(marker.c.name)).scalars().all()
+        assert names == ["primary", "written"]
+        session.rollback()
+        assert _who(session) == "replica"
+
+
+def test_read_your_writes_window(engines):
+    Session = _sessionmaker(*engines, window=0.2)
+    with Session() as session:
+        session.execute(insert(marker).values(name="written"))
+        session.commit()
+    with Session() as session:
+        assert _who(session) == "primary"
+    time.sleep(0.25)
+    with Session() as session:
+        assert _who(session) == "replica"
+
+
+def test_primary_reads_context(engines):
+    Session = _sessionmaker(*engines)
+    with Session() as session:
+        with primary_reads():
+            assert _who(session) == "primary"
+        assert _who(session) == "replica"
+
+
+def test_non_select_text_goes_to_primary(engines):
+    Session = _sessionmaker(*engines)
+    with Session() as session:
+        session.execute(text("INSERT INTO routing_marker (name) VALUES ('raw')"))
+        session.commit()
+    primary, _ = engines
+    with primary.connect() as conn:
+        assert conn.execute(select(marker.c.name)).scalars().all() == ["primary", "raw"]
+
+
+def test_without_read_engine_uses_bind(engines):
+    primary, _ = engines
+    Session = _sessionmaker(primary, None)
+    with Session() as session:
+        assert _who(session) == "primary"
+
+
+def test_store_accepts_read_and_write_engines(engines):
+    primary, replica = engines
+    store = PersonStore(read_engine=replica, write_engine=primary)
+    with store._Session() as session:
+        assert isinstance(session, RoutingSession)
+        assert session.router.read_engine is replica
+        assert session.router.write_engine is primary
+        assert _who(session) == "replica"
+
+
+def test_update_and_patch_never_read_the_replica(engine):
+    # Two engines on the test database; only the "replica" one is watched.
+    primary, replica = create_engine(engine.url), create_engine(engine.url)
+    replica_statements = []
+    event.listen(replica, "before_cursor_execute", lambda *args: replica_statements.append(args[2]))
+    store = PersonStore(session=_sessionmaker(primary, replica, window=0.0))
+    created = store.put(PersonDC(name="Routed"))
+    try:
+        replica_statements.clear()
+        updated = store.put(PersonDC(id=created.id, name="Updated", version=created.version))
+        patched = store._patch(PersonDC(id=created.id, name="Patched", version=updated.version))
+        assert patched.version == created.version + 2
+        assert replica_statements == []
+    finally:
+        store.delete(created.id)
+        primary.dispose()
+        replica.dispose()
@@ -0,0 +1,104 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import inspect
+
+from pii.database.diagnostics.query_plan import capture_statements
+from pii.database.models.party import Organization, Person
+from pii.database.models.roles import (
+    OrganizationManagedPersonAssociation,
+    OrganizationOwnerAssociation,
+    OrganizationRole,
+    PersonRole,
+)
+from pii.database.stores.role import OrganizationRoleStore, PartyRoleStore, PersonRoleStore, RoleGraph
+
+
+@pytest.fixture
+def roles(session):
+    """
+    clinic ─┬─ member  ─ doctor, nurse
+            ├─ managed ─ patient
+            └─ owner   ─ doctor
+    lab ───── member  ─ nurse
+    """
+    org = Organization(id=str(uuid4()), name="clinic", legal_name="clinic ltd")
+    person = Person(id=str(uuid4()), name="ann")
+    session.add_all([org, person])
+    session.flush()
+    clinic, lab = OrganizationRole(party_id=org.id), OrganizationRole(party_id=org.id)
+    doctor, nurse, patient = (PersonRole(party_id=person.id) for _ in range(3))
+    clinic.person_roles.extend([doctor, nurse])
+    lab.person_roles.append(nurse)
+    session.add_all([clinic, lab, doctor, nurse, patient])
+    session.flush()
+    session.add_all([
+        OrganizationManagedPersonAssociation(organization_role_id=clinic.id, person_role_id=patient.id),
+        OrganizationOwnerAssociation(organization_role_id=clinic.id, person_role_id=doctor.id),
+    ])
+    session.commit()
+    return {name: str(role.id) for name, role in
+            {"clinic": clinic, "lab": lab, "doctor": doctor, "nurse": nurse, "patient": patient}.items()}
+
+
+def test_load_graph_one_query_per_association(roles):
+    with capture_statements() as captured:
+        graph = PartyRoleStore().load_graph([roles["clinic"], roles["nurse"]])
+
+    assert len(captured) == 3
+    assert graph.person_roles(roles["clinic"]) == {roles["doctor"], roles["nurse"]}
+    assert graph.person_roles(roles["clinic"], RoleGraph.MANAGED) == {roles["patient"]}
+    assert graph.person_roles(roles["clinic"], RoleGraph.OWNER) == {roles["doctor"]}
+    assert graph.organization_roles(roles["nurse"]) == {roles["clinic"], roles["lab"]}
+    assert graph.neighbours(roles["clinic"]) == {roles["doctor"], roles["nurse"], roles["patient"]}
+    assert len(list(graph.edges())) == 5
+
+
+def test_load_graph_with_roles(roles):
+    with capture_statements() as captured:
+        graph = PartyRoleStore().load_graph([roles["lab"]], with_roles=True)
+
+    assert len(captured) == 4
+    assert set(graph.roles) == {roles["lab"], roles["nurse"]}
+    assert type(graph.roles[roles["nurse"]]).__name__ == "PersonRole"
+
+
+def test_load_graph_empty():
+    graph = PartyRoleStore().load_graph([])
+    assert list(graph.edges()) == [] and graph.node_ids() == set()
+
+
+def test_role_get_does_not_fan_out(roles):
+    with capture_statements() as captured:
+        role = OrganizationRoleStore().get(roles["clinic"], as_orm=True)
+    # get() still joins the role's own collections, but stops there.
+    assert len(captured) == 1
+    assert {str(pr.id) for pr in role.person_roles} == {roles["doctor"], roles["nurse"]}
+    for person_role in role.person_roles:
+        assert "organization_roles" in inspect(person_role).unloaded
+
+
+def _ids(roles):
+    return {role.id for role in roles}
+
+
+def test_role_reads_carry_their_links(roles):
+    assert _ids(PersonRoleStore().get(roles["nurse"]).organization_roles) == {roles["clinic"], roles["lab"]}
+    assert _ids(PartyRoleStore().get(roles["nurse"]).organization_roles) == {roles["clinic"], roles["lab"]}
+    [clinic] = OrganizationRoleStore().filter(id=roles["clinic"])
+    assert _ids(clinic.person_roles) == {roles["doctor"], roles["nurse"]}
+    everything = {role.id: role for role in PartyRoleStore().all()}
+    assert _ids(everything[roles["lab"]].person_roles) == {roles["nurse"]}
+    assert _ids(everything[roles["doctor"]].organization_roles) == {roles["clinic"]}
+
+
+def test_role_round_trip_put_keeps_links(roles):
+    store = OrganizationRoleStore()
+    [clinic] = store.filter(id=roles["clinic"])
+    clinic.party_id = clinic.party_id
+    store.put(clinic)
+    assert _ids(store.get(roles["clinic"]).person_roles) == {roles["doctor"], roles["nurse"]}
+
+    nurse = PartyRoleStore().get(roles["nurse"])
+    PartyRoleStore().put(nurse)
+    assert _ids(PersonRoleStore().get(roles["nurse"]).organization_roles) == {roles["clinic"], roles["lab"]}
@@ -50,7 +50,7 @@ def test_serviceobjectdc_to_dataclass(session):
     dc = obj.to_dataclass()
 
     assert isinstance(dc, SampleDC)
-    assert dc.id == str(uid)
+    assert type(dc.id) is str and dc.id == str(uid)
     assert dc.name == "foo"
     assert dc.count == 5
 
@@ -59,3 +59,16 @@ def test_serviceobjectdc_registry():
     assert SampleModel in ServiceObjectDC._orm_to_dc_registry
     assert ServiceObjectDC._dc_to_orm_registry[SampleDC] is SampleModel
     assert ServiceObjectDC._orm_to_dc_registry[SampleModel] is SampleDC
+
+
+def test_server_side_uuid7(engine):
+    from sqlalchemy import text
+    from pii.common.utils.id_generator import uuid7_timestamp_ms
+
+    with engine.connect() as conn:
+        now_ms, *ids = conn.execute(text(
+            "SELECT floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint, "
+            "uuid_generate_v7(), uuid_generate_v7()"
+        )).one()
+    assert all(u.version == 7 for u in ids)
+    assert abs(uuid7_timestamp_ms(ids[0]) - now_ms) < 1000
@@ -0,0 +1,128 @@
+import logging
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, text
+
+from pii.database.diagnostics import instrumentation, slow_query
+from pii.database.diagnostics.instrumentation import capture_store_stats
+from pii.database.diagnostics.slow_query import SlowQueryLog, redact_statement
+from pii.database.models.party import Person
+from pii.database.stores.person import PersonStore
+
+
+@pytest.fixture
+def slow_log():
+    log = SlowQueryLog(threshold_ms=0, buffer_size=5)
+    instrumentation.add_statement_observer(log)
+    yield log
+    instrumentation.remove_statement_observer(log)
+
+
+def test_records_slow_statements_without_values(session, slow_log, caplog):
+    secret = "Jane-Secret-Doe"
+    with caplog.at_level(logging.WARNING, logger=slow_query.__name__):
+        session.execute(select(Person).where(Person.name == secret)).all()
+        session.execute(text(f"SELECT '{secret}' AS leaked")).all()
+
+    records = slow_log.records()
+    assert len(records) == 2
+    assert records[0].parameters and all(v == "<str>" for v in records[0].parameters.values())
+    assert secret not in slow_log.dump()
+    assert secret not in caplog.text
+    assert "Slow query" in caplog.text
+
+
+def test_threshold_filters_and_buffer_is_bounded(session, slow_log):
+    slow_log.configure(threshold_ms=60_000)
+    session.execute(text("SELECT 1")).all()
+    assert slow_log.records() == []
+
+    slow_log.configure(threshold_ms=0)
+    for _ in range(8):
+        session.execute(text("SELECT 1")).all()
+    assert len(slow_log.records()) == 5
+
+    slow_log.configure(threshold_ms=None)
+    slow_log.clear()
+    session.execute(text("SELECT 1")).all()
+    assert not slow_log.enabled
+    assert slow_log.records() == []
+
+
+def test_records_store_call_name(session, slow_log):
+    person = Person(id=str(uuid4()), name="Ada")
+    session.add(person)
+    session.commit()
+    slow_log.clear()
+
+    with capture_store_stats():
+        PersonStore().get(person.id)
+
+    assert any(r.store_call == "PersonStore.get" for r in slow_log.records())
+
+
+def test_explain_captures_plan_for_selects_only(session, slow_log):
+    slow_log.configure(explain=True)
+    session.execute(select(Person).where(Person.name == "x")).all()
+    session.execute(
+        text("UPDATE person SET date_of_birth = :d WHERE id = :id"),
+        {"d": datetime(2000, 1, 1), "id": str(uuid4())},
+    )
+
+    select_record, update_record = slow_log.records()
+    assert select_record.explain_error is None
+    assert "Buffers" in select_record.plan or "actual time" in select_record.plan
+    # explaining must not feed back into the log
+    assert len(slow_log.records()) == 2
+    assert update_record.plan is None
+
+
+def test_explain_reuses_the_statement_connection(session, slow_log, monkeypatch):
+    slow_log.configure(explain=True)
+    engine_cls = type(session.connection().engine)
+
+    def no_checkout(*args, **kwargs):
+        raise AssertionError("EXPLAIN must not check out another connection")
+
+    monkeypatch.setattr(engine_cls, "connect", no_checkout)
+    session.execute(select(Person).where(Person.name == "x")).all()
+    session.execute(text("SELECT 1")).all()
+
+    first, second = slow_log.records()
+    assert first.explain_error is None and "actual time" in first.plan
+    assert second.plan is not None
+
+
+def test_failed_explain_leaves_transaction_usable(session, slow_log):
+    # Succeeds once, then divides by zero when EXPLAIN ANALYZE runs it again
+    # (sequences are not rolled back).
+    session.execute(text("CREATE TEMP SEQUENCE explain_once"))
+    slow_log.configure(explain=True)
+    session.execute(text(
+        "SELECT CASE WHEN nextval('explain_once') > 1 THEN 1 / (currval('explain_once') * 0) ELSE 0 END"
+    )).all()
+
+    assert "DivisionByZero" in slow_log.records()[-1].explain_error
+    assert session.execute(text("SELECT 42")).scalar() == 42
+
+
+def test_redact_statement_handles_escaped_quotes():
+    assert redact_statement("SELECT 'it''s', x FROM t") == "SELECT '<redacted>', x FROM t"
+
+
+@pytest.mark.parametrize(
+    "statement, expected",
+    [
+        ("SELECT * FROM person WHERE mrn = 8675309", "SELECT * FROM person WHERE mrn = <redacted>"),
+        ("SELECT 1.5e3, -42 FROM t1", "SELECT <redacted>, -<redacted> FROM t1"),
+        ("SELECT .5, x.y FROM t WHERE z > .25e1", "SELECT <redacted>, x.y FROM t WHERE z > <redacted>"),
+        ("SELECT E'Jos\\'e\\n' FROM t", "SELECT '<redacted>' FROM t"),
+        ("SELECT $$it's $1$$ FROM t", "SELECT $$<redacted>$$ FROM t"),
+        ("SELECT $pii$Jane\n$$Doe$pii$ FROM t", "SELECT $$<redacted>$$ FROM t"),
+        ("SELECT x FROM t WHERE id = $1 AND n = %(n_1)s", "SELECT x FROM t WHERE id = $1 AND n = %(n_1)s"),
+    ],
+)
+def test_redact_statement_masks_all_literal_forms(statement, expected):
+    assert redact_statement(statement) == expected
@@ -0,0 +1,80 @@
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from pii.database.diagnostics.instrumentation import (
+    capture_store_stats,
+    normalize_statement,
+    store_call,
+)
+from pii.database.models.party import Party, Person
+from pii.database.models.history import PersonName
+from pii.database.stores.person import PersonStore
+from pii.domain.enums import PersonNameType
+
+
+def _make_person(session, name="Ada"):
+    person = Person(id=str(uuid4()), name=name)
+    person._names_history.append(
+        PersonName(name=name, name_type=PersonNameType.FIRST, start_date=datetime(2000, 1, 1))
+    )
+    session.add(person)
+    session.commit()
+    return person
+
+
+def test_no_stats_outside_capture(session):
+    person = _make_person(session)
+    with store_call("PersonStore", "get") as stats:
+        assert stats is None
+    assert PersonStore().get(person.id).id == str(person.id)
+
+
+def test_capture_records_store_call(session):
+    person = _make_person(session)
+
+    with capture_store_stats() as capture:
+        dc = PersonStore().get(person.id)
+
+    assert dc.name == "Ada"
+    (call,) = capture.calls
+    assert (call.store, call.method) == ("PersonStore", "get")
+    assert call.statement_count >= 1
+    assert call.rows >= 1
+    assert call.latency > 0
+    assert call.conversion_time > 0
+    assert not capture.n_plus_one_calls
+
+
+def test_nested_calls_fold_into_outer_scope(session):
+    person = _make_person(session)
+    store = PersonStore()
+    with capture_store_stats() as capture:
+        store.filter(name="Ada")
+        store.to_dataclass(session.get(Person, person.id))
+
+    assert [c.method for c in capture.calls] == ["filter", "to_dataclass"]
+    # filter converts each result inside its own scope
+    assert capture.for_method("filter")[0].conversion_time > 0
+
+
+def test_n_plus_one_detection(session):
+    ids = [_make_person(session, name=f"P{i}").id for i in range(4)]
+
+    with capture_store_stats() as capture:
+        with store_call("PartyStore", "loop"):
+            for pk in ids:
+                session.execute(select(Party).where(Party.id == pk)).scalar_one()
+
+    (call,) = capture.calls
+    assert call.statement_count == 4
+    ((sql, count),) = call.n_plus_one.items()
+    assert count == 4
+    assert sql.startswith("SELECT")
+
+
+def test_normalize_statement_collapses_in_lists():
+    a = normalize_statement("SELECT * FROM party WHERE id IN (%(id_1)s, %(id_2)s)")
+    b = normalize_statement("SELECT *\n FROM party WHERE id IN (%(id_1)s)")
+    assert a == b
@@ -12,16 +12,21 @@ from pii.domain.base.history import (
 # Party & Inheritors
 # -----------------------------------------
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Party(BaseDataclass):
     """Abstract root for both Person and Organization entities."""
+    __track_changes__ = True
+
     id: Optional[UUIDStr] = None
     type: str = "party"
     name: str = ""
     notes: Optional[str] = None
+    # Optimistic-concurrency token: pass back the version you read; a write
+    # against a newer one raises VersionConflictError.
+    version: Optional[int] = None
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Person(Party):
     """Represents an individual person. Inherits from Party."""
     type: str = "person"
@@ -32,7 +37,7 @@ class Person(Party):
     _marital_status_history: RelationshipList[MaritalStatus] = field(default_factory=RelationshipList)
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Organization(Party):
     """Represents an organization or legal entity. Inherits from Party."""
     type: str = "organization"
@@ -48,15 +53,17 @@ class Organization(Party):
 # Roles
 # -----------------------------------------
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class PartyRole(BaseDataclass):
     """Base class for roles tied to a Party entity."""
+    __track_changes__ = True
+
     id: Optional[UUIDStr] = None
     type: str = ""
     party_id: Optional[UUIDStr] = None
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class PersonRole(PartyRole):
     """Role associated with a Person (e.g., Employee, Doctor)."""
     is_staff_role: bool = False
@@ -64,13 +71,13 @@ class PersonRole(PartyRole):
 
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class OrganizationRole(PartyRole):
     """Role associated with an Organization (e.g., Hospital, Vendor)."""
     person_roles: RelationshipList["PersonRole"] = field(default_factory=RelationshipList)
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class SystemRole(PartyRole):
     """Globally defined roles used for RBAC (e.g., Admin, System)."""
     pass
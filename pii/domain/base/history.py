@@ -5,20 +5,20 @@ from pii.common.abstracts.base_dataclass import BaseDataclass, RelationshipList
 from pii.common.utils.uuid_str import UUIDStr
 from pii.domain.enums import PersonNameType, GenderType, MaritalStatusType
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class PersonName(BaseDataclass):
     name: str
     name_type: PersonNameType
     person_id: UUIDStr
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class PersonGender(BaseDataclass):
     gender: GenderType
     person_id: UUIDStr
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class MaritalStatus(BaseDataclass):
     status: MaritalStatusType
     person_id: UUIDStr
\ No newline at end of file
@@ -1,10 +1,75 @@
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
 from pii.common.abstracts.base_store_nodb import BaseStore_NoDB
 from pii.domain.base.dataclasses import (
     Organization,
+    Person,
 )
 
 class OrganizationStore_NoDB(BaseStore_NoDB):
     """
     In-memory store for Organization entities.
     """
-    _dc_model = Organization
\ No newline at end of file
+    _dc_model = Organization
+
+    # ------------------------------------------------------------------
+    #  Hierarchy traversal (mirrors the recursive CTEs of OrganizationStore)
+    # ------------------------------------------------------------------
+    def _hierarchy_edges(self) -> Tuple[Dict[str, Set[str]], Dict[str, Set[str]]]:
+        """``(parents, children)`` adjacency built from both sides of every stored link."""
+        parents: Dict[str, Set[str]] = {}
+        children: Dict[str, Set[str]] = {}
+        for org in self.all():
+            for parent in org.parent_links:
+                parents.setdefault(org.id, set()).add(parent.id)
+                children.setdefault(parent.id, set()).add(org.id)
+            for child in org.children_links:
+                children.setdefault(org.id, set()).add(child.id)
+                parents.setdefault(child.id, set()).add(org.id)
+        return parents, children
+
+    def _walk(self, org_id: str, edges: Dict[str, Set[str]], max_depth: Optional[int]) -> Iterator[Tuple[str, int]]:
+        """Breadth-first ``(id, depth)`` from ``org_id``; each org once, at its shortest depth."""
+        seen = {org_id}
+        queue = deque([(org_id, 0)])
+        while queue:
+            current, depth = queue.popleft()
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for nxt in sorted(edges.get(current, ())):
+                if nxt not in seen:
+                    seen.add(nxt)
+                    yield nxt, depth + 1
+                    queue.append((nxt, depth + 1))
+
+    def _resolve(self, ids: List[str]) -> List[Organization]:
+        return [org for pk in ids if (org := self.get(pk)) is not None]
+
+    def _ordered(self, walk: Iterator[Tuple[str, int]]) -> List[Organization]:
+        """The walked orgs by ``(depth, name)``, the order the SQL store returns."""
+        depths = dict(walk)
+        return sorted(self._resolve(list(depths)), key=lambda org: (depths[org.id], org.name))
+
+    def ancestors(self, org_id: str, max_depth: Optional[int] = None) -> List[Organization]:
+        """All parent organizations, nearest first."""
+        parents, _ = self._hierarchy_edges()
+        return self._ordered(self._walk(org_id, parents, max_depth))
+
+    def descendants(self, org_id: str, max_depth: Optional[int] = None) -> List[Organization]:
+        """All child organizations down to ``max_depth`` levels, nearest first."""
+        _, children = self._hierarchy_edges()
+        return self._ordered(self._walk(org_id, children, max_depth))
+
+    def subtree_staff(self, org_id: str) -> List[Person]:
+        """Distinct staff of ``org_id`` and every organization below it, by name."""
+        staff: Dict[str, Person] = {}
+        for org in self._resolve([org_id]) + self.descendants(org_id):
+            for person in org.staff_members:
+                staff.setdefault(person.id, person)
+        return sorted(staff.values(), key=lambda person: person.name)
+
+    def is_ancestor(self, ancestor_id: str, org_id: str) -> bool:
+        """Whether ``ancestor_id`` is above ``org_id``."""
+        parents, _ = self._hierarchy_edges()
+        return any(pk == ancestor_id for pk, _ in self._walk(org_id, parents, None))
@@ -1,5 +1,7 @@
 from uuid import uuid4
 
+import pytest
+
 from pii.common.utils.uuid_str import UUIDStr
 from pii.domain.base.dataclasses import (
     Person,
@@ -54,3 +56,16 @@ def test_role_inheritance_and_defaults():
         # party_id should be assignable
         r.party_id = "some-uuid"
         assert r.party_id == "some-uuid"
+
+
+def test_domain_dataclasses_are_slotted():
+    """Instances carry no __dict__, yet id normalisation still applies."""
+    uid = uuid4()
+    person = Person(id=uid, name="Slotted", date_of_birth=None)
+    assert not hasattr(person, "__dict__")
+    assert person.id == str(uid)
+
+    person.id = str(uid).upper()
+    assert person.id == str(uid)
+    with pytest.raises(AttributeError):
+        person.not_a_field = 1
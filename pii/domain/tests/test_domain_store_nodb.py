@@ -1,4 +1,5 @@
 import pytest
+from pii.common.exceptions import VersionConflictError
 from pii.domain.base.dataclasses import (
     Person,
     Organization,
@@ -6,6 +7,8 @@ from pii.domain.base.dataclasses import (
     OrganizationRole,
     SystemRole,
 )
+from pii.domain.base.history import PersonName
+from pii.domain.enums import PersonNameType
 from pii.domain.base.stores.person import PersonStore_NoDB
 from pii.domain.base.stores.organization import OrganizationStore_NoDB
 from pii.domain.base.stores.roles import (
@@ -81,3 +84,73 @@ def test_dc_model_and_pk_field_properties():
     # Class-level access works too
     assert PersonStore_NoDB.dc_model is Person
     assert PersonStore_NoDB.pk_field == "id"
+
+def test_delete_where():
+    """delete_where removes every matching record and reports how many."""
+    store = PersonStore_NoDB()
+    doomed = [store.put(Person(name="DeleteWhereMe")) for _ in range(2)]
+    kept = store.put(Person(name="DeleteWhereKeep"))
+
+    assert store.delete_where(name="DeleteWhereMe") == 2
+    assert all(store.get(p.id) is None for p in doomed)
+    assert store.get(kept.id) is kept
+    assert store.delete_where(name="DeleteWhereMe") == 0
+    with pytest.raises(ValueError):
+        store.delete_where()
+
+
+def test_versioned_put_rejects_stale_copy():
+    """Party dataclasses carry a version; a put based on an old one conflicts."""
+    store = PersonStore_NoDB()
+    person = store.put(Person(name="Versioned"))
+    assert person.version == 1
+
+    stale = Person(id=person.id, name="Stale", version=1)
+    assert store.put(Person(id=person.id, name="Winner", version=1)).version == 2
+    with pytest.raises(VersionConflictError):
+        store.put(stale)
+    assert store.get(person.id).name == "Winner"
+
+
+def test_patch_keeps_nested_dataclasses():
+    """Patching copies related dataclasses across instead of flattening them."""
+    store = PersonStore_NoDB()
+    person = store.put(Person(name="Nested"))
+    person._names_history.append(
+        PersonName(name="Nested", name_type=PersonNameType.FIRST, person_id=person.id)
+    )
+
+    patched = store.patch({"id": person.id, "name": "Renamed"})
+    assert patched.name == "Renamed"
+    assert isinstance(patched._names_history[0], PersonName)
+
+
+def test_put_tracks_dirty_fields():
+    """Stored instances start clean; only real changes bump the version."""
+    store = PersonStore_NoDB()
+    person = store.put(Person(name="Tracked"))
+    assert person.dirty_fields() == frozenset()
+    assert store.put(person).version == 1
+
+    person.name = "Renamed"
+    assert person.dirty_fields() == {"name"}
+    saved = store.put(person)
+    assert (saved.name, saved.version) == ("Renamed", 2)
+    assert saved.dirty_fields() == frozenset()
+
+    assert Person(name="Loose").dirty_fields() is None
+    assert Person.from_trusted(name="Copy").dirty_fields() is None
+
+
+def test_in_place_edits_are_dirty():
+    """Appending to a list, or editing one of its elements, counts as a change."""
+    store = PersonStore_NoDB()
+    person = store.put(Person(name="Tracked"))
+    person._names_history.append(PersonName(name="Ada", name_type=PersonNameType.FIRST, person_id=person.id))
+    assert person.dirty_fields() == {"_names_history"}
+    assert store.put(person).version == 2
+
+    person._names_history[0].name = "Augusta"
+    assert person.dirty_fields() == {"_names_history"}
+    assert store.put(person).version == 3
+    assert store.put(person).version == 3
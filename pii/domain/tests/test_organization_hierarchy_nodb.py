@@ -0,0 +1,62 @@
+from uuid import uuid4
+
+from pii.common.abstracts.base_dataclass import RelationshipList
+from pii.domain.base.dataclasses import Organization, Person
+from pii.domain.base.stores.organization import OrganizationStore_NoDB
+
+
+def _network():
+    """
+    root ─┬─ east ── clinic_e
+          └─ west ─┬─ clinic_w
+                   └─ clinic_e   (clinic_e has two parents)
+    """
+    store = OrganizationStore_NoDB()
+    orgs = {name: store.put(Organization(name=name)) for name in ("root", "east", "west", "clinic_e", "clinic_w")}
+    ann, bob, cy = (Person(id=str(uuid4()), name=name) for name in ("ann", "bob", "cy"))
+
+    # links may be recorded on either side
+    orgs["east"].parent_links = RelationshipList([orgs["root"]])
+    orgs["root"].children_links = RelationshipList([orgs["west"]])
+    orgs["clinic_e"].parent_links = RelationshipList([orgs["east"], orgs["west"]])
+    orgs["west"].children_links = RelationshipList([orgs["clinic_w"]])
+
+    orgs["root"].staff_members = RelationshipList([ann])
+    orgs["clinic_e"].staff_members = RelationshipList([bob])
+    orgs["clinic_w"].staff_members = RelationshipList([bob])
+    orgs["west"].staff_members = RelationshipList([cy])
+    return store, {name: org.id for name, org in orgs.items()}
+
+
+def _names(dcs):
+    return sorted(dc.name for dc in dcs)
+
+
+def test_ancestors_and_descendants():
+    store, ids = _network()
+    ancestors = store.ancestors(ids["clinic_e"])
+    assert _names(ancestors[:2]) == ["east", "west"] and ancestors[2].name == "root"
+    assert _names(store.ancestors(ids["clinic_e"], max_depth=1)) == ["east", "west"]
+    assert _names(store.descendants(ids["root"])) == ["clinic_e", "clinic_w", "east", "west"]
+    assert _names(store.descendants(ids["root"], max_depth=1)) == ["east", "west"]
+    assert store.ancestors(ids["root"]) == []
+
+
+def test_is_ancestor():
+    store, ids = _network()
+    assert store.is_ancestor(ids["root"], ids["clinic_e"])
+    assert not store.is_ancestor(ids["clinic_e"], ids["root"])
+    assert not store.is_ancestor(ids["east"], ids["clinic_w"])
+
+
+def test_subtree_staff_is_distinct():
+    store, ids = _network()
+    assert _names(store.subtree_staff(ids["west"])) == ["bob", "cy"]
+    assert _names(store.subtree_staff(ids["root"])) == ["ann", "bob", "cy"]
+
+
+def test_cycles_terminate():
+    store, ids = _network()
+    store.get(ids["root"]).parent_links = RelationshipList([store.get(ids["clinic_w"])])
+    assert _names(store.descendants(ids["west"])) == ["clinic_e", "clinic_w", "east", "root"]
+    assert ids["west"] not in {o.id for o in store.descendants(ids["west"])}
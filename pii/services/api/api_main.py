@@ -1,8 +1,7 @@
-import json
-
 from flask import Flask, jsonify, request
 from services.kafka.kafka_main import get_producer
 from services.config import config
+from common.utils import json_codec
 # Flask App for REST API
 app = Flask(__name__)
 
@@ -15,5 +14,5 @@ def health_check():
 def publish_event():
     data = request.json
     producer = get_producer(config)
-    producer.send(config.kafka_topic, json.dumps(data).encode("utf-8"))
+    producer.send(config.kafka_topic, json_codec.dumpb(data))
     return jsonify({"status": "Message Published"})
\ No newline at end of file